@@ -5,33 +5,246 @@ A central application that provides access to all Mukh face processing applicati
 with descriptions and direct links to launch each app.
 """
 
-import webbrowser
+import functools
+import json
+import re
+from typing import Tuple
 
-import gradio as gr
-from config_loader import design_config
+_TAG_GAP_RE = re.compile(r">\s+<")
+_INDENT_RE = re.compile(r"\n\s*")
 
 
-def launch_app(app_name: str, port: int) -> str:
-    """Launch a specific app and return launch message.
+def _minify(markup: str) -> str:
+    """Strip indentation and inter-tag whitespace from static HTML/CSS markup.
+
+    Args:
+        markup: HTML or CSS string
+
+    Returns:
+        Markup with line breaks, indentation and whitespace between tags removed
+    """
+    return _INDENT_RE.sub("", _TAG_GAP_RE.sub("><", markup)).strip()
+
+
+_HEADER_HTML = _minify("""
+<div style="text-align: center;">
+    <h1>🎭 Mukh - Fast and Comprehensive Face Analysis Suite</h1>
+    <p>Advanced AI-powered face detection, reenactment, and deepfake detection applications</p>
+    <div style="display: flex; justify-content: center; gap: 30px; margin-top: 25px; flex-wrap: wrap;">
+        <div style="background: rgba(255,255,255,0.1); padding: 15px 20px; border-radius: 10px; backdrop-filter: blur(10px);">
+            <div style="font-size: 1.5em; margin-bottom: 5px;">👤</div>
+            <strong>Face Detection</strong><br/>
+            <span style="opacity: 0.9;">Multi-model detection</span>
+        </div>
+        <div style="background: rgba(255,255,255,0.1); padding: 15px 20px; border-radius: 10px; backdrop-filter: blur(10px);">
+            <div style="font-size: 1.5em; margin-bottom: 5px;">🎬</div>
+            <strong>Face Reenactment</strong><br/>
+            <span style="opacity: 0.9;">TPS motion transfer</span>
+        </div>
+        <div style="background: rgba(255,255,255,0.1); padding: 15px 20px; border-radius: 10px; backdrop-filter: blur(10px);">
+            <div style="font-size: 1.5em; margin-bottom: 5px;">🕵️</div>
+            <strong>Deepfake Detection</strong><br/>
+            <span style="opacity: 0.9;">Ensemble AI models</span>
+        </div>
+    </div>
+</div>
+""")
+
+_APPS_TITLE_HTML = '<h2 style="text-align: center; color: #f8fafc; font-size: 2rem; font-weight: 700; margin: 40px 0 30px 0; text-shadow: 2px 2px 8px rgba(0,0,0,0.4);">🚀 Available Applications</h2>'
+
+_CARD_TEMPLATE = """
+<div style="display: flex; align-items: center; margin-bottom: 15px;">
+    <span style="font-size: 2em; margin-right: 10px;">{icon}</span>
+    <h3 style="color: #f8fafc; font-size: 1.5rem; font-weight: 600; margin: 0;">{name}</h3>
+</div>
+<div class="app-description">
+    <p><strong>{headline}</strong></p>
+    <p>{summary}</p>
+</div>
+<div style="background: rgba({rgb}, 0.1); border: 1px solid {accent}; border-radius: 8px; padding: 15px; margin: 15px 0;">
+    <div style="color: {accent}; font-weight: 600; margin-bottom: 8px;">✨ Key Features:</div>
+    <div style="color: {light}; font-size: 0.9rem; line-height: 1.5;">
+        {features}
+    </div>
+</div>
+"""
+
+# (name, icon, port, headline, summary, rgb, accent, light, features)
+_APP_SPECS = (
+    (
+        "Face Detection",
+        "👤",
+        7860,
+        "Detect and analyze faces in images using state-of-the-art AI models.",
+        "Upload any image and get precise face locations with confidence scores and detailed analysis.",
+        "16, 185, 129",
+        "#10b981",
+        "#a7f3d0",
+        (
+            "Multiple detection models (BlazeFace, MediaPipe, UltraLight)",
+            "Bounding box coordinates and confidence scores",
+            "JSON export of detection results",
+            "Annotated image output with face highlights",
+        ),
+    ),
+    (
+        "Face Reenactment",
+        "🎬",
+        7861,
+        "Animate faces in images using motion from driving videos.",
+        "Create realistic face animations by transferring expressions and movements with advanced TPS models.",
+        "59, 130, 246",
+        "#3b82f6",
+        "#93c5fd",
+        (
+            "TPS (Thin Plate Spline) motion transfer",
+            "Source image + driving video input",
+            "High-quality video output",
+            "Side-by-side comparison videos",
+        ),
+    ),
+    (
+        "Deepfake Detection",
+        "🕵️",
+        7862,
+        "Detect artificially generated or manipulated faces in images and videos.",
+        "Uses multiple AI models in an ensemble pipeline for improved accuracy and reliable detection.",
+        "139, 92, 246",
+        "#8b5cf6",
+        "#c4b5fd",
+        (
+            "Multi-model ensemble detection",
+            "Support for images and videos",
+            "ResNet Inception and EfficientNet models",
+            "Confidence scoring and detailed analysis",
+        ),
+    ),
+)
+
+_GETTING_STARTED_TITLE_HTML = '<h3 style="color: #667eea; font-weight: bold; border-bottom: 2px solid #667eea; padding-bottom: 5px; margin-bottom: 20px;">💡 Getting Started</h3>'
+
+_GETTING_STARTED_HTML = _minify("""
+<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin-top: 20px;">
+    <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px;">
+        <div style="font-size: 1.2em; margin-bottom: 10px;">🎯 Step 1</div>
+        <strong style="color: #e2e8f0;">Choose Your Application</strong>
+        <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Click any launch button above to open the desired application in a new browser tab.</p>
+    </div>
+
+    <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px;">
+        <div style="font-size: 1.2em; margin-bottom: 10px;">📤 Step 2</div>
+        <strong style="color: #e2e8f0;">Upload Your Media</strong>
+        <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Each app accepts different file types. Upload your images or videos and configure the settings.</p>
+    </div>
+
+    <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px;">
+        <div style="font-size: 1.2em; margin-bottom: 10px;">💾 Step 3</div>
+        <strong style="color: #e2e8f0;">Download Results</strong>
+        <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">All results are automatically saved to the output/ directory and available for download.</p>
+    </div>
+</div>
+""")
+
+_PORTS_TITLE_HTML = '<h3 style="color: #667eea; font-weight: bold; border-bottom: 2px solid #667eea; padding-bottom: 5px; margin-bottom: 20px;">📋 Application Ports & Manual Launch</h3>'
+
+_PORTS_HTML = _minify("""
+<div style="background: rgba(16, 185, 129, 0.1); border: 1px solid #10b981; border-radius: 10px; padding: 20px; margin-bottom: 20px;">
+    <div style="color: #10b981; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">🌐 Application URLs</div>
+    <div style="display: grid; gap: 10px;">
+        <div style="display: flex; justify-content: space-between; align-items: center; padding: 8px 0; border-bottom: 1px solid rgba(16, 185, 129, 0.2);">
+            <span style="color: #e2e8f0; font-weight: 500;">Central Hub:</span>
+            <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 4px; color: #a7f3d0;">localhost:7859</code>
+        </div>
+        <div style="display: flex; justify-content: space-between; align-items: center; padding: 8px 0; border-bottom: 1px solid rgba(16, 185, 129, 0.2);">
+            <span style="color: #e2e8f0; font-weight: 500;">Face Detection:</span>
+            <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 4px; color: #a7f3d0;">localhost:7860</code>
+        </div>
+        <div style="display: flex; justify-content: space-between; align-items: center; padding: 8px 0; border-bottom: 1px solid rgba(16, 185, 129, 0.2);">
+            <span style="color: #e2e8f0; font-weight: 500;">Face Reenactment:</span>
+            <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 4px; color: #a7f3d0;">localhost:7861</code>
+        </div>
+        <div style="display: flex; justify-content: space-between; align-items: center; padding: 8px 0;">
+            <span style="color: #e2e8f0; font-weight: 500;">Deepfake Detection:</span>
+            <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 4px; color: #a7f3d0;">localhost:7862</code>
+        </div>
+    </div>
+</div>
+
+<div style="background: rgba(245, 158, 11, 0.1); border: 1px solid #f59e0b; border-radius: 10px; padding: 20px;">
+    <div style="color: #f59e0b; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">🔧 Manual Launch Commands</div>
+    <div style="color: #fcd34d; font-family: 'Monaco', 'Menlo', monospace; font-size: 0.9rem; line-height: 1.6;">
+        <div style="margin-bottom: 8px;"><strong>cd app</strong></div>
+        <div style="margin-bottom: 8px;"><strong>python face_detection_app.py</strong> &nbsp;&nbsp;# Port 7860</div>
+        <div style="margin-bottom: 8px;"><strong>python reenactment_app.py</strong> &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;# Port 7861</div>
+        <div><strong>python deepfake_detection_app.py</strong> # Port 7862</div>
+    </div>
+</div>
+""")
+
+
+def _launch_messages(app_name: str, port: int) -> Tuple[str, str]:
+    """Build the URL and success message for an app.
 
     Args:
         app_name: Name of the app to launch
         port: Port number for the app
 
     Returns:
-        Launch confirmation message
+        Tuple of (url, launch confirmation message)
     """
-    try:
-        # Open the app in browser
-        url = f"http://localhost:{port}"
-        webbrowser.open(url)
-        return f"✅ {app_name} launched! Opening {url} in your browser..."
-    except Exception as e:
-        return f"❌ Error launching {app_name}: {str(e)}\n\nPlease manually run: python {app_name.lower().replace(' ', '_')}_app.py"
+    url = f"http://localhost:{port}"
+    return url, f"✅ {app_name} launched! Opening {url} in your browser..."
 
 
-def create_interface():
-    """Create the central hub interface."""
+def _launch_js(app_name: str, port: int) -> str:
+    """Build the client-side click handler that opens an app in a new tab.
+
+    Args:
+        app_name: Name of the app to launch
+        port: Port number for the app
+
+    Returns:
+        JavaScript function source returning the launch confirmation message
+    """
+    url, message = _launch_messages(app_name, port)
+    return f"() => {{ window.open({json.dumps(url)}, '_blank'); return {json.dumps(message)}; }}"
+
+
+# (name, card_html, launch_js) for each app card, rendered once at import
+_APP_CARDS = tuple(
+    (
+        name,
+        _minify(
+            _CARD_TEMPLATE.format(
+                icon=icon,
+                name=name,
+                headline=headline,
+                summary=summary,
+                rgb=rgb,
+                accent=accent,
+                light=light,
+                features="<br/>".join(f"• {feature}" for feature in features),
+            )
+        ),
+        _launch_js(name, port),
+    )
+    for name, icon, port, headline, summary, rgb, accent, light, features in _APP_SPECS
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_theme():
+    """Build the Gradio theme and CSS from the design config.
+
+    The result only depends on the loaded config, so it is computed once and
+    reused. Call ``_build_theme.cache_clear()`` after editing the config during
+    development to pick up the changes.
+
+    Returns:
+        Tuple of (theme, css)
+    """
+    import gradio as gr
+    from config_loader import design_config
 
     # Get theme configuration from design config
     theme_config = design_config.get_theme_config()
@@ -49,40 +262,31 @@ def create_interface():
         border_color_primary_dark=theme_colors["border_color_primary_dark"],
     )
 
+    return theme, _minify(design_config.get_css_styles())
+
+
+@functools.lru_cache(maxsize=1)
+def create_interface():
+    """Create the central hub interface.
+
+    The interface is built once per process and reused on later calls. Call
+    ``create_interface.cache_clear()`` to force a rebuild.
+    """
+    # Gradio is imported lazily so that importing this module stays cheap
+    import gradio as gr
+
+    theme, css = _build_theme()
+
     with gr.Blocks(
         title="Mukh Apps - Central Hub",
         theme=theme,
-        css=design_config.get_css_styles(),
+        css=css,
     ) as interface:
 
         # Modern Header Section
         with gr.Row():
             with gr.Column(elem_classes=["header-section"]):
-                gr.HTML(
-                    """
-                    <div style="text-align: center;">
-                        <h1>🎭 Mukh - Fast and Comprehensive Face Analysis Suite</h1>
-                        <p>Advanced AI-powered face detection, reenactment, and deepfake detection applications</p>
-                        <div style="display: flex; justify-content: center; gap: 30px; margin-top: 25px; flex-wrap: wrap;">
-                            <div style="background: rgba(255,255,255,0.1); padding: 15px 20px; border-radius: 10px; backdrop-filter: blur(10px);">
-                                <div style="font-size: 1.5em; margin-bottom: 5px;">👤</div>
-                                <strong>Face Detection</strong><br/>
-                                <span style="opacity: 0.9;">Multi-model detection</span>
-                            </div>
-                            <div style="background: rgba(255,255,255,0.1); padding: 15px 20px; border-radius: 10px; backdrop-filter: blur(10px);">
-                                <div style="font-size: 1.5em; margin-bottom: 5px;">🎬</div>
-                                <strong>Face Reenactment</strong><br/>
-                                <span style="opacity: 0.9;">TPS motion transfer</span>
-                            </div>
-                            <div style="background: rgba(255,255,255,0.1); padding: 15px 20px; border-radius: 10px; backdrop-filter: blur(10px);">
-                                <div style="font-size: 1.5em; margin-bottom: 5px;">🕵️</div>
-                                <strong>Deepfake Detection</strong><br/>
-                                <span style="opacity: 0.9;">Ensemble AI models</span>
-                            </div>
-                        </div>
-                    </div>
-                    """,
-                )
+                gr.HTML(_HEADER_HTML)
 
         # Status display for launch messages
         status_display = gr.Textbox(
@@ -93,217 +297,66 @@ def create_interface():
         )
 
         # Application Cards Section
-        gr.HTML(
-            '<h2 style="text-align: center; color: #f8fafc; font-size: 2rem; font-weight: 700; margin: 40px 0 30px 0; text-shadow: 2px 2px 8px rgba(0,0,0,0.4);">🚀 Available Applications</h2>'
-        )
+        gr.HTML(_APPS_TITLE_HTML)
 
         with gr.Row(equal_height=True):
-            # Face Detection App Card
-            with gr.Column(scale=1):
-                with gr.Group(elem_classes="app-card"):
-                    gr.HTML(
-                        '<div style="display: flex; align-items: center; margin-bottom: 15px;"><span style="font-size: 2em; margin-right: 10px;">👤</span><h3 style="color: #f8fafc; font-size: 1.5rem; font-weight: 600; margin: 0;">Face Detection</h3></div>'
-                    )
-
-                    gr.Markdown(
-                        """
-                        **Detect and analyze faces in images using state-of-the-art AI models.**
-                        
-                        Upload any image and get precise face locations with confidence scores and detailed analysis.
-                        """,
-                        elem_classes="app-description",
-                    )
-
-                    gr.HTML(
-                        """
-                        <div style="background: rgba(16, 185, 129, 0.1); border: 1px solid #10b981; border-radius: 8px; padding: 15px; margin: 15px 0;">
-                            <div style="color: #10b981; font-weight: 600; margin-bottom: 8px;">✨ Key Features:</div>
-                            <div style="color: #a7f3d0; font-size: 0.9rem; line-height: 1.5;">
-                                • Multiple detection models (BlazeFace, MediaPipe, UltraLight)<br/>
-                                • Bounding box coordinates and confidence scores<br/>
-                                • JSON export of detection results<br/>
-                                • Annotated image output with face highlights
-                            </div>
-                        </div>
-                        """
-                    )
-
-                    face_detection_btn = gr.Button(
-                        "🚀 Launch Face Detection",
-                        variant="primary",
-                        size="lg",
-                        elem_classes="primary-button",
-                    )
-
-            # Face Reenactment App Card
-            with gr.Column(scale=1):
-                with gr.Group(elem_classes="app-card"):
-                    gr.HTML(
-                        '<div style="display: flex; align-items: center; margin-bottom: 15px;"><span style="font-size: 2em; margin-right: 10px;">🎬</span><h3 style="color: #f8fafc; font-size: 1.5rem; font-weight: 600; margin: 0;">Face Reenactment</h3></div>'
-                    )
-
-                    gr.Markdown(
-                        """
-                        **Animate faces in images using motion from driving videos.**
-                        
-                        Create realistic face animations by transferring expressions and movements with advanced TPS models.
-                        """,
-                        elem_classes="app-description",
-                    )
-
-                    gr.HTML(
-                        """
-                        <div style="background: rgba(59, 130, 246, 0.1); border: 1px solid #3b82f6; border-radius: 8px; padding: 15px; margin: 15px 0;">
-                            <div style="color: #3b82f6; font-weight: 600; margin-bottom: 8px;">✨ Key Features:</div>
-                            <div style="color: #93c5fd; font-size: 0.9rem; line-height: 1.5;">
-                                • TPS (Thin Plate Spline) motion transfer<br/>
-                                • Source image + driving video input<br/>
-                                • High-quality video output<br/>
-                                • Side-by-side comparison videos
-                            </div>
-                        </div>
-                        """
-                    )
-
-                    reenactment_btn = gr.Button(
-                        "🚀 Launch Face Reenactment",
-                        variant="primary",
-                        size="lg",
-                        elem_classes="primary-button",
-                    )
-
-            # Deepfake Detection App Card
-            with gr.Column(scale=1):
-                with gr.Group(elem_classes="app-card"):
-                    gr.HTML(
-                        '<div style="display: flex; align-items: center; margin-bottom: 15px;"><span style="font-size: 2em; margin-right: 10px;">🕵️</span><h3 style="color: #f8fafc; font-size: 1.5rem; font-weight: 600; margin: 0;">Deepfake Detection</h3></div>'
-                    )
-
-                    gr.Markdown(
-                        """
-                        **Detect artificially generated or manipulated faces in images and videos.**
-                        
-                        Uses multiple AI models in an ensemble pipeline for improved accuracy and reliable detection.
-                        """,
-                        elem_classes="app-description",
-                    )
-
-                    gr.HTML(
-                        """
-                        <div style="background: rgba(139, 92, 246, 0.1); border: 1px solid #8b5cf6; border-radius: 8px; padding: 15px; margin: 15px 0;">
-                            <div style="color: #8b5cf6; font-weight: 600; margin-bottom: 8px;">✨ Key Features:</div>
-                            <div style="color: #c4b5fd; font-size: 0.9rem; line-height: 1.5;">
-                                • Multi-model ensemble detection<br/>
-                                • Support for images and videos<br/>
-                                • ResNet Inception and EfficientNet models<br/>
-                                • Confidence scoring and detailed analysis
-                            </div>
-                        </div>
-                        """
-                    )
-
-                    deepfake_btn = gr.Button(
-                        "🚀 Launch Deepfake Detection",
-                        variant="primary",
-                        size="lg",
-                        elem_classes="primary-button",
-                    )
+            for name, card_html, launch_js in _APP_CARDS:
+                with gr.Column(scale=1):
+                    with gr.Group(elem_classes="app-card"):
+                        gr.HTML(card_html)
+
+                        launch_btn = gr.Button(
+                            f"🚀 Launch {name}",
+                            variant="primary",
+                            size="lg",
+                            elem_classes="primary-button",
+                        )
+
+                # Open the app directly in the browser, no server round trip
+                launch_btn.click(fn=None, outputs=status_display, js=launch_js)
 
         # Information Section
         with gr.Row():
             with gr.Column(elem_classes="search-section"):
-                gr.HTML(
-                    '<h3 style="color: #667eea; font-weight: bold; border-bottom: 2px solid #667eea; padding-bottom: 5px; margin-bottom: 20px;">💡 Getting Started</h3>'
-                )
-
-                gr.HTML(
-                    """
-                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin-top: 20px;">
-                        <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px;">
-                            <div style="font-size: 1.2em; margin-bottom: 10px;">🎯 Step 1</div>
-                            <strong style="color: #e2e8f0;">Choose Your Application</strong>
-                            <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Click any launch button above to open the desired application in a new browser tab.</p>
-                        </div>
-                        
-                        <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px;">
-                            <div style="font-size: 1.2em; margin-bottom: 10px;">📤 Step 2</div>
-                            <strong style="color: #e2e8f0;">Upload Your Media</strong>
-                            <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Each app accepts different file types. Upload your images or videos and configure the settings.</p>
-                        </div>
-                        
-                        <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px;">
-                            <div style="font-size: 1.2em; margin-bottom: 10px;">💾 Step 3</div>
-                            <strong style="color: #e2e8f0;">Download Results</strong>
-                            <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">All results are automatically saved to the output/ directory and available for download.</p>
-                        </div>
-                    </div>
-                    """
-                )
+                gr.HTML(_GETTING_STARTED_TITLE_HTML)
+
+                gr.HTML(_GETTING_STARTED_HTML)
 
         # Technical Information Section
         with gr.Row():
             with gr.Column(scale=1, elem_classes="results-section"):
-                gr.HTML(
-                    '<h3 style="color: #667eea; font-weight: bold; border-bottom: 2px solid #667eea; padding-bottom: 5px; margin-bottom: 20px;">📋 Application Ports & Manual Launch</h3>'
-                )
-
-                gr.HTML(
-                    """
-                    <div style="background: rgba(16, 185, 129, 0.1); border: 1px solid #10b981; border-radius: 10px; padding: 20px; margin-bottom: 20px;">
-                        <div style="color: #10b981; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">🌐 Application URLs</div>
-                        <div style="display: grid; gap: 10px;">
-                            <div style="display: flex; justify-content: space-between; align-items: center; padding: 8px 0; border-bottom: 1px solid rgba(16, 185, 129, 0.2);">
-                                <span style="color: #e2e8f0; font-weight: 500;">Central Hub:</span>
-                                <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 4px; color: #a7f3d0;">localhost:7859</code>
-                            </div>
-                            <div style="display: flex; justify-content: space-between; align-items: center; padding: 8px 0; border-bottom: 1px solid rgba(16, 185, 129, 0.2);">
-                                <span style="color: #e2e8f0; font-weight: 500;">Face Detection:</span>
-                                <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 4px; color: #a7f3d0;">localhost:7860</code>
-                            </div>
-                            <div style="display: flex; justify-content: space-between; align-items: center; padding: 8px 0; border-bottom: 1px solid rgba(16, 185, 129, 0.2);">
-                                <span style="color: #e2e8f0; font-weight: 500;">Face Reenactment:</span>
-                                <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 4px; color: #a7f3d0;">localhost:7861</code>
-                            </div>
-                            <div style="display: flex; justify-content: space-between; align-items: center; padding: 8px 0;">
-                                <span style="color: #e2e8f0; font-weight: 500;">Deepfake Detection:</span>
-                                <code style="background: rgba(0,0,0,0.3); padding: 4px 8px; border-radius: 4px; color: #a7f3d0;">localhost:7862</code>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <div style="background: rgba(245, 158, 11, 0.1); border: 1px solid #f59e0b; border-radius: 10px; padding: 20px;">
-                        <div style="color: #f59e0b; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">🔧 Manual Launch Commands</div>
-                        <div style="color: #fcd34d; font-family: 'Monaco', 'Menlo', monospace; font-size: 0.9rem; line-height: 1.6;">
-                            <div style="margin-bottom: 8px;"><strong>cd app</strong></div>
-                            <div style="margin-bottom: 8px;"><strong>python face_detection_app.py</strong> &nbsp;&nbsp;# Port 7860</div>
-                            <div style="margin-bottom: 8px;"><strong>python reenactment_app.py</strong> &nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;# Port 7861</div>
-                            <div><strong>python deepfake_detection_app.py</strong> # Port 7862</div>
-                        </div>
-                    </div>
-                    """
-                )
-
-        # Button click handlers
-        face_detection_btn.click(
-            fn=lambda: launch_app("Face Detection", 7860), outputs=status_display
-        )
-
-        reenactment_btn.click(
-            fn=lambda: launch_app("Face Reenactment", 7861), outputs=status_display
-        )
+                gr.HTML(_PORTS_TITLE_HTML)
 
-        deepfake_btn.click(
-            fn=lambda: launch_app("Deepfake Detection", 7862), outputs=status_display
-        )
+                gr.HTML(_PORTS_HTML)
 
     return interface
 
 
+async def _cache_static_assets(request, call_next):
+    """Mark Gradio's fingerprinted frontend assets as cacheable for a year."""
+    response = await call_next(request)
+    if request.url.path.startswith("/assets/"):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
 if __name__ == "__main__":
+    from starlette.middleware import Middleware
+    from starlette.middleware.base import BaseHTTPMiddleware
+    from starlette.middleware.gzip import GZipMiddleware
+
     interface = create_interface()
+    # Launch buttons run client-side, so a small worker pool is enough
+    interface.queue(default_concurrency_limit=3, max_size=32, api_open=False)
     interface.launch(
         server_name="0.0.0.0",
         server_port=7859,  # Central hub on port 7859
         share=False,
         show_api=False,
+        app_kwargs={
+            "middleware": [
+                Middleware(BaseHTTPMiddleware, dispatch=_cache_static_assets),
+                Middleware(GZipMiddleware, minimum_size=1024),
+            ]
+        },
     )
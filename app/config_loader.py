@@ -5,11 +5,427 @@ Loads design configuration from YAML and provides methods to generate
 CSS styles, theme configurations, and other design-related properties.
 """
 
+import itertools
+import logging
+import string
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+logger = logging.getLogger(__name__)
+
+# Stylesheet template; ``{dotted.path}`` placeholders are filled from the config
+_CSS_TEMPLATE = """
+/* Import Google Fonts */
+@import url('{typography.google_fonts_url}');
+
+/* Global Container Styles */
+.gradio-container {{
+    max-width: {styling.container.max_width} !important;
+    width: 100% !important;
+    margin: 0 !important;
+    padding: {styling.container.padding} !important;
+    background: {styling.container.background} !important;
+    font-family: '{typography.font_family}', sans-serif !important;
+}}
+
+.main {{
+    max-width: 100% !important;
+    width: 100% !important;
+}}
+
+/* Header Section Styling */
+.header-section {{
+    background: {styling.header.background} !important;
+    color: white !important;
+    padding: {styling.header.padding} !important;
+    border-radius: {styling.header.border_radius} !important;
+    margin-bottom: {styling.header.margin_bottom} !important;
+    text-align: {styling.header.text_align} !important;
+    box-shadow: {styling.header.box_shadow} !important;
+    transition: all {styling.animation.duration_normal} {styling.animation.easing} !important;
+}}
+
+.header-section h1 {{
+    font-size: {typography.header_lg} !important;
+    font-weight: 700 !important;
+    margin-bottom: 15px !important;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3) !important;
+    line-height: {typography.line_heights.tight} !important;
+}}
+
+.header-section p {{
+    font-size: {typography.body_lg} !important;
+    margin-bottom: 10px !important;
+    opacity: 0.95 !important;
+    line-height: {typography.line_heights.relaxed} !important;
+}}
+
+/* Main Header Styling */
+.main-header {{
+    text-align: center !important;
+    color: #f8fafc !important;
+    font-size: {typography.header_xl} !important;
+    font-weight: 800 !important;
+    margin-bottom: 2rem !important;
+    text-shadow: 2px 2px 8px rgba(0,0,0,0.4) !important;
+}}
+
+/* Card Styling */
+.app-card {{
+    background: {styling.card.background} !important;
+    border-radius: {styling.card.border_radius} !important;
+    padding: {styling.card.padding} !important;
+    margin: {styling.card.margin} !important;
+    border: {styling.card.border} !important;
+    box-shadow: {styling.card.box_shadow} !important;
+    transition: {styling.card.transition} !important;
+}}
+
+.app-card:hover {{
+    transform: {styling.card_hover.transform} !important;
+    box-shadow: {styling.card_hover.box_shadow} !important;
+    border-color: {styling.card_hover.border_color} !important;
+}}
+
+/* Section Styling */
+.search-section,
+.results-section,
+.gallery-section {{
+    background: {styling.section.background} !important;
+    padding: {styling.section.padding} !important;
+    border-radius: {styling.section.border_radius} !important;
+    margin-bottom: {styling.section.margin_bottom} !important;
+    border: {styling.section.border} !important;
+    box-shadow: {styling.section.box_shadow} !important;
+    height: fit-content !important;
+}}
+
+/* Typography Styles */
+.app-title {{
+    font-size: {typography.header_sm} !important;
+    font-weight: 600 !important;
+    color: #f8fafc !important;
+    margin-bottom: 12px !important;
+    line-height: {typography.line_heights.tight} !important;
+}}
+
+.app-description {{
+    color: #cbd5e1 !important;
+    margin-bottom: 16px !important;
+    line-height: {typography.line_heights.relaxed} !important;
+    font-size: {typography.body_md} !important;
+}}
+
+.app-features {{
+    color: #94a3b8 !important;
+    font-size: {typography.body_sm} !important;
+    margin-bottom: 20px !important;
+    line-height: {typography.line_heights.normal} !important;
+}}
+
+.section-header {{
+    color: {theme.colors.accent_color} !important;
+    font-weight: bold !important;
+    border-bottom: 2px solid {theme.colors.accent_color} !important;
+    padding-bottom: 5px !important;
+    margin-bottom: 15px !important;
+    font-size: {typography.header_sm} !important;
+}}
+
+/* Button Styling */
+.primary-button,
+button[variant="primary"] {{
+    background: {styling.button.primary_gradient} !important;
+    border: none !important;
+    border-radius: {styling.button.border_radius} !important;
+    padding: {styling.button.padding} !important;
+    font-weight: {styling.button.font_weight} !important;
+    font-size: {typography.body_md} !important;
+    color: white !important;
+    box-shadow: {styling.button.box_shadow} !important;
+    transition: {styling.button.transition} !important;
+    cursor: pointer !important;
+}}
+
+.primary-button:hover,
+button[variant="primary"]:hover {{
+    transform: {styling.button_hover.transform} !important;
+    box-shadow: {styling.button_hover.box_shadow} !important;
+}}
+
+/* Input and Textarea Styling */
+.gradio-textbox textarea,
+.gradio-textbox input {{
+    background: {styling.input.background} !important;
+    border: {styling.input.border} !important;
+    border-radius: {styling.input.border_radius} !important;
+    color: {styling.input.color} !important;
+    font-family: '{typography.font_family}', sans-serif !important;
+    line-height: {typography.line_heights.normal} !important;
+}}
+
+.gradio-textbox textarea:focus,
+.gradio-textbox input:focus {{
+    border-color: {styling.input_focus.border_color} !important;
+    background: {styling.input_focus.background} !important;
+    box-shadow: {styling.input_focus.box_shadow} !important;
+    outline: none !important;
+}}
+
+/* Gallery Styling */
+.gallery-container {{
+    margin-top: 15px !important;
+    width: 100% !important;
+    background: {styling.gallery.background} !important;
+    border-radius: {styling.gallery.border_radius} !important;
+    padding: {styling.gallery.padding} !important;
+    border: {styling.gallery.border} !important;
+}}
+
+.gallery img {{
+    border-radius: 8px !important;
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3) !important;
+    transition: all {styling.animation.duration_normal} {styling.animation.easing} !important;
+}}
+
+.gallery img:hover {{
+    transform: scale(1.02) !important;
+    box-shadow: 0 8px 25px rgba(102, 126, 234, 0.3) !important;
+}}
+
+/* Status Message Styling */
+.status-message {{
+    margin-top: 20px !important;
+    padding: 12px !important;
+    border-radius: 8px !important;
+    font-weight: 500 !important;
+    font-family: '{typography.font_family}', sans-serif !important;
+}}
+
+.status-success {{
+    background: {styling.status.success_bg} !important;
+    border: 1px solid {styling.status.success_border} !important;
+    color: #a7f3d0 !important;
+}}
+
+.status-warning {{
+    background: {styling.status.warning_bg} !important;
+    border: 1px solid {styling.status.warning_border} !important;
+    color: #fcd34d !important;
+}}
+
+.status-error {{
+    background: {styling.status.error_bg} !important;
+    border: 1px solid {styling.status.error_border} !important;
+    color: #fca5a5 !important;
+}}
+
+/* Output Text Styling */
+.output-text {{
+    font-family: '{typography.font_family}', sans-serif !important;
+    line-height: {typography.line_heights.relaxed} !important;
+    color: #e2e8f0 !important;
+    background: #16213e !important;
+    border: 1px solid #2d3748 !important;
+    border-radius: 8px !important;
+}}
+
+/* Responsive Design */
+@media (max-width: 768px) {{
+    .gradio-container {{
+        padding: 10px !important;
+    }}
+
+    .header-section {{
+        padding: 20px !important;
+    }}
+
+    .header-section h1 {{
+        font-size: {typography.header_md} !important;
+    }}
+
+    .app-card {{
+        padding: 16px !important;
+        margin: 10px 0 !important;
+    }}
+
+    .search-section,
+    .results-section,
+    .gallery-section {{
+        padding: 15px !important;
+    }}
+}}
+
+/* Custom scrollbar */
+::-webkit-scrollbar {{
+    width: 8px;
+}}
+
+::-webkit-scrollbar-track {{
+    background: #1a1a2e;
+}}
+
+::-webkit-scrollbar-thumb {{
+    background: #667eea;
+    border-radius: 4px;
+}}
+
+::-webkit-scrollbar-thumb:hover {{
+    background: #764ba2;
+}}
+"""
+
+# Flattened fallback values for the theme accessors and every placeholder in
+# ``_CSS_TEMPLATE``
+_DEFAULTS = {
+    "theme.primary_hue": "violet",
+    "theme.secondary_hue": "blue",
+    "theme.neutral_hue": "slate",
+    "theme.colors.body_background_fill_dark": "#0f0f23",
+    "theme.colors.background_fill_primary_dark": "#1a1a2e",
+    "theme.colors.background_fill_secondary_dark": "#16213e",
+    "theme.colors.border_color_primary_dark": "#2d3748",
+    "typography.google_fonts_url": "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap",
+    "styling.container.max_width": "100%",
+    "styling.container.padding": "20px",
+    "styling.container.background": "#0a0a0a",
+    "typography.font_family": "Inter",
+    "styling.header.background": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
+    "styling.header.padding": "40px",
+    "styling.header.border_radius": "15px",
+    "styling.header.margin_bottom": "30px",
+    "styling.header.text_align": "center",
+    "styling.header.box_shadow": "0 8px 32px rgba(102, 126, 234, 0.3)",
+    "styling.animation.duration_normal": "0.3s",
+    "styling.animation.easing": "ease",
+    "typography.header_lg": "2.5rem",
+    "typography.line_heights.tight": "1.25",
+    "typography.body_lg": "1.2rem",
+    "typography.line_heights.relaxed": "1.6",
+    "typography.header_xl": "3rem",
+    "styling.card.background": "linear-gradient(145deg, #1a1a2e, #16213e)",
+    "styling.card.border_radius": "16px",
+    "styling.card.padding": "24px",
+    "styling.card.margin": "15px 0",
+    "styling.card.border": "1px solid #2d3748",
+    "styling.card.box_shadow": "0 4px 20px rgba(0, 0, 0, 0.4)",
+    "styling.card.transition": "all 0.3s ease",
+    "styling.card_hover.transform": "translateY(-4px)",
+    "styling.card_hover.box_shadow": "0 12px 40px rgba(102, 126, 234, 0.2)",
+    "styling.card_hover.border_color": "#667eea",
+    "styling.section.background": "#1a1a2e",
+    "styling.section.padding": "25px",
+    "styling.section.border_radius": "12px",
+    "styling.section.margin_bottom": "20px",
+    "styling.section.border": "1px solid #2d3748",
+    "styling.section.box_shadow": "0 2px 15px rgba(0, 0, 0, 0.3)",
+    "typography.header_sm": "1.5rem",
+    "typography.body_md": "1rem",
+    "typography.body_sm": "0.9rem",
+    "typography.line_heights.normal": "1.5",
+    "theme.colors.accent_color": "#667eea",
+    "styling.button.primary_gradient": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
+    "styling.button.border_radius": "8px",
+    "styling.button.padding": "12px 24px",
+    "styling.button.font_weight": "600",
+    "styling.button.box_shadow": "0 4px 15px rgba(102, 126, 234, 0.4)",
+    "styling.button.transition": "all 0.3s ease",
+    "styling.button_hover.transform": "translateY(-2px)",
+    "styling.button_hover.box_shadow": "0 6px 25px rgba(102, 126, 234, 0.6)",
+    "styling.input.background": "#16213e",
+    "styling.input.border": "2px solid #2d3748",
+    "styling.input.border_radius": "8px",
+    "styling.input.color": "#e2e8f0",
+    "styling.input_focus.border_color": "#667eea",
+    "styling.input_focus.background": "#1a1a2e",
+    "styling.input_focus.box_shadow": "0 0 0 3px rgba(102, 126, 234, 0.1)",
+    "styling.gallery.background": "#1a1a2e",
+    "styling.gallery.border_radius": "12px",
+    "styling.gallery.padding": "20px",
+    "styling.gallery.border": "1px solid #2d3748",
+    "styling.status.success_bg": "#064e3b",
+    "styling.status.success_border": "#10b981",
+    "styling.status.warning_bg": "#451a03",
+    "styling.status.warning_border": "#f59e0b",
+    "styling.status.error_bg": "#450a0a",
+    "styling.status.error_border": "#ef4444",
+    "typography.header_md": "2rem",
+}
+
+
+def _compile_template(template: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split a template into literal fragments and placeholder names.
+
+    Args:
+        template: Template string using ``{dotted.path}`` placeholders
+
+    Returns:
+        Tuple of (statics, fields). ``statics`` holds one more fragment than
+        ``fields`` and rendering interleaves the two.
+    """
+    statics = []
+    fields = []
+    pending = ""
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        pending += literal
+        if field_name is not None:
+            statics.append(pending)
+            fields.append(field_name)
+            pending = ""
+    statics.append(pending)
+    return tuple(statics), tuple(fields)
+
+
+def _flatten(tree: Mapping[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten a nested config into a dictionary keyed by dotted paths.
+
+    Args:
+        tree: Nested configuration dictionary
+        prefix: Dotted path of ``tree`` within the full config
+
+    Returns:
+        Dictionary mapping paths such as ``"styling.card.padding"`` to values.
+        Keys with null values are left out so that defaults apply.
+    """
+    flat = {}
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, Mapping):
+            flat.update(_flatten(value, f"{path}."))
+        elif value is not None:
+            flat[path] = value
+    return flat
+
+
+_CSS_STATICS, _CSS_FIELDS = _compile_template(_CSS_TEMPLATE)
+
+# Shared read-only default for optional sections
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Read-only configuration used when the YAML file cannot be loaded
+_DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "theme": MappingProxyType(
+            {
+                "primary_hue": "violet",
+                "secondary_hue": "blue",
+                "neutral_hue": "slate",
+            }
+        ),
+        "typography": MappingProxyType({"font_family": "Inter"}),
+        "styling": _EMPTY,
+    }
+)
+
 
 class DesignConfigLoader:
     """Loads and manages design configuration for Mukh Apps."""
@@ -20,8 +436,28 @@ class DesignConfigLoader:
         Args:
             config_path: Path to the YAML configuration file
         """
-        self.config_path = Path(config_path)
+        self.config_path = Path(config_path).resolve()
+        self.reload()
+
+    def reload(self) -> None:
+        """Load the configuration from disk and render its CSS."""
         self.config = self._load_config()
+        self._flat = self._build_flat_config()
+        self._rendered_css = self._build_css_styles()
+        # Drop theme settings computed from the previous config
+        self.__dict__.pop("theme_config", None)
+        self.__dict__.pop("theme_colors", None)
+
+    def _build_flat_config(self) -> Dict[str, Any]:
+        """Build the dotted-path lookup table for the loaded config.
+
+        Returns:
+            Flattened configuration merged over the defaults
+        """
+        flat = dict(_DEFAULTS)
+        if isinstance(self.config, Mapping):
+            flat.update(_flatten(self.config))
+        return flat
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file.
@@ -30,29 +466,66 @@ class DesignConfigLoader:
             Dictionary containing the configuration
         """
         try:
-            with open(self.config_path, "r", encoding="utf-8") as file:
-                return yaml.safe_load(file)
+            return yaml.load(self.config_path.read_bytes(), Loader=_YamlLoader)
         except FileNotFoundError:
-            print(f"Warning: Config file {self.config_path} not found. Using defaults.")
+            logger.warning(
+                "Config file %s not found. Using defaults.", self.config_path
+            )
             return self._get_default_config()
-        except Exception as e:
-            print(f"Error loading config: {e}. Using defaults.")
+        except (yaml.YAMLError, OSError, UnicodeDecodeError):
+            logger.exception("Error loading config. Using defaults.")
             return self._get_default_config()
 
-    def _get_default_config(self) -> Dict[str, Any]:
+    def _get_nested(self, path: Tuple[str, ...], default: Any = None) -> Any:
+        """Look up a nested config value.
+
+        Args:
+            path: Sequence of keys leading to the value
+            default: Value returned when any key along the path is missing
+
+        Returns:
+            The configured value, or ``default`` if it is not set
+        """
+        value = self.config
+        for key in path:
+            if not isinstance(value, Mapping):
+                return default
+            value = value.get(key)
+            if value is None:
+                return default
+        return value
+
+    def _get_default_config(self) -> Mapping[str, Any]:
         """Get default configuration if file loading fails.
 
         Returns:
             Default configuration dictionary
         """
+        return _DEFAULT_CONFIG
+
+    @cached_property
+    def theme_config(self) -> Dict[str, str]:
+        """Theme hue settings for Gradio, computed once per loaded config."""
+        flat = self._flat
         return {
-            "theme": {
-                "primary_hue": "violet",
-                "secondary_hue": "blue",
-                "neutral_hue": "slate",
-            },
-            "typography": {"font_family": "Inter"},
-            "styling": {},
+            "primary_hue": flat["theme.primary_hue"],
+            "secondary_hue": flat["theme.secondary_hue"],
+            "neutral_hue": flat["theme.neutral_hue"],
+        }
+
+    @cached_property
+    def theme_colors(self) -> Dict[str, str]:
+        """Theme color settings for Gradio, computed once per loaded config."""
+        flat = self._flat
+        return {
+            "body_background_fill_dark": flat["theme.colors.body_background_fill_dark"],
+            "background_fill_primary_dark": flat[
+                "theme.colors.background_fill_primary_dark"
+            ],
+            "background_fill_secondary_dark": flat[
+                "theme.colors.background_fill_secondary_dark"
+            ],
+            "border_color_primary_dark": flat["theme.colors.border_color_primary_dark"],
         }
 
     def get_theme_config(self) -> Dict[str, str]:
@@ -61,12 +534,7 @@ class DesignConfigLoader:
         Returns:
             Dictionary with theme hue settings
         """
-        theme = self.config.get("theme", {})
-        return {
-            "primary_hue": theme.get("primary_hue", "violet"),
-            "secondary_hue": theme.get("secondary_hue", "blue"),
-            "neutral_hue": theme.get("neutral_hue", "slate"),
-        }
+        return self.theme_config
 
     def get_theme_colors(self) -> Dict[str, str]:
         """Get theme colors for Gradio.
@@ -74,21 +542,7 @@ class DesignConfigLoader:
         Returns:
             Dictionary with color settings
         """
-        colors = self.config.get("theme", {}).get("colors", {})
-        return {
-            "body_background_fill_dark": colors.get(
-                "body_background_fill_dark", "#0f0f23"
-            ),
-            "background_fill_primary_dark": colors.get(
-                "background_fill_primary_dark", "#1a1a2e"
-            ),
-            "background_fill_secondary_dark": colors.get(
-                "background_fill_secondary_dark", "#16213e"
-            ),
-            "border_color_primary_dark": colors.get(
-                "border_color_primary_dark", "#2d3748"
-            ),
-        }
+        return self.theme_colors
 
     def get_font_family(self) -> str:
         """Get the font family configuration.
@@ -96,7 +550,7 @@ class DesignConfigLoader:
         Returns:
             Font family string
         """
-        return self.config.get("typography", {}).get("font_family", "Inter")
+        return self._flat["typography.font_family"]
 
     def get_google_fonts_url(self) -> str:
         """Get Google Fonts URL.
@@ -104,18 +558,15 @@ class DesignConfigLoader:
         Returns:
             Google Fonts URL string
         """
-        return self.config.get("typography", {}).get(
-            "google_fonts_url",
-            "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap",
-        )
+        return self._flat["typography.google_fonts_url"]
 
-    def get_styling_config(self) -> Dict[str, Any]:
+    def get_styling_config(self) -> Mapping[str, Any]:
         """Get the complete styling configuration.
 
         Returns:
             Dictionary containing all styling settings
         """
-        return self.config.get("styling", {})
+        return self._get_nested(("styling",), _EMPTY)
 
     def get_css_styles(self) -> str:
         """Generate comprehensive CSS styles from configuration.
@@ -123,303 +574,40 @@ class DesignConfigLoader:
         Returns:
             CSS string with all styling applied
         """
-        styling = self.get_styling_config()
-        typography = self.config.get("typography", {})
-        theme_colors = self.config.get("theme", {}).get("colors", {})
-
-        # Base container styles
-        container = styling.get("container", {})
-
-        # Header styles
-        header = styling.get("header", {})
-
-        # Card styles
-        card = styling.get("card", {})
-        card_hover = styling.get("card_hover", {})
-
-        # Section styles
-        section = styling.get("section", {})
-
-        # Button styles
-        button = styling.get("button", {})
-        button_hover = styling.get("button_hover", {})
-
-        # Input styles
-        input_style = styling.get("input", {})
-        input_focus = styling.get("input_focus", {})
-
-        # Gallery styles
-        gallery = styling.get("gallery", {})
-
-        # Status styles
-        status = styling.get("status", {})
-
-        # Animation
-        animation = styling.get("animation", {})
-
-        css = f"""
-        /* Import Google Fonts */
-        @import url('{self.get_google_fonts_url()}');
-        
-        /* Global Container Styles */
-        .gradio-container {{
-            max-width: {container.get('max_width', '100%')} !important;
-            width: 100% !important;
-            margin: 0 !important;
-            padding: {container.get('padding', '20px')} !important;
-            background: {container.get('background', '#0a0a0a')} !important;
-            font-family: '{self.get_font_family()}', sans-serif !important;
-        }}
-        
-        .main {{
-            max-width: 100% !important;
-            width: 100% !important;
-        }}
-        
-        /* Header Section Styling */
-        .header-section {{
-            background: {header.get('background', 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)')} !important;
-            color: white !important;
-            padding: {header.get('padding', '40px')} !important;
-            border-radius: {header.get('border_radius', '15px')} !important;
-            margin-bottom: {header.get('margin_bottom', '30px')} !important;
-            text-align: {header.get('text_align', 'center')} !important;
-            box-shadow: {header.get('box_shadow', '0 8px 32px rgba(102, 126, 234, 0.3)')} !important;
-            transition: all {animation.get('duration_normal', '0.3s')} {animation.get('easing', 'ease')} !important;
-        }}
-        
-        .header-section h1 {{
-            font-size: {typography.get('header_lg', '2.5rem')} !important;
-            font-weight: 700 !important;
-            margin-bottom: 15px !important;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3) !important;
-            line-height: {typography.get('line_heights', {}).get('tight', '1.25')} !important;
-        }}
-        
-        .header-section p {{
-            font-size: {typography.get('body_lg', '1.2rem')} !important;
-            margin-bottom: 10px !important;
-            opacity: 0.95 !important;
-            line-height: {typography.get('line_heights', {}).get('relaxed', '1.6')} !important;
-        }}
-        
-        /* Main Header Styling */
-        .main-header {{
-            text-align: center !important;
-            color: #f8fafc !important;
-            font-size: {typography.get('header_xl', '3rem')} !important;
-            font-weight: 800 !important;
-            margin-bottom: 2rem !important;
-            text-shadow: 2px 2px 8px rgba(0,0,0,0.4) !important;
-        }}
-        
-        /* Card Styling */
-        .app-card {{
-            background: {card.get('background', 'linear-gradient(145deg, #1a1a2e, #16213e)')} !important;
-            border-radius: {card.get('border_radius', '16px')} !important;
-            padding: {card.get('padding', '24px')} !important;
-            margin: {card.get('margin', '15px 0')} !important;
-            border: {card.get('border', '1px solid #2d3748')} !important;
-            box-shadow: {card.get('box_shadow', '0 4px 20px rgba(0, 0, 0, 0.4)')} !important;
-            transition: {card.get('transition', 'all 0.3s ease')} !important;
-        }}
-        
-        .app-card:hover {{
-            transform: {card_hover.get('transform', 'translateY(-4px)')} !important;
-            box-shadow: {card_hover.get('box_shadow', '0 12px 40px rgba(102, 126, 234, 0.2)')} !important;
-            border-color: {card_hover.get('border_color', '#667eea')} !important;
-        }}
-        
-        /* Section Styling */
-        .search-section,
-        .results-section,
-        .gallery-section {{
-            background: {section.get('background', '#1a1a2e')} !important;
-            padding: {section.get('padding', '25px')} !important;
-            border-radius: {section.get('border_radius', '12px')} !important;
-            margin-bottom: {section.get('margin_bottom', '20px')} !important;
-            border: {section.get('border', '1px solid #2d3748')} !important;
-            box-shadow: {section.get('box_shadow', '0 2px 15px rgba(0, 0, 0, 0.3)')} !important;
-            height: fit-content !important;
-        }}
-        
-        /* Typography Styles */
-        .app-title {{
-            font-size: {typography.get('header_sm', '1.5rem')} !important;
-            font-weight: 600 !important;
-            color: #f8fafc !important;
-            margin-bottom: 12px !important;
-            line-height: {typography.get('line_heights', {}).get('tight', '1.25')} !important;
-        }}
-        
-        .app-description {{
-            color: #cbd5e1 !important;
-            margin-bottom: 16px !important;
-            line-height: {typography.get('line_heights', {}).get('relaxed', '1.6')} !important;
-            font-size: {typography.get('body_md', '1rem')} !important;
-        }}
-        
-        .app-features {{
-            color: #94a3b8 !important;
-            font-size: {typography.get('body_sm', '0.9rem')} !important;
-            margin-bottom: 20px !important;
-            line-height: {typography.get('line_heights', {}).get('normal', '1.5')} !important;
-        }}
-        
-        .section-header {{
-            color: {theme_colors.get('accent_color', '#667eea')} !important;
-            font-weight: bold !important;
-            border-bottom: 2px solid {theme_colors.get('accent_color', '#667eea')} !important;
-            padding-bottom: 5px !important;
-            margin-bottom: 15px !important;
-            font-size: {typography.get('header_sm', '1.5rem')} !important;
-        }}
-        
-        /* Button Styling */
-        .primary-button,
-        button[variant="primary"] {{
-            background: {button.get('primary_gradient', 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)')} !important;
-            border: none !important;
-            border-radius: {button.get('border_radius', '8px')} !important;
-            padding: {button.get('padding', '12px 24px')} !important;
-            font-weight: {button.get('font_weight', '600')} !important;
-            font-size: {typography.get('body_md', '1rem')} !important;
-            color: white !important;
-            box-shadow: {button.get('box_shadow', '0 4px 15px rgba(102, 126, 234, 0.4)')} !important;
-            transition: {button.get('transition', 'all 0.3s ease')} !important;
-            cursor: pointer !important;
-        }}
-        
-        .primary-button:hover,
-        button[variant="primary"]:hover {{
-            transform: {button_hover.get('transform', 'translateY(-2px)')} !important;
-            box-shadow: {button_hover.get('box_shadow', '0 6px 25px rgba(102, 126, 234, 0.6)')} !important;
-        }}
-        
-        /* Input and Textarea Styling */
-        .gradio-textbox textarea,
-        .gradio-textbox input {{
-            background: {input_style.get('background', '#16213e')} !important;
-            border: {input_style.get('border', '2px solid #2d3748')} !important;
-            border-radius: {input_style.get('border_radius', '8px')} !important;
-            color: {input_style.get('color', '#e2e8f0')} !important;
-            font-family: '{self.get_font_family()}', sans-serif !important;
-            line-height: {typography.get('line_heights', {}).get('normal', '1.5')} !important;
-        }}
-        
-        .gradio-textbox textarea:focus,
-        .gradio-textbox input:focus {{
-            border-color: {input_focus.get('border_color', '#667eea')} !important;
-            background: {input_focus.get('background', '#1a1a2e')} !important;
-            box-shadow: {input_focus.get('box_shadow', '0 0 0 3px rgba(102, 126, 234, 0.1)')} !important;
-            outline: none !important;
-        }}
-        
-        /* Gallery Styling */
-        .gallery-container {{
-            margin-top: 15px !important;
-            width: 100% !important;
-            background: {gallery.get('background', '#1a1a2e')} !important;
-            border-radius: {gallery.get('border_radius', '12px')} !important;
-            padding: {gallery.get('padding', '20px')} !important;
-            border: {gallery.get('border', '1px solid #2d3748')} !important;
-        }}
-        
-        .gallery img {{
-            border-radius: 8px !important;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3) !important;
-            transition: all {animation.get('duration_normal', '0.3s')} {animation.get('easing', 'ease')} !important;
-        }}
-        
-        .gallery img:hover {{
-            transform: scale(1.02) !important;
-            box-shadow: 0 8px 25px rgba(102, 126, 234, 0.3) !important;
-        }}
-        
-        /* Status Message Styling */
-        .status-message {{
-            margin-top: 20px !important;
-            padding: 12px !important;
-            border-radius: 8px !important;
-            font-weight: 500 !important;
-            font-family: '{self.get_font_family()}', sans-serif !important;
-        }}
-        
-        .status-success {{
-            background: {status.get('success_bg', '#064e3b')} !important;
-            border: 1px solid {status.get('success_border', '#10b981')} !important;
-            color: #a7f3d0 !important;
-        }}
-        
-        .status-warning {{
-            background: {status.get('warning_bg', '#451a03')} !important;
-            border: 1px solid {status.get('warning_border', '#f59e0b')} !important;
-            color: #fcd34d !important;
-        }}
-        
-        .status-error {{
-            background: {status.get('error_bg', '#450a0a')} !important;
-            border: 1px solid {status.get('error_border', '#ef4444')} !important;
-            color: #fca5a5 !important;
-        }}
-        
-        /* Output Text Styling */
-        .output-text {{
-            font-family: '{self.get_font_family()}', sans-serif !important;
-            line-height: {typography.get('line_heights', {}).get('relaxed', '1.6')} !important;
-            color: #e2e8f0 !important;
-            background: #16213e !important;
-            border: 1px solid #2d3748 !important;
-            border-radius: 8px !important;
-        }}
-        
-        /* Responsive Design */
-        @media (max-width: 768px) {{
-            .gradio-container {{
-                padding: 10px !important;
-            }}
-            
-            .header-section {{
-                padding: 20px !important;
-            }}
-            
-            .header-section h1 {{
-                font-size: {typography.get('header_md', '2rem')} !important;
-            }}
-            
-            .app-card {{
-                padding: 16px !important;
-                margin: 10px 0 !important;
-            }}
-            
-            .search-section,
-            .results-section,
-            .gallery-section {{
-                padding: 15px !important;
-            }}
-        }}
-        
-        /* Custom scrollbar */
-        ::-webkit-scrollbar {{
-            width: 8px;
-        }}
-        
-        ::-webkit-scrollbar-track {{
-            background: #1a1a2e;
-        }}
-        
-        ::-webkit-scrollbar-thumb {{
-            background: #667eea;
-            border-radius: 4px;
-        }}
-        
-        ::-webkit-scrollbar-thumb:hover {{
-            background: #764ba2;
-        }}
+        return self._rendered_css
+
+    def _build_css_styles(self) -> str:
+        """Build the CSS string from the current configuration.
+
+        Returns:
+            CSS string with all styling applied
         """
+        flat = self._flat
+        values = [str(flat[field]) for field in _CSS_FIELDS]
+        return (
+            "".join(itertools.chain.from_iterable(zip(_CSS_STATICS, values)))
+            + _CSS_STATICS[-1]
+        )
+
+
+# Global instance, created on first access
+_instance: Optional[DesignConfigLoader] = None
+
+
+def get_design_config() -> DesignConfigLoader:
+    """Get the shared design config loader, loading it on first use.
 
-        return css
+    Returns:
+        The module-wide DesignConfigLoader instance
+    """
+    global _instance
+    if _instance is None:
+        _instance = DesignConfigLoader()
+    return _instance
 
 
-# Global instance
-design_config = DesignConfigLoader()
+def __getattr__(name: str) -> Any:
+    """Resolve ``design_config`` lazily so importing this module stays cheap."""
+    if name == "design_config":
+        return get_design_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,13 +4,184 @@ Minimal Deepfake Detection App
 A simple Gradio interface for deepfake detection using pipeline approach.
 """
 
+import contextlib
+import functools
+import logging
 import os
-from typing import List
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import gradio as gr
 from config_loader import design_config
 
-from mukh.pipelines.deepfake_detection import PipelineDeepfakeDetection
+if TYPE_CHECKING:
+    from mukh.deepfake_detection import DeepfakeDetector
+    from mukh.pipelines.deepfake_detection import PipelineDeepfakeDetection
+
+logger = logging.getLogger(__name__)
+
+# Member detectors keyed by (model name, device), shared by every pipeline
+# regardless of its weights and threshold
+_DETECTOR_CACHE: Dict[Tuple[str, Optional[str]], "DeepfakeDetector"] = {}
+_DETECTOR_CACHE_LOCK = threading.Lock()
+
+# One lock per cached detector, so concurrent requests never run the same
+# loaded model at the same time
+_DETECTOR_LOCKS: Dict[Tuple[str, Optional[str]], threading.Lock] = {}
+
+# Output folder for pipeline results, created once at import; every request
+# writes to its own temporary subfolder
+_OUTPUT_FOLDER = os.path.join("output", "deepfake_detection")
+os.makedirs(_OUTPUT_FOLDER, exist_ok=True)
+
+# Video frame sampling: about two frames per second, within these bounds
+_MIN_FRAMES = 5
+_MAX_FRAMES = 32
+_DEFAULT_FRAMES = 11
+
+_IMAGE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".webp"}
+)
+_VIDEO_EXTENSIONS = frozenset({".mp4", ".avi", ".mov", ".mkv", ".flv", ".wmv", ".webm"})
+_SUPPORTED_EXTENSIONS = _IMAGE_EXTENSIONS | _VIDEO_EXTENSIONS
+
+
+@functools.lru_cache(maxsize=1)
+def _default_device() -> str:
+    """Pick the inference device once per process.
+
+    Returns:
+        'cuda' if a GPU is available, otherwise 'cpu'
+    """
+    import torch
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def get_detector(model_name: str, device: Optional[str] = None) -> "DeepfakeDetector":
+    """Get a cached member detector, creating it on first use.
+
+    Detectors keep their model loaded, so reusing them avoids reloading
+    weights on every request. The detection module (and torch) is imported
+    on the first request rather than at app start-up.
+
+    Args:
+        model_name: Name of the model
+        device: Device to run inference on. Auto-detected if None
+
+    Returns:
+        DeepfakeDetector instance for the model
+    """
+    key = (model_name, device)
+    with _DETECTOR_CACHE_LOCK:
+        detector = _DETECTOR_CACHE.get(key)
+        if detector is None:
+            from mukh.deepfake_detection import DeepfakeDetector
+
+            detector = DeepfakeDetector(
+                model_name=model_name, confidence_threshold=0.5, device=device
+            )
+            _DETECTOR_CACHE[key] = detector
+            _DETECTOR_LOCKS[key] = threading.Lock()
+    return detector
+
+
+def _build_pipeline(
+    model_configs: Dict[str, float],
+    device: Optional[str] = None,
+    confidence_threshold: float = 0.5,
+) -> "PipelineDeepfakeDetection":
+    """Build a detection pipeline on top of the cached member detectors.
+
+    Pipelines themselves are cheap, so one is built per request with that
+    request's weights and threshold.
+
+    Args:
+        model_configs: Dictionary mapping model names to their weights
+        device: Device to run inference on. Auto-detected if None
+        confidence_threshold: Threshold for ensemble prediction
+
+    Returns:
+        PipelineDeepfakeDetection instance for the given settings
+    """
+    from mukh.pipelines.deepfake_detection import PipelineDeepfakeDetection
+
+    return PipelineDeepfakeDetection(
+        model_configs=model_configs,
+        device=device,
+        confidence_threshold=confidence_threshold,
+        detectors={
+            model_name: get_detector(model_name, device) for model_name in model_configs
+        },
+    )
+
+
+def _run_detector(model_configs: Dict[str, float], **detect_kwargs) -> None:
+    """Run a pipeline on the default device, one request at a time per model.
+
+    Args:
+        model_configs: Dictionary mapping model names to their weights
+        **detect_kwargs: Arguments passed to the pipeline's ``detect``
+    """
+    device = _default_device()
+    pipeline = _build_pipeline(model_configs, device=device, confidence_threshold=0.5)
+
+    # Take the member locks in a fixed order, so two ensembles cannot deadlock
+    with contextlib.ExitStack() as stack:
+        for model_name in sorted(model_configs):
+            stack.enter_context(_DETECTOR_LOCKS[(model_name, device)])
+        pipeline.detect(**detect_kwargs)
+
+
+def choose_num_frames(media_path: str) -> int:
+    """Choose how many frames to analyze, scaled to the video's length.
+
+    Samples roughly two frames per second of video, clamped to
+    ``[_MIN_FRAMES, _MAX_FRAMES]`` and to the number of frames available.
+
+    Args:
+        media_path: Path to the input media file
+
+    Returns:
+        Number of frames to analyze (1 for images)
+    """
+    if os.path.splitext(media_path)[1].lower() in _IMAGE_EXTENSIONS:
+        return 1
+
+    import cv2
+
+    cap = cv2.VideoCapture(media_path)
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    finally:
+        cap.release()
+
+    if fps <= 0 or frame_count <= 0:
+        return _DEFAULT_FRAMES
+
+    num_frames = min(max(round(frame_count / fps * 2), _MIN_FRAMES), _MAX_FRAMES)
+    return min(num_frames, frame_count)
+
+
+def _read_pipeline_result(output_folder: str) -> str:
+    """Read the pipeline report written to an output folder.
+
+    Args:
+        output_folder: Folder the pipeline saved its results to
+
+    Returns:
+        Report text, or an error message if the report is missing
+    """
+    pipeline_result_path = os.path.join(output_folder, "pipeline_result.txt")
+
+    try:
+        with open(pipeline_result_path, "rb") as f:
+            return f.read().decode("utf-8", "replace").strip()
+    except FileNotFoundError:
+        return "❌ Error: Pipeline results file not found"
 
 
 def detect_deepfakes(
@@ -32,79 +203,215 @@ def detect_deepfakes(
     Returns:
         String containing the results text
     """
-    try:
-        if not media_path or not os.path.exists(media_path):
-            return "❌ Error: No valid media file provided"
+    if not media_path or not os.path.exists(media_path):
+        return "❌ Error: No valid media file provided"
+
+    # Reject unsupported files before any model is loaded
+    extension = os.path.splitext(media_path)[1].lower()
+    if extension not in _SUPPORTED_EXTENSIONS:
+        return f"❌ Error: Unsupported file extension: {extension or '(none)'}"
+
+    if detection_method == "ensemble":
+        model_configs = {
+            "resnet_inception": resnet_weight,
+            "efficientnet": efficientnet_weight,
+        }
+
+        # Check if weights sum to 1.0, in the sliders' 0.1 steps
+        if sum(round(weight * 10) for weight in model_configs.values()) != 10:
+            total_weight = sum(model_configs.values())
+            return f"⚠️ Warning: Model weights must sum to 1.0. Current sum: {total_weight:.3f}\nPlease adjust the weights so ResNet + EfficientNet = 1.0"
+
+    elif not selected_models:
+        return "❌ Error: Please select at least one model for individual detection"
+
+    # Concurrent requests must not read each other's reports, and the folder is
+    # only needed until the report has been read
+    with tempfile.TemporaryDirectory(dir=_OUTPUT_FOLDER) as output_folder:
+        try:
+            num_frames = choose_num_frames(media_path)
+
+            if detection_method == "ensemble":
+                # Perform detection
+                _run_detector(
+                    model_configs,
+                    media_path=media_path,
+                    output_folder=output_folder,
+                    save_csv=True,
+                    num_frames=num_frames,
+                )
 
-        # Set output folder
-        output_folder = os.path.join("output", "deepfake_detection")
-        os.makedirs(output_folder, exist_ok=True)
+            else:
+                # Run the selected models concurrently, each writing to its own folder
+                with ThreadPoolExecutor(max_workers=len(selected_models)) as executor:
+                    futures = [
+                        executor.submit(
+                            _run_detector,
+                            {model_name: 1.0},
+                            media_path=media_path,
+                            output_folder=os.path.join(output_folder, model_name),
+                            save_csv=True,
+                            num_frames=num_frames,
+                        )
+                        for model_name in selected_models
+                    ]
+                    for future in futures:
+                        future.result()
+
+        except Exception as e:
+            logger.exception("Deepfake detection failed for %s", media_path)
+            return f"❌ Error: {str(e)}"
 
         if detection_method == "ensemble":
-            # Check if weights sum to 1.0
-            total_weight = resnet_weight + efficientnet_weight
-            if abs(total_weight - 1.0) > 0.001:  # Allow small floating point tolerance
-                return f"⚠️ Warning: Model weights must sum to 1.0. Current sum: {total_weight:.3f}\nPlease adjust the weights so ResNet + EfficientNet = 1.0"
-
-            model_configs = {
-                "resnet_inception": resnet_weight,
-                "efficientnet": efficientnet_weight,
-            }
-
-            detector = PipelineDeepfakeDetection(
-                model_configs=model_configs, device=None, confidence_threshold=0.5
-            )
+            return _read_pipeline_result(output_folder)
 
-            # Perform detection
-            result = detector.detect(
-                media_path=media_path,
-                output_folder=output_folder,
-                save_csv=True,
-                num_frames=11,
-            )
+        return "\n\n".join(
+            f"🔧 {model_name}\n"
+            + _read_pipeline_result(os.path.join(output_folder, model_name))
+            for model_name in selected_models
+        )
 
-        else:
-            # Individual model detection
-            if not selected_models:
-                return "❌ Error: Please select at least one model for individual detection"
 
-            for model_name in selected_models:
-                # Create single model detector
-                model_configs = {model_name: 1.0}
-                detector = PipelineDeepfakeDetection(
-                    model_configs=model_configs, device=None, confidence_threshold=0.5
-                )
+_HEADER_HTML = """
+<div style="text-align: center;">
+    <h1>🕵️ Mukh - Deepfake Detection</h1>
+    <p>Detect artificially generated or manipulated faces using ensemble AI models</p>
+    <div style="display: flex; justify-content: center; gap: 25px; margin-top: 20px; flex-wrap: wrap;">
+        <div style="background: rgba(255,255,255,0.1); padding: 12px 18px; border-radius: 8px; backdrop-filter: blur(10px);">
+            <div style="font-size: 1.2em; margin-bottom: 5px;">🧠</div>
+            <strong>ResNet Inception</strong><br/>
+            <span style="opacity: 0.9;">Deep analysis</span>
+        </div>
+        <div style="background: rgba(255,255,255,0.1); padding: 12px 18px; border-radius: 8px; backdrop-filter: blur(10px);">
+            <div style="font-size: 1.2em; margin-bottom: 5px;">⚡</div>
+            <strong>EfficientNet</strong><br/>
+            <span style="opacity: 0.9;">Fast detection</span>
+        </div>
+        <div style="background: rgba(255,255,255,0.1); padding: 12px 18px; border-radius: 8px; backdrop-filter: blur(10px);">
+            <div style="font-size: 1.2em; margin-bottom: 5px;">🎯</div>
+            <strong>Ensemble</strong><br/>
+            <span style="opacity: 0.9;">High accuracy</span>
+        </div>
+    </div>
+</div>
+"""
 
-                result = detector.detect(
-                    media_path=media_path,
-                    output_folder=output_folder,
-                    save_csv=True,
-                    num_frames=11,
-                )
+_INPUT_TITLE_HTML = '<h3 style="color: #667eea; font-weight: bold; border-bottom: 2px solid #667eea; padding-bottom: 5px; margin-bottom: 20px;">📤 Input Configuration</h3>'
 
-        # Read pipeline results if available
-        pipeline_result_path = os.path.join(output_folder, "pipeline_result.txt")
+_FORMATS_HTML = """
+<div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 8px; padding: 15px; margin: 15px 0;">
+    <div style="color: #667eea; font-weight: 600; margin-bottom: 8px;">📋 Supported Formats:</div>
+    <div style="color: #cbd5e1; font-size: 0.9rem; line-height: 1.4;">
+        <strong>Images:</strong> JPG, JPEG, PNG, BMP, TIFF, WEBP<br/>
+        <strong>Videos:</strong> MP4, AVI, MOV, MKV, FLV, WMV
+    </div>
+</div>
+"""
+
+_WEIGHTS_TITLE_HTML = '<div style="color: #10b981; font-weight: 600; margin-bottom: 10px;">⚖️ Model Weights (Ensemble):</div>'
+
+_METHODS_HTML = """
+<div style="background: rgba(16, 185, 129, 0.1); border: 1px solid #10b981; border-radius: 8px; padding: 15px; margin: 15px 0;">
+    <div style="color: #10b981; font-weight: 600; margin-bottom: 8px;">🤖 Detection Methods:</div>
+    <div style="color: #a7f3d0; font-size: 0.85rem; line-height: 1.4;">
+        <strong>Ensemble:</strong> Combines both models with custom weights for best accuracy<br/>
+        <strong>Individual:</strong> Analyze with selected models separately for comparison<br/>
+        <strong>Weights:</strong> Higher weight = more influence on final decision
+    </div>
+</div>
+"""
 
-        if os.path.exists(pipeline_result_path):
-            with open(pipeline_result_path, "r") as f:
-                pipeline_content = f.read().strip()
-            return pipeline_content
-        else:
-            return "❌ Error: Pipeline results file not found"
+_RESULTS_TITLE_HTML = '<h3 style="color: #667eea; font-weight: bold; border-bottom: 2px solid #667eea; padding-bottom: 5px; margin-bottom: 20px;">📊 Detection Results</h3>'
+
+_GUIDE_TITLE_HTML = '<h3 style="color: #667eea; font-weight: bold; border-bottom: 2px solid #667eea; padding-bottom: 5px; margin-bottom: 20px;">ℹ️ How Deepfake Detection Works</h3>'
+
+_GUIDE_HTML = """
+<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-top: 20px;">
+    <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px; text-align: center;">
+        <div style="font-size: 2em; margin-bottom: 10px;">📤</div>
+        <strong style="color: #e2e8f0;">1. Upload Media</strong>
+        <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Select image or video file</p>
+    </div>
+
+    <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px; text-align: center;">
+        <div style="font-size: 2em; margin-bottom: 10px;">🤖</div>
+        <strong style="color: #e2e8f0;">2. Choose Method</strong>
+        <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Ensemble or individual models</p>
+    </div>
+
+    <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px; text-align: center;">
+        <div style="font-size: 2em; margin-bottom: 10px;">⚖️</div>
+        <strong style="color: #e2e8f0;">3. Set Weights</strong>
+        <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Configure model influence</p>
+    </div>
+
+    <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px; text-align: center;">
+        <div style="font-size: 2em; margin-bottom: 10px;">📊</div>
+        <strong style="color: #e2e8f0;">4. Get Results</strong>
+        <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Confidence scores and analysis</p>
+    </div>
+</div>
+
+<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin-top: 20px;">
+    <div style="background: rgba(139, 92, 246, 0.1); border: 1px solid #8b5cf6; border-radius: 10px; padding: 20px;">
+        <div style="color: #8b5cf6; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">🧠 Detection Technology:</div>
+        <div style="color: #c4b5fd; font-size: 0.9rem; line-height: 1.6;">
+            • <strong>ResNet Inception:</strong> Advanced convolutional neural network for deep feature extraction<br/>
+            • <strong>EfficientNet:</strong> Optimized architecture balancing accuracy and efficiency<br/>
+            • <strong>Ensemble Learning:</strong> Combines multiple models with weighted averaging for improved reliability
+        </div>
+    </div>
+
+    <div style="background: rgba(16, 185, 129, 0.1); border: 1px solid #10b981; border-radius: 10px; padding: 20px;">
+        <div style="color: #10b981; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">⚖️ Weight Configuration:</div>
+        <div style="color: #a7f3d0; font-size: 0.9rem; line-height: 1.6;">
+            • <strong>Equal Weights (0.5, 0.5):</strong> Balanced approach, recommended for most cases<br/>
+            • <strong>ResNet Heavy (0.7, 0.3):</strong> Emphasizes deep feature analysis<br/>
+            • <strong>EfficientNet Heavy (0.3, 0.7):</strong> Prioritizes efficiency and speed<br/>
+            • <strong>Custom Weights:</strong> Fine-tune based on your specific needs
+        </div>
+    </div>
+</div>
+
+<div style="background: rgba(245, 158, 11, 0.1); border: 1px solid #f59e0b; border-radius: 10px; padding: 20px; margin-top: 20px;">
+    <div style="color: #f59e0b; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">⚡ Performance Tips:</div>
+    <div style="color: #fcd34d; font-size: 0.9rem; line-height: 1.6;">
+        • Use ensemble method with equal weights (0.5, 0.5) for best overall accuracy<br/>
+        • Individual analysis is useful for understanding model-specific strengths<br/>
+        • Higher resolution media generally provides better detection accuracy<br/>
+        • For videos, ensure faces are clearly visible throughout the clip
+    </div>
+</div>
+
+<div style="background: rgba(239, 68, 68, 0.1); border: 1px solid #ef4444; border-radius: 10px; padding: 20px; margin-top: 20px;">
+    <div style="color: #ef4444; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">⚠️ Important Considerations:</div>
+    <div style="color: #fca5a5; font-size: 0.9rem; line-height: 1.6;">
+        • This tool is for educational and research purposes<br/>
+        • Results should be interpreted by qualified professionals<br/>
+        • False positives/negatives are possible with any AI system<br/>
+        • Always consider ethical implications when using deepfake detection
+    </div>
+</div>
+"""
 
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
 
+@functools.lru_cache(maxsize=1)
+def _build_theme():
+    """Build the Gradio theme from the design config.
 
-def create_interface():
-    """Create the Gradio interface for deepfake detection."""
+    The theme only depends on the loaded config, so it is built once and
+    reused. Call ``_build_theme.cache_clear()`` after editing the config during
+    development to pick up the changes.
 
+    Returns:
+        Configured Gradio theme
+    """
     # Get theme configuration from design config
     theme_config = design_config.get_theme_config()
     theme_colors = design_config.get_theme_colors()
 
     # Create theme with configuration
-    theme = gr.themes.Soft(
+    return gr.themes.Soft(
         primary_hue=theme_config["primary_hue"],
         secondary_hue=theme_config["secondary_hue"],
         neutral_hue=theme_config["neutral_hue"],
@@ -115,6 +422,11 @@ def create_interface():
         border_color_primary_dark=theme_colors["border_color_primary_dark"],
     )
 
+
+def create_interface():
+    """Create the Gradio interface for deepfake detection."""
+    theme = _build_theme()
+
     with gr.Blocks(
         title="Deepfake Detection - Mukh",
         theme=theme,
@@ -124,38 +436,12 @@ def create_interface():
         # Modern Header Section
         with gr.Row():
             with gr.Column(elem_classes=["header-section"]):
-                gr.HTML(
-                    """
-                    <div style="text-align: center;">
-                        <h1>🕵️ Mukh - Deepfake Detection</h1>
-                        <p>Detect artificially generated or manipulated faces using ensemble AI models</p>
-                        <div style="display: flex; justify-content: center; gap: 25px; margin-top: 20px; flex-wrap: wrap;">
-                            <div style="background: rgba(255,255,255,0.1); padding: 12px 18px; border-radius: 8px; backdrop-filter: blur(10px);">
-                                <div style="font-size: 1.2em; margin-bottom: 5px;">🧠</div>
-                                <strong>ResNet Inception</strong><br/>
-                                <span style="opacity: 0.9;">Deep analysis</span>
-                            </div>
-                            <div style="background: rgba(255,255,255,0.1); padding: 12px 18px; border-radius: 8px; backdrop-filter: blur(10px);">
-                                <div style="font-size: 1.2em; margin-bottom: 5px;">⚡</div>
-                                <strong>EfficientNet</strong><br/>
-                                <span style="opacity: 0.9;">Fast detection</span>
-                            </div>
-                            <div style="background: rgba(255,255,255,0.1); padding: 12px 18px; border-radius: 8px; backdrop-filter: blur(10px);">
-                                <div style="font-size: 1.2em; margin-bottom: 5px;">🎯</div>
-                                <strong>Ensemble</strong><br/>
-                                <span style="opacity: 0.9;">High accuracy</span>
-                            </div>
-                        </div>
-                    </div>
-                    """,
-                )
+                gr.HTML(_HEADER_HTML)
 
         with gr.Row(equal_height=True):
             # Input Section
             with gr.Column(scale=1, elem_classes=["search-section"]):
-                gr.HTML(
-                    '<h3 style="color: #667eea; font-weight: bold; border-bottom: 2px solid #667eea; padding-bottom: 5px; margin-bottom: 20px;">📤 Input Configuration</h3>'
-                )
+                gr.HTML(_INPUT_TITLE_HTML)
 
                 input_media = gr.File(
                     label="📁 Upload Media File",
@@ -163,17 +449,7 @@ def create_interface():
                     elem_classes=["upload-area"],
                 )
 
-                gr.HTML(
-                    """
-                    <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 8px; padding: 15px; margin: 15px 0;">
-                        <div style="color: #667eea; font-weight: 600; margin-bottom: 8px;">📋 Supported Formats:</div>
-                        <div style="color: #cbd5e1; font-size: 0.9rem; line-height: 1.4;">
-                            <strong>Images:</strong> JPG, JPEG, PNG, BMP, TIFF, WEBP<br/>
-                            <strong>Videos:</strong> MP4, AVI, MOV, MKV, FLV, WMV
-                        </div>
-                    </div>
-                    """
-                )
+                gr.HTML(_FORMATS_HTML)
 
                 # Detection Method Selection
                 detection_method = gr.Radio(
@@ -194,11 +470,7 @@ def create_interface():
 
                 # Ensemble Weights (visible by default)
                 with gr.Group(visible=True) as ensemble_group:
-                    gr.HTML(
-                        """
-                        <div style="color: #10b981; font-weight: 600; margin-bottom: 10px;">⚖️ Model Weights (Ensemble):</div>
-                        """
-                    )
+                    gr.HTML(_WEIGHTS_TITLE_HTML)
                     resnet_weight = gr.Slider(
                         minimum=0.0,
                         maximum=1.0,
@@ -216,18 +488,7 @@ def create_interface():
                         info="Weight for EfficientNet model in ensemble",
                     )
 
-                gr.HTML(
-                    """
-                    <div style="background: rgba(16, 185, 129, 0.1); border: 1px solid #10b981; border-radius: 8px; padding: 15px; margin: 15px 0;">
-                        <div style="color: #10b981; font-weight: 600; margin-bottom: 8px;">🤖 Detection Methods:</div>
-                        <div style="color: #a7f3d0; font-size: 0.85rem; line-height: 1.4;">
-                            <strong>Ensemble:</strong> Combines both models with custom weights for best accuracy<br/>
-                            <strong>Individual:</strong> Analyze with selected models separately for comparison<br/>
-                            <strong>Weights:</strong> Higher weight = more influence on final decision
-                        </div>
-                    </div>
-                    """
-                )
+                gr.HTML(_METHODS_HTML)
 
                 detect_btn = gr.Button(
                     "🕵️ Detect Deepfakes",
@@ -251,9 +512,7 @@ def create_interface():
 
             # Results Section
             with gr.Column(scale=1, elem_classes=["results-section"]):
-                gr.HTML(
-                    '<h3 style="color: #667eea; font-weight: bold; border-bottom: 2px solid #667eea; padding-bottom: 5px; margin-bottom: 20px;">📊 Detection Results</h3>'
-                )
+                gr.HTML(_RESULTS_TITLE_HTML)
 
                 results_text = gr.Textbox(
                     label="📋 Pipeline Analysis Report",
@@ -267,80 +526,9 @@ def create_interface():
         # Information Section
         with gr.Row():
             with gr.Column(elem_classes=["gallery-section"]):
-                gr.HTML(
-                    '<h3 style="color: #667eea; font-weight: bold; border-bottom: 2px solid #667eea; padding-bottom: 5px; margin-bottom: 20px;">ℹ️ How Deepfake Detection Works</h3>'
-                )
+                gr.HTML(_GUIDE_TITLE_HTML)
 
-                gr.HTML(
-                    """
-                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-top: 20px;">
-                        <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px; text-align: center;">
-                            <div style="font-size: 2em; margin-bottom: 10px;">📤</div>
-                            <strong style="color: #e2e8f0;">1. Upload Media</strong>
-                            <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Select image or video file</p>
-                        </div>
-                        
-                        <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px; text-align: center;">
-                            <div style="font-size: 2em; margin-bottom: 10px;">🤖</div>
-                            <strong style="color: #e2e8f0;">2. Choose Method</strong>
-                            <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Ensemble or individual models</p>
-                        </div>
-                        
-                        <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px; text-align: center;">
-                            <div style="font-size: 2em; margin-bottom: 10px;">⚖️</div>
-                            <strong style="color: #e2e8f0;">3. Set Weights</strong>
-                            <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Configure model influence</p>
-                        </div>
-                        
-                        <div style="background: rgba(102, 126, 234, 0.1); border: 1px solid #667eea; border-radius: 10px; padding: 20px; text-align: center;">
-                            <div style="font-size: 2em; margin-bottom: 10px;">📊</div>
-                            <strong style="color: #e2e8f0;">4. Get Results</strong>
-                            <p style="color: #cbd5e1; margin-top: 8px; font-size: 0.9rem;">Confidence scores and analysis</p>
-                        </div>
-                    </div>
-                    
-                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin-top: 20px;">
-                        <div style="background: rgba(139, 92, 246, 0.1); border: 1px solid #8b5cf6; border-radius: 10px; padding: 20px;">
-                            <div style="color: #8b5cf6; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">🧠 Detection Technology:</div>
-                            <div style="color: #c4b5fd; font-size: 0.9rem; line-height: 1.6;">
-                                • <strong>ResNet Inception:</strong> Advanced convolutional neural network for deep feature extraction<br/>
-                                • <strong>EfficientNet:</strong> Optimized architecture balancing accuracy and efficiency<br/>
-                                • <strong>Ensemble Learning:</strong> Combines multiple models with weighted averaging for improved reliability
-                            </div>
-                        </div>
-                        
-                        <div style="background: rgba(16, 185, 129, 0.1); border: 1px solid #10b981; border-radius: 10px; padding: 20px;">
-                            <div style="color: #10b981; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">⚖️ Weight Configuration:</div>
-                            <div style="color: #a7f3d0; font-size: 0.9rem; line-height: 1.6;">
-                                • <strong>Equal Weights (0.5, 0.5):</strong> Balanced approach, recommended for most cases<br/>
-                                • <strong>ResNet Heavy (0.7, 0.3):</strong> Emphasizes deep feature analysis<br/>
-                                • <strong>EfficientNet Heavy (0.3, 0.7):</strong> Prioritizes efficiency and speed<br/>
-                                • <strong>Custom Weights:</strong> Fine-tune based on your specific needs
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <div style="background: rgba(245, 158, 11, 0.1); border: 1px solid #f59e0b; border-radius: 10px; padding: 20px; margin-top: 20px;">
-                        <div style="color: #f59e0b; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">⚡ Performance Tips:</div>
-                        <div style="color: #fcd34d; font-size: 0.9rem; line-height: 1.6;">
-                            • Use ensemble method with equal weights (0.5, 0.5) for best overall accuracy<br/>
-                            • Individual analysis is useful for understanding model-specific strengths<br/>
-                            • Higher resolution media generally provides better detection accuracy<br/>
-                            • For videos, ensure faces are clearly visible throughout the clip
-                        </div>
-                    </div>
-                    
-                    <div style="background: rgba(239, 68, 68, 0.1); border: 1px solid #ef4444; border-radius: 10px; padding: 20px; margin-top: 20px;">
-                        <div style="color: #ef4444; font-weight: 600; margin-bottom: 15px; font-size: 1.1rem;">⚠️ Important Considerations:</div>
-                        <div style="color: #fca5a5; font-size: 0.9rem; line-height: 1.6;">
-                            • This tool is for educational and research purposes<br/>
-                            • Results should be interpreted by qualified professionals<br/>
-                            • False positives/negatives are possible with any AI system<br/>
-                            • Always consider ethical implications when using deepfake detection
-                        </div>
-                    </div>
-                    """
-                )
+                gr.HTML(_GUIDE_HTML)
 
         # Event handlers
         detect_btn.click(
@@ -353,7 +541,7 @@ def create_interface():
                 efficientnet_weight,
             ],
             outputs=[results_text],
-            show_progress=True,
+            show_progress="minimal",
         )
 
     return interface
@@ -361,6 +549,9 @@ def create_interface():
 
 if __name__ == "__main__":
     interface = create_interface()
+    # Concurrent requests share the cached, already-loaded pipelines; each
+    # pipeline runs one request at a time and every request has its own folder
+    interface.queue(default_concurrency_limit=4, max_size=32)
     interface.launch(
         server_name="0.0.0.0",
         server_port=7862,
@@ -4,21 +4,193 @@ Minimal Face Detection App
 A simple Gradio interface for face detection using multiple models.
 """
 
+import functools
 import os
-from typing import Tuple
+import shutil
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import gradio as gr
 from config_loader import design_config
 
+from mukh.core.types import FaceDetection
 from mukh.face_detection import FaceDetector
+from mukh.face_detection.models.base_detector import BaseFaceDetector
 
+# Detectors keyed by model name, shared across requests
+_DETECTOR_CACHE: Dict[str, BaseFaceDetector] = {}
+_DETECTOR_CACHE_LOCK = threading.Lock()
 
-def detect_faces(image_path: str, detection_model: str) -> Tuple[str, str, str]:
+# One inference at a time per detector, so concurrent requests queue up instead
+# of oversubscribing the device or sharing a MediaPipe graph across threads
+_DETECTOR_LOCKS: Dict[str, threading.Lock] = {}
+
+# Models offered in the interface, in display order
+_DETECTION_MODELS = ["blazeface", "mediapipe", "ultralight"]
+
+# Models backed by PyTorch that accept a device argument
+_TORCH_MODELS = frozenset({"blazeface", "ultralight"})
+
+
+@functools.lru_cache(maxsize=1)
+def _default_device() -> str:
+    """Pick the inference device once per process.
+
+    Returns:
+        'cuda' if a GPU is available, otherwise 'cpu'
+    """
+    import torch
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def get_detector(detection_model: str) -> BaseFaceDetector:
+    """Get a cached face detector, creating it on first use.
+
+    Detectors keep their model loaded, so reusing them avoids reloading
+    weights on every request.
+
+    Args:
+        detection_model: Name of the detection model
+
+    Returns:
+        Face detector instance for the model
+    """
+    with _DETECTOR_CACHE_LOCK:
+        detector = _DETECTOR_CACHE.get(detection_model)
+        if detector is None:
+            if detection_model in _TORCH_MODELS:
+                detector = FaceDetector.create(
+                    detection_model, device=_default_device()
+                )
+            else:
+                detector = FaceDetector.create(detection_model)
+            _DETECTOR_CACHE[detection_model] = detector
+            _DETECTOR_LOCKS[detection_model] = threading.Lock()
+    return detector
+
+
+def prewarm_detectors(detection_models: Iterable[str]) -> None:
+    """Load detectors and run one dummy detection with each.
+
+    Meant to run in a background thread at startup, so the first request does
+    not pay for downloading weights, loading the model and initializing the
+    device. Failures are only printed; requests report them as usual.
+
+    Args:
+        detection_models: Names of the detection models to warm up
+    """
+    import cv2
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as warmup_folder:
+        warmup_path = os.path.join(warmup_folder, "warmup.jpg")
+        cv2.imwrite(warmup_path, np.zeros((640, 640, 3), dtype=np.uint8))
+
+        for detection_model in detection_models:
+            try:
+                detector = get_detector(detection_model)
+                with _DETECTOR_LOCKS[detection_model]:
+                    detector.detect(
+                        image_path=warmup_path, save_json=False, save_annotated=False
+                    )
+            except Exception as e:
+                print(f"Warm-up failed for {detection_model}: {str(e)}")
+
+
+def _request_folder(detection_model: str) -> str:
+    """Create the output folder for a single request.
+
+    Every request gets its own folder, because batched requests are only read
+    back once the whole batch has returned. It is removed again by
+    remove_request_folder once Gradio has copied the results.
+
+    Args:
+        detection_model: Model used for the request
+
+    Returns:
+        Path to the new, empty folder
+    """
+    model_folder = os.path.join("output", "face_detection", detection_model)
+    os.makedirs(model_folder, exist_ok=True)
+    return tempfile.mkdtemp(dir=model_folder)
+
+
+def remove_request_folder(output_folder: Optional[str]) -> None:
+    """Delete a request's output folder after its results have been served.
+
+    Gradio copies returned files into its own cache before the event
+    completes, so the folder is no longer needed at this point.
+
+    Args:
+        output_folder: Folder created by _request_folder, or None
+    """
+    if output_folder:
+        shutil.rmtree(output_folder, ignore_errors=True)
+
+
+def _detection_results(
+    image_path: str,
+    detection_model: str,
+    detections: List[FaceDetection],
+    output_folder: str,
+) -> Tuple[str, str, str]:
+    """Build a request's outputs from the files saved in its folder.
+
+    Args:
+        image_path: Path to the input image
+        detection_model: Model used for detection
+        detections: Faces detected in the image
+        output_folder: Folder holding the annotated image and detections.json
+
+    Returns:
+        Tuple of (annotated_image_path, json_path, results_text)
+    """
+    # Find annotated image - face detectors save with '_detected' suffix
+    image_name = os.path.basename(image_path)
+    name, ext = os.path.splitext(image_name)
+    annotated_path = os.path.join(output_folder, f"{name}_detected{ext}")
+
+    # Create detailed results text, joined once rather than grown per face
+    results_parts = [
+        "✅ Detection Completed Successfully\n\n",
+        f"🔍 Model Used: {detection_model.title()}\n",
+        f"📊 Faces Found: {len(detections)}\n\n",
+    ]
+
+    if detections:
+        results_parts.append("📋 Detection Details:\n")
+        for i, detection in enumerate(detections, 1):
+            bbox = detection.bbox
+            x1, y1, x2, y2 = bbox.x1, bbox.y1, bbox.x2, bbox.y2
+            results_parts.append(
+                f"\nFace {i}:\n"
+                f"  • Confidence: {bbox.confidence:.3f}\n"
+                f"  • Coordinates: ({x1}, {y1}) → ({x2}, {y2})\n"
+                f"  • Size: {x2 - x1} × {y2 - y1} pixels\n"
+            )
+    else:
+        results_parts.append("ℹ️ No faces were detected in the image.")
+
+    # The JSON write raises on failure, but cv2.imwrite only reports it
+    # through its return value, so only the annotated image is checked
+    return (
+        annotated_path if os.path.isfile(annotated_path) else None,
+        os.path.join(output_folder, "detections.json"),
+        "".join(results_parts),
+    )
+
+
+def detect_faces(
+    image_path: str, detection_model: str, output_folder: str
+) -> Tuple[str, str, str]:
     """Detect faces in an image using the specified model.
 
     Args:
         image_path: Path to the input image
         detection_model: Model to use for detection
+        output_folder: Folder where the annotated image and JSON are saved
 
     Returns:
         Tuple of (annotated_image_path, json_path, results_text)
@@ -27,52 +199,122 @@ def detect_faces(image_path: str, detection_model: str) -> Tuple[str, str, str]:
         if not image_path or not os.path.exists(image_path):
             return None, None, "❌ Error: No valid image provided"
 
-        # Create detector
-        detector = FaceDetector.create(detection_model)
-
-        # Set output paths
-        output_folder = os.path.join("output", "face_detection", detection_model)
-        json_path = os.path.join(output_folder, "detections.json")
+        detector = get_detector(detection_model)
 
         # Detect faces
-        detections = detector.detect(
-            image_path=image_path,
-            save_json=True,
-            json_path=json_path,
-            save_annotated=True,
-            output_folder=output_folder,
-        )
-
-        # Find annotated image - face detectors save with '_detected' suffix
-        image_name = os.path.basename(image_path)
-        name, ext = os.path.splitext(image_name)
-        annotated_path = os.path.join(output_folder, f"{name}_detected{ext}")
-
-        # Create detailed results text
-        results_text = f"✅ Detection Completed Successfully\n\n"
-        results_text += f"🔍 Model Used: {detection_model.title()}\n"
-        results_text += f"📊 Faces Found: {len(detections)}\n\n"
-
-        if detections:
-            results_text += "📋 Detection Details:\n"
-            for i, detection in enumerate(detections, 1):
-                results_text += f"\nFace {i}:\n"
-                results_text += f"  • Confidence: {detection.bbox.confidence:.3f}\n"
-                results_text += f"  • Coordinates: ({detection.bbox.x1}, {detection.bbox.y1}) → ({detection.bbox.x2}, {detection.bbox.y2})\n"
-                results_text += f"  • Size: {detection.bbox.x2 - detection.bbox.x1} × {detection.bbox.y2 - detection.bbox.y1} pixels\n"
-        else:
-            results_text += "ℹ️ No faces were detected in the image."
-
-        return (
-            annotated_path if os.path.exists(annotated_path) else None,
-            json_path if os.path.exists(json_path) else None,
-            results_text,
+        with _DETECTOR_LOCKS[detection_model]:
+            detections = detector.detect(
+                image_path=image_path,
+                save_json=True,
+                json_path=os.path.join(output_folder, "detections.json"),
+                save_annotated=True,
+                output_folder=output_folder,
+            )
+
+        return _detection_results(
+            image_path, detection_model, detections, output_folder
         )
 
     except Exception as e:
         return None, None, f"❌ Error: {str(e)}"
 
 
+def _detect_faces_stacked(
+    image_paths: List[str], detection_model: str, output_folders: List[str]
+) -> List[Tuple[str, str, str]]:
+    """Detect faces in several requests' images with batched inference.
+
+    Args:
+        image_paths: Paths to the input images
+        detection_model: Model to use, one that supports batching
+        output_folders: Output folder of each request
+
+    Returns:
+        One (annotated_image_path, json_path, results_text) tuple per image
+    """
+    detector = get_detector(detection_model)
+    with _DETECTOR_LOCKS[detection_model]:
+        batch_detections = detector.detect_batch(image_paths)
+
+    results = []
+    for image_path, detections, output_folder in zip(
+        image_paths, batch_detections, output_folders
+    ):
+        try:
+            detector._save_detections_to_json(
+                detections, image_path, os.path.join(output_folder, "detections.json")
+            )
+            detector._save_annotated_image(
+                detector._load_image(image_path), detections, image_path, output_folder
+            )
+            results.append(
+                _detection_results(
+                    image_path, detection_model, detections, output_folder
+                )
+            )
+        except Exception as e:
+            results.append((None, None, f"❌ Error: {str(e)}"))
+    return results
+
+
+def detect_faces_batch(
+    image_paths: List[str], detection_models: List[str]
+) -> Tuple[List[str], List[str], List[str], List[str]]:
+    """Detect faces for a batch of queued requests.
+
+    Gradio collects pending requests and passes their inputs as lists. Requests
+    for a model with batched inference share one forward pass; MediaPipe
+    requests are processed one at a time.
+
+    Args:
+        image_paths: Paths to the input images, one per request
+        detection_models: Model to use for each request
+
+    Returns:
+        Tuple of (annotated_image_paths, json_paths, results_texts,
+        output_folders) lists
+    """
+    output_folders = [_request_folder(model) for model in detection_models]
+    results = [None] * len(image_paths)
+
+    # Group the requests by model, keeping their positions in the batch
+    requests_by_model: Dict[str, List[int]] = {}
+    for i, (image_path, detection_model) in enumerate(
+        zip(image_paths, detection_models)
+    ):
+        if not image_path or not os.path.exists(image_path):
+            results[i] = (None, None, "❌ Error: No valid image provided")
+        else:
+            requests_by_model.setdefault(detection_model, []).append(i)
+
+    for detection_model, indices in requests_by_model.items():
+        try:
+            stacked = (
+                len(indices) > 1 and get_detector(detection_model).supports_batching
+            )
+            if stacked:
+                for i, result in zip(
+                    indices,
+                    _detect_faces_stacked(
+                        [image_paths[i] for i in indices],
+                        detection_model,
+                        [output_folders[i] for i in indices],
+                    ),
+                ):
+                    results[i] = result
+        except Exception:
+            # Rerun the requests one by one so each reports its own error
+            stacked = False
+        if not stacked:
+            for i in indices:
+                results[i] = detect_faces(
+                    image_paths[i], detection_model, output_folders[i]
+                )
+
+    annotated_paths, json_paths, results_texts = map(list, zip(*results))
+    return annotated_paths, json_paths, results_texts, output_folders
+
+
 def create_interface():
     """Create the Gradio interface for face detection."""
 
@@ -153,7 +395,7 @@ def create_interface():
                 )
 
                 detection_model = gr.Radio(
-                    choices=["blazeface", "mediapipe", "ultralight"],
+                    choices=_DETECTION_MODELS,
                     value="mediapipe",
                     label="🤖 Detection Model",
                     info="Choose the AI model for face detection",
@@ -242,18 +484,28 @@ def create_interface():
                     """
                 )
 
+        # Output folder of the last request, removed once its results are served
+        request_folder = gr.State()
+
         # Event handlers
         detect_btn.click(
-            fn=detect_faces,
+            fn=detect_faces_batch,
             inputs=[input_image, detection_model],
-            outputs=[output_image, json_file, results_text],
+            outputs=[output_image, json_file, results_text, request_folder],
             show_progress=True,
-        )
+            batch=True,
+            max_batch_size=8,
+        ).then(fn=remove_request_folder, inputs=request_folder)
 
     return interface
 
 
 if __name__ == "__main__":
+    # Load models while the interface starts instead of on the first click
+    threading.Thread(
+        target=prewarm_detectors, args=(_DETECTION_MODELS,), daemon=True
+    ).start()
+
     interface = create_interface()
     interface.launch(
         server_name="0.0.0.0",
@@ -5,12 +5,59 @@ A simple Gradio interface for face reenactment using TPS model.
 """
 
 import os
-from typing import Tuple
+import threading
+from typing import Dict, Iterable, Tuple
 
 import gradio as gr
 from config_loader import design_config
 
 from mukh.reenactment import FaceReenactor
+from mukh.reenactment.models.base_reenactor import BaseFaceReenactor
+
+# Reenactors keyed by model name, shared across requests
+_REENACTOR_CACHE: Dict[str, BaseFaceReenactor] = {}
+_REENACTOR_CACHE_LOCK = threading.Lock()
+
+# One reenactment at a time per reenactor, so concurrent requests queue up
+# instead of oversubscribing the device
+_REENACTOR_LOCKS: Dict[str, threading.Lock] = {}
+
+
+def get_reenactor(reenactment_model: str) -> BaseFaceReenactor:
+    """Get a cached face reenactor, creating it on first use.
+
+    Reenactors keep their networks loaded, so reusing them avoids downloading
+    and reloading checkpoints on every request.
+
+    Args:
+        reenactment_model: Name of the reenactment model
+
+    Returns:
+        Face reenactor instance for the model
+    """
+    with _REENACTOR_CACHE_LOCK:
+        reenactor = _REENACTOR_CACHE.get(reenactment_model)
+        if reenactor is None:
+            reenactor = FaceReenactor.create(reenactment_model)
+            _REENACTOR_CACHE[reenactment_model] = reenactor
+            _REENACTOR_LOCKS[reenactment_model] = threading.Lock()
+    return reenactor
+
+
+def prewarm_reenactors(reenactment_models: Iterable[str]) -> None:
+    """Download and load reenactors ahead of the first request.
+
+    Meant to run in a background thread at startup. Failures are only
+    printed; requests report them as usual.
+
+    Args:
+        reenactment_models: Names of the reenactment models to load
+    """
+    for reenactment_model in reenactment_models:
+        try:
+            get_reenactor(reenactment_model)
+        except Exception as e:
+            print(f"Warm-up failed for {reenactment_model}: {str(e)}")
 
 
 def reenact_face(
@@ -33,20 +80,19 @@ def reenact_face(
         if not driving_video_path or not os.path.exists(driving_video_path):
             return None, None, "❌ Error: No valid driving video provided"
 
-        # Create reenactor
-        reenactor = FaceReenactor.create(reenactment_model)
+        reenactor = get_reenactor(reenactment_model)
 
-        # Set output paths
+        # Set output paths (the reenactor creates the folder)
         output_folder = os.path.join("output", "face_reenactment", reenactment_model)
-        os.makedirs(output_folder, exist_ok=True)
 
         # Perform reenactment with comparison video
-        output_video_path = reenactor.reenact_from_video(
-            source_path=source_image_path,
-            driving_video_path=driving_video_path,
-            output_path=output_folder,
-            save_comparison=True,
-        )
+        with _REENACTOR_LOCKS[reenactment_model]:
+            output_video_path = reenactor.reenact_from_video(
+                source_path=source_image_path,
+                driving_video_path=driving_video_path,
+                output_path=output_folder,
+                save_comparison=True,
+            )
 
         # Generate comparison video path
         source_name = os.path.splitext(os.path.basename(source_image_path))[0]
@@ -55,30 +101,23 @@ def reenact_face(
             output_folder, f"comparison_{source_name}_by_{driving_name}.mp4"
         )
 
-        # Create detailed results text
-        if output_video_path and os.path.exists(output_video_path):
-            results_text = "✅ Reenactment Completed Successfully\n\n"
-            results_text += f"🎬 Model Used: {reenactment_model.upper()}\n"
-            results_text += f"📁 Output Location: {output_video_path}\n"
-            results_text += f"📊 Source Image: {os.path.basename(source_image_path)}\n"
-            results_text += (
-                f"🎥 Driving Video: {os.path.basename(driving_video_path)}\n\n"
-            )
-            results_text += "🎯 Process Details:\n"
-            results_text += "  • Motion extraction from driving video\n"
-            results_text += "  • Face alignment and warping\n"
-            results_text += "  • TPS (Thin Plate Spline) transformation\n"
-            results_text += "  • High-quality video generation\n"
-            results_text += "  • Side-by-side comparison video created\n\n"
-            results_text += "💾 Output: Ready for download and viewing\n"
-            results_text += f"🔄 Comparison Video: {comparison_video_path}"
-
-            # Check if comparison video exists
-            if not os.path.exists(comparison_video_path):
-                comparison_video_path = None
-        else:
-            results_text = "❌ Error: Reenactment failed to generate output video"
-            comparison_video_path = None
+        # The reenactor raises if either video cannot be written, so both
+        # paths exist here without checking them again
+        results_text = (
+            "✅ Reenactment Completed Successfully\n\n"
+            f"🎬 Model Used: {reenactment_model.upper()}\n"
+            f"📁 Output Location: {output_video_path}\n"
+            f"📊 Source Image: {os.path.basename(source_image_path)}\n"
+            f"🎥 Driving Video: {os.path.basename(driving_video_path)}\n\n"
+            "🎯 Process Details:\n"
+            "  • Motion extraction from driving video\n"
+            "  • Face alignment and warping\n"
+            "  • TPS (Thin Plate Spline) transformation\n"
+            "  • High-quality video generation\n"
+            "  • Side-by-side comparison video created\n\n"
+            "💾 Output: Ready for download and viewing\n"
+            f"🔄 Comparison Video: {comparison_video_path}"
+        )
 
         return output_video_path, comparison_video_path, results_text
 
@@ -276,6 +315,9 @@ def create_interface():
 
 
 if __name__ == "__main__":
+    # Load the model while the interface starts instead of on the first click
+    threading.Thread(target=prewarm_reenactors, args=(["tps"],), daemon=True).start()
+
     interface = create_interface()
     interface.launch(
         server_name="0.0.0.0",
@@ -4,6 +4,10 @@ It uses the  multiprocessing to detect faces in all images in the folder.
 It also saves the detections to a JSON file and annotated images to a folder.
 By default it runs sequentially by using num_processes=0.
 If you want to run it in parallel, you can set num_processes to the number of processes you want to use.
+Alternatively, set num_threads to share a single loaded model across threads instead of
+loading one model per process.
+BlazeFace and UltraLight can instead run --batch_size images per forward pass
+in a single process.
 
 Use mukh.utils.parallel.get_cpu_count() to get the number of CPU cores available.
 
@@ -66,6 +70,18 @@ if __name__ == "__main__":
         default=0,
         help="Number of processes to use for parallel processing. Defaults to 0. Will run sequentially if set to 0.",
     )
+    parser.add_argument(
+        "--num_threads",
+        type=int,
+        default=0,
+        help="Number of threads sharing a single loaded model. Defaults to 0. Takes precedence over --num_processes.",
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=None,
+        help="Images per forward pass for models with batched inference (blazeface, ultralight). Defaults to None, which does not batch.",
+    )
 
     args = parser.parse_args()
 
@@ -84,6 +100,8 @@ if __name__ == "__main__":
         json_path=args.json_path,
         save_annotated=args.save_annotated,
         num_processes=args.num_processes,
+        num_threads=args.num_threads,
+        batch_size=args.batch_size,
         detector_model=args.detection_model,
     )
 
@@ -10,3 +10,12 @@ __all__ = [
     "reenactment",
     "pipelines",
 ]
+
+
+def __getattr__(name):
+    # Import subpackages on first access so ``import mukh`` stays cheap
+    if name in __all__:
+        import importlib
+
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
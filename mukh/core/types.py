@@ -10,7 +10,7 @@ from typing import List, Optional
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     """Represents a bounding box with coordinates and confidence score.
 
@@ -37,7 +37,7 @@ class BoundingBox:
         return self.y2 - self.y1
 
 
-@dataclass
+@dataclass(slots=True)
 class FaceDetection:
     """Represents a detected face with bounding box and optional landmarks.
 
@@ -49,6 +49,33 @@ class FaceDetection:
     bbox: BoundingBox
     landmarks: Optional[np.ndarray] = None
 
+    @staticmethod
+    def bboxes_to_array(detections: List["FaceDetection"]) -> np.ndarray:
+        """Stacks the bounding boxes of several detections into one array.
+
+        Args:
+            detections: Detections to convert.
+
+        Returns:
+            np.ndarray: Float32 array of shape (N, 5) with columns x1, y1, x2, y2
+                and confidence.
+        """
+        return np.fromiter(
+            (
+                value
+                for detection in detections
+                for value in (
+                    detection.bbox.x1,
+                    detection.bbox.y1,
+                    detection.bbox.x2,
+                    detection.bbox.y2,
+                    detection.bbox.confidence,
+                )
+            ),
+            dtype=np.float32,
+            count=5 * len(detections),
+        ).reshape(-1, 5)
+
 
 @dataclass
 class DeepfakeDetection:
@@ -4,15 +4,58 @@ This module provides the abstract base class that all deepfake detector implemen
 must inherit from, ensuring a consistent interface across different models.
 """
 
+import contextlib
 import csv
 import os
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 
 from ...core.types import DeepfakeDetection
+from ...utils.parallel import prefetch
+
+# Frame gaps up to this size are read forward instead of seeking, since a seek
+# re-decodes from the previous keyframe anyway
+_MAX_FORWARD_READ_GAP = 30
+
+# Sampled video frames shared by the detectors run inside share_video_frames(),
+# or None outside of it
+_FRAME_CACHE: ContextVar[Optional[Dict[tuple, List[Tuple[int, np.ndarray]]]]] = (
+    ContextVar("_FRAME_CACHE", default=None)
+)
+
+# Number of decoded frames buffered ahead of inference
+_FRAME_PREFETCH = 4
+
+
+def _frame_cache_key(video_path: str, num_frames: int) -> Optional[tuple]:
+    """Builds the frame cache key for a video, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(video_path)
+    except OSError:
+        return None
+    return (os.path.abspath(video_path), stat.st_mtime_ns, stat.st_size, num_frames)
+
+
+@contextlib.contextmanager
+def share_video_frames() -> Iterator[None]:
+    """Shares sampled video frames between the detectors run inside the block.
+
+    Models analysing the same video then decode it only once. The frames are
+    released when the block exits, and blocks on other threads do not see them.
+    """
+    if _FRAME_CACHE.get() is not None:
+        yield
+        return
+
+    token = _FRAME_CACHE.set({})
+    try:
+        yield
+    finally:
+        _FRAME_CACHE.reset(token)
 
 
 class BaseDeepfakeDetector(ABC):
@@ -377,46 +420,115 @@ class BaseDeepfakeDetector(ABC):
         Raises:
             ValueError: If the video cannot be loaded or has insufficient frames.
         """
-        cap = self._load_video(video_path)
+        return list(self._iter_equally_spaced_frames(video_path, num_frames))
 
-        # Get total number of frames
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    def _iter_equally_spaced_frames(
+        self, video_path: str, num_frames: int = 11
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yields equally spaced frames from a video while decoding ahead.
 
-        if total_frames < num_frames:
-            cap.release()
-            raise ValueError(
-                f"Video has only {total_frames} frames, cannot extract {num_frames} frames"
-            )
+        Frames are decoded on a background thread so that decoding overlaps
+        with whatever the caller does per frame. Inside share_video_frames()
+        they are cached per video file and frame count, so every model in an
+        ensemble reuses the same decoded frames. The yielded frames must not be
+        modified in place.
 
-        # Calculate frame indices to extract
-        if num_frames == 1:
-            frame_indices = [total_frames // 2]  # Middle frame
-        else:
-            # Equally space frames across the video
-            frame_indices = [
-                int(i * (total_frames - 1) / (num_frames - 1))
-                for i in range(num_frames)
-            ]
+        Args:
+            video_path: Path to the video file.
+            num_frames: Number of frames to extract (default: 11).
 
-        extracted_frames = []
+        Yields:
+            Tuples of (frame_number, frame_array) in frame order.
 
-        for frame_idx in frame_indices:
-            # Set video position to the desired frame
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-            ret, frame = cap.read()
+        Raises:
+            ValueError: If the video cannot be loaded or has insufficient frames.
+        """
+        cache = _FRAME_CACHE.get()
+        key = _frame_cache_key(video_path, num_frames) if cache is not None else None
+        if key is not None and key in cache:
+            yield from cache[key]
+            return
+
+        # Frames are only kept for the cache; otherwise each is freed once used
+        frames = []
+        num_decoded = 0
+        for frame_number, frame in prefetch(
+            self._decode_equally_spaced_frames(video_path, num_frames),
+            size=_FRAME_PREFETCH,
+        ):
+            num_decoded += 1
+            if key is not None:
+                frames.append((frame_number, frame))
+            yield frame_number, frame
+
+        if not num_decoded:
+            raise ValueError("Could not extract any frames from the video")
 
-            if ret:
-                extracted_frames.append((frame_idx, frame))
-            else:
-                # If we can't read the frame, skip it
-                continue
+        if key is not None:
+            cache[key] = frames
 
-        cap.release()
+    def _decode_equally_spaced_frames(
+        self, video_path: str, num_frames: int
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Decodes equally spaced frames from a video.
 
-        if not extracted_frames:
-            raise ValueError("Could not extract any frames from the video")
+        Args:
+            video_path: Path to the video file.
+            num_frames: Number of frames to extract.
+
+        Yields:
+            Tuples of (frame_number, frame_array); unreadable frames are skipped.
 
-        return extracted_frames
+        Raises:
+            ValueError: If the video cannot be loaded or has insufficient frames.
+        """
+        cap = self._load_video(video_path)
+
+        try:
+            # Get total number of frames
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+            if total_frames < num_frames:
+                raise ValueError(
+                    f"Video has only {total_frames} frames, cannot extract {num_frames} frames"
+                )
+
+            # Calculate frame indices to extract
+            if num_frames == 1:
+                frame_indices = [total_frames // 2]  # Middle frame
+            else:
+                # Equally space frames across the video
+                frame_indices = [
+                    int(i * (total_frames - 1) / (num_frames - 1))
+                    for i in range(num_frames)
+                ]
+
+            # Frame the next cap.read() would return, or None if unknown
+            next_frame_idx = 0
+
+            for frame_idx in frame_indices:
+                positioned = False
+                if (
+                    next_frame_idx is not None
+                    and 0 <= frame_idx - next_frame_idx <= _MAX_FORWARD_READ_GAP
+                ):
+                    # Nearby frame: skip ahead without converting the skipped frames
+                    positioned = all(
+                        cap.grab() for _ in range(frame_idx - next_frame_idx)
+                    )
+                if not positioned:
+                    # Set video position to the desired frame
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+                ret, frame = cap.read()
+
+                # If we can't read the frame, skip it and seek to the next one
+                if ret:
+                    next_frame_idx = frame_idx + 1
+                    yield frame_idx, frame
+                else:
+                    next_frame_idx = None
+        finally:
+            cap.release()
 
     def aggregate_video_detections(
         self,
@@ -275,12 +275,12 @@ class EfficientNetDetector(BaseDeepfakeDetector):
         Returns:
             List of DeepfakeDetection objects for analyzed frames
         """
-        # Extract equally spaced frames
-        extracted_frames = self._extract_equally_spaced_frames(video_path, num_frames)
-
         detections = []
 
-        for frame_number, frame in extracted_frames:
+        # Equally spaced frames are decoded ahead while the model runs
+        for frame_number, frame in self._iter_equally_spaced_frames(
+            video_path, num_frames
+        ):
             try:
                 # Preprocess frame
                 input_tensor = self._preprocess_image(frame)
@@ -290,8 +290,10 @@ def aggregate(
     policy: str,
     post_mult: float,
     clipmargin: float,
-    params={},
+    params=None,
 ):
+    if params is None:
+        params = {}
     x = x.copy()
     if deadzone > 0:
         x = x[(x > deadzone) | (x < -deadzone)]
@@ -174,12 +174,12 @@ class ResNetInceptionDetector(BaseDeepfakeDetector):
         Returns:
             List of DeepfakeDetection objects for analyzed frames
         """
-        # Extract equally spaced frames
-        extracted_frames = self._extract_equally_spaced_frames(video_path, num_frames)
-
         detections = []
 
-        for frame_number, frame in extracted_frames:
+        # Equally spaced frames are decoded ahead while the model runs
+        for frame_number, frame in self._iter_equally_spaced_frames(
+            video_path, num_frames
+        ):
             try:
                 # Convert frame to PIL Image
                 frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
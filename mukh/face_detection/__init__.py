@@ -1 +1,11 @@
-from .face_detector import FaceDetector
+__all__ = ["FaceDetector"]
+
+
+def __getattr__(name):
+    # Import the factory, and with it every detector, only when it is used so
+    # worker processes can import a single detector module cheaply
+    if name == "FaceDetector":
+        from .face_detector import FaceDetector
+
+        return FaceDetector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
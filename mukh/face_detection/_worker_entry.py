@@ -0,0 +1,51 @@
+"""Detector registry and construction, shared by FaceDetector and worker processes.
+
+Importing every detector would import every framework (torch, MediaPipe) up
+front. Worker processes only run one detector, so the requested detector class
+is imported on first use.
+"""
+
+import importlib
+from typing import Dict, Tuple
+
+from .models.base_detector import BaseFaceDetector
+
+# Detector name -> (module, class name); the single registry of detectors
+DETECTOR_CLASSES: Dict[str, Tuple[str, str]] = {
+    "blazeface": (
+        "mukh.face_detection.models.blazeface.blazeface_detector",
+        "BlazeFaceDetector",
+    ),
+    "mediapipe": (
+        "mukh.face_detection.models.mediapipe.mediapipe_detector",
+        "MediaPipeFaceDetector",
+    ),
+    "ultralight": (
+        "mukh.face_detection.models.ultralight.ultralight_detector",
+        "UltralightDetector",
+    ),
+}
+
+
+def make_detector(name: str, **kwargs) -> BaseFaceDetector:
+    """Creates a detector, importing only the module that defines it.
+
+    Args:
+        name: The detector model type, one of the keys of ``DETECTOR_CLASSES``.
+        **kwargs: Additional model-specific parameters.
+
+    Returns:
+        A BaseFaceDetector instance of the requested type.
+
+    Raises:
+        ValueError: If the specified model type is not supported.
+    """
+    if name not in DETECTOR_CLASSES:
+        raise ValueError(
+            f"Unknown detector model: {name}. "
+            f"Available models: {list(DETECTOR_CLASSES.keys())}"
+        )
+
+    module_name, class_name = DETECTOR_CLASSES[name]
+    detector_class = getattr(importlib.import_module(module_name), class_name)
+    return detector_class(**kwargs)
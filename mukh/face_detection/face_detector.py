@@ -19,10 +19,8 @@ Example:
 
 from typing import List, Literal
 
+from ._worker_entry import DETECTOR_CLASSES, make_detector
 from .models.base_detector import BaseFaceDetector
-from .models.blazeface import BlazeFaceDetector
-from .models.mediapipe import MediaPipeFaceDetector
-from .models.ultralight import UltralightDetector
 
 DetectorType = Literal["blazeface", "mediapipe", "ultralight"]
 
@@ -35,12 +33,15 @@ class FaceDetector:
     """
 
     @staticmethod
-    def create(model: DetectorType) -> BaseFaceDetector:
+    def create(model: DetectorType, **kwargs) -> BaseFaceDetector:
         """Creates a face detector instance of the specified type.
 
         Args:
             model: The type of detector to create. Must be one of: "blazeface",
                 "mediapipe", or "ultralight".
+            **kwargs: Additional model-specific parameters, such as ``device``
+                ('cpu', 'cuda') and ``compile_model`` for the "blazeface" and
+                "ultralight" models.
 
         Returns:
             A BaseFaceDetector instance of the requested type.
@@ -48,19 +49,7 @@ class FaceDetector:
         Raises:
             ValueError: If the specified model type is not supported.
         """
-        detectors = {
-            "blazeface": BlazeFaceDetector,
-            "mediapipe": MediaPipeFaceDetector,
-            "ultralight": UltralightDetector,
-        }
-
-        if model not in detectors:
-            raise ValueError(
-                f"Unknown detector model: {model}. "
-                f"Available models: {list(detectors.keys())}"
-            )
-
-        return detectors[model]()
+        return make_detector(model, **kwargs)
 
     @staticmethod
     def list_available_models() -> List[str]:
@@ -69,4 +58,4 @@ class FaceDetector:
         Returns:
             List of strings containing supported model names.
         """
-        return ["blazeface", "mediapipe", "ultralight"]
+        return list(DETECTOR_CLASSES)
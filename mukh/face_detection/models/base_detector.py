@@ -5,18 +5,106 @@ must inherit from, ensuring a consistent interface across different models.
 """
 
 import json
+import multiprocessing
+import operator
 import os
 import platform
 import warnings
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
 from functools import partial
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 from tqdm import tqdm
 
-from ...core.types import FaceDetection
+from ...core.types import BoundingBox, FaceDetection
+from ...utils.image import read_reduced_image
+
+try:
+    import orjson
+
+    def _dumps_line(item: dict) -> bytes:
+        return orjson.dumps(
+            item, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+except ImportError:
+
+    def _dumps_line(item: dict) -> bytes:
+        return (json.dumps(item, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+# Keys of the per-detection dictionaries, and a getter for their bbox values
+_ROW_KEYS = ("image_name", "x1", "y1", "x2", "y2", "confidence")
+_bbox_values = operator.attrgetter("x1", "y1", "x2", "y2", "confidence")
+
+# Drawing settings for annotated images
+_DRAW_COLOR = (0, 255, 0)
+_LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_LABEL_SCALE = 0.7
+
+# JPEG settings for annotated images: quality 85 encodes noticeably faster and
+# smaller than OpenCV's default of 95, and the Huffman optimization pass is off
+_ANNOTATED_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+
+# Images per worker process below which starting the process costs more than
+# it saves (~0.5 s worker startup and model load vs ~50 ms per image)
+_IMAGES_PER_PROCESS = 10
+
+# Number of images decoded ahead of the detector in the sequential path
+_IMAGE_PREFETCH = 8
+
+# Detector shared by all tasks of a batch worker process, see _init_batch_worker
+_WORKER_DETECTOR = None
+
+# Whether the forkserver preload has been set, see _preload_forkserver
+_FORKSERVER_PRELOADED = False
+
+
+def _preload_forkserver(detector_model: str) -> None:
+    """Makes the forkserver import this module and the detector's module.
+
+    The preload only takes effect when the server starts, so it is set once per
+    process; later calls are ignored.
+
+    Args:
+        detector_model: The detector model type the workers will create.
+    """
+    global _FORKSERVER_PRELOADED
+
+    if _FORKSERVER_PRELOADED:
+        return
+
+    from .._worker_entry import DETECTOR_CLASSES
+
+    preload = [__name__]
+    if detector_model in DETECTOR_CLASSES:
+        preload.append(DETECTOR_CLASSES[detector_model][0])
+    multiprocessing.get_context("forkserver").set_forkserver_preload(preload)
+    _FORKSERVER_PRELOADED = True
+
+
+def _init_batch_worker(detector_class_name: str, detector_kwargs: dict) -> None:
+    """Initializer for batch worker processes - loads the detector once per process.
+
+    Args:
+        detector_class_name: The detector model type to create.
+        detector_kwargs: Keyword arguments passed to ``FaceDetector.create``.
+    """
+    global _WORKER_DETECTOR
+
+    try:
+        # Import here to avoid circular imports; only the requested detector's
+        # module is imported, not every detector and its framework
+        from .._worker_entry import make_detector
+
+        _WORKER_DETECTOR = make_detector(detector_class_name, **detector_kwargs)
+    except Exception as e:
+        # Leave the error to be reported per image rather than killing the pool
+        print(f"Error initializing {detector_class_name} detector: {str(e)}")
 
 
 def _process_single_image_for_batch_worker(args_tuple: tuple) -> List[dict]:
@@ -38,52 +126,163 @@ def _process_single_image_for_batch_worker(args_tuple: tuple) -> List[dict]:
         detector_kwargs,
     ) = args_tuple
 
-    try:
-        # Import the detector factory here to avoid circular imports
-        from .. import FaceDetector
+    # Reuse the detector loaded by the process initializer
+    if _WORKER_DETECTOR is None:
+        _init_batch_worker(detector_class_name, detector_kwargs)
+    if _WORKER_DETECTOR is None:
+        print(
+            f"Error processing {image_filename}: "
+            f"Could not create {detector_class_name} detector"
+        )
+        return []
 
-        # Create a new detector instance for this process
-        detector = FaceDetector.create(detector_class_name)
+    # Same per-image detection, error handling and row conversion as in-process
+    return _WORKER_DETECTOR._detect_folder_image(
+        image_filename, images_folder, output_folder, save_annotated
+    )
 
-        # Construct paths
-        image_path = os.path.join(images_folder, image_filename)
 
-        # Set up output paths for annotated images if requested
-        if save_annotated:
-            image_output_folder = os.path.join(
-                output_folder, os.path.splitext(image_filename)[0]
-            )
-        else:
-            image_output_folder = output_folder
+def _progress_options(total: int) -> dict:
+    """Returns tqdm options that redraw the bar at most ~200 times and twice a second.
 
-        # Perform detection (without saving individual JSON files)
-        detections = detector.detect(
-            image_path=image_path,
-            save_json=False,  # Don't save individual JSON files
-            save_annotated=save_annotated,
-            output_folder=image_output_folder,
-        )
+    Args:
+        total: Number of items the bar tracks.
+    """
+    return {"mininterval": 0.5, "miniters": max(1, total // 200)}
 
-        # Convert detections to dictionary format for JSON serialization
-        detection_results = []
-        for detection in detections:
-            bbox = detection.bbox
-            detection_results.append(
-                {
-                    "image_name": image_filename,
-                    "x1": bbox.x1,
-                    "y1": bbox.y1,
-                    "x2": bbox.x2,
-                    "y2": bbox.y2,
-                    "confidence": bbox.confidence,
-                }
-            )
 
-        return detection_results
+def _progress(items: Iterable, total: int) -> tqdm:
+    """Wraps per-image results in a throttled progress bar.
 
-    except Exception as e:
-        print(f"Error processing {image_filename}: {str(e)}")
-        return []
+    Args:
+        items: Iterable of per-image results.
+        total: Number of images.
+    """
+    return tqdm(
+        items, total=total, desc="Processing images", **_progress_options(total)
+    )
+
+
+def _map_ahead(
+    executor: Executor, function: Callable, items: Iterable, window: int
+) -> Iterator:
+    """Maps ``function`` over ``items`` in order, keeping at most ``window`` calls in flight.
+
+    Unlike ``Executor.map`` this does not submit every item up front, so a slow
+    consumer does not cause all results to be held in memory at once.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(function, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+# Row layout of the structured array returned by detect_folder(return_detections="array")
+DETECTION_DTYPE = np.dtype(
+    [
+        ("image_name", object),
+        ("x1", np.int32),
+        ("y1", np.int32),
+        ("x2", np.int32),
+        ("y2", np.int32),
+        ("confidence", np.float32),
+    ]
+)
+
+
+class _DetectionArrayBuilder:
+    """Accumulates detection rows into a structured array with geometric growth.
+
+    Each row costs 28 bytes plus a pointer to the image name shared by all rows
+    of an image, instead of a dictionary per detection.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._array = np.empty(capacity, dtype=DETECTION_DTYPE)
+        self._size = 0
+
+    def extend(self, rows: List[dict]) -> None:
+        """Appends the detection dictionaries of one image."""
+        end = self._size + len(rows)
+        if end > len(self._array):
+            grown = np.empty(max(end, 2 * len(self._array)), dtype=DETECTION_DTYPE)
+            grown[: self._size] = self._array[: self._size]
+            self._array = grown
+        self._array[self._size : end] = [
+            tuple(row[name] for name in DETECTION_DTYPE.names) for row in rows
+        ]
+        self._size = end
+
+    def build(self) -> np.ndarray:
+        """Returns the rows appended so far, trimmed to size."""
+        return self._array[: self._size].copy()
+
+
+class _JsonArrayWriter:
+    """Writes a JSON array to disk one element at a time.
+
+    The output is identical to ``json.dump(items, file, indent=4)``, but elements
+    are serialized as they arrive instead of after the whole list is built.
+    """
+
+    def __init__(self, json_path: str):
+        """Opens the JSON file for writing, creating its directory if needed.
+
+        Args:
+            json_path: Path where to save the JSON file.
+        """
+        os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+        self.count = 0
+        self._file = open(json_path, "w", encoding="utf-8")
+
+    def write(self, item: dict) -> None:
+        """Appends one element to the array."""
+        self._file.write("[\n    " if self.count == 0 else ",\n    ")
+        self._file.write(json.dumps(item, indent=4).replace("\n", "\n    "))
+        self.count += 1
+
+    def close(self) -> None:
+        """Terminates the array and closes the file."""
+        self._file.write("\n]" if self.count else "[]")
+        self._file.close()
+
+    def __enter__(self) -> "_JsonArrayWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _NdjsonWriter:
+    """Writes one compact JSON object per line (NDJSON) as elements arrive."""
+
+    def __init__(self, json_path: str):
+        """Opens the file for writing, creating its directory if needed.
+
+        Args:
+            json_path: Path where to save the NDJSON file.
+        """
+        os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+        self.count = 0
+        self._file = open(json_path, "wb")
+
+    def write(self, item: dict) -> None:
+        """Appends one element as a line, serialized with orjson if installed."""
+        self._file.write(_dumps_line(item))
+        self.count += 1
+
+    def close(self) -> None:
+        """Closes the file."""
+        self._file.close()
+
+    def __enter__(self) -> "_NdjsonWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 class BaseFaceDetector(ABC):
@@ -94,8 +293,15 @@ class BaseFaceDetector(ABC):
 
     Attributes:
         confidence_threshold: Float threshold (0-1) for detection confidence.
+        supports_batching: Whether ``_detect_images`` runs a batch of images
+            through the model in a single forward pass.
+        min_input_size: Smallest image side the model needs, used to decode
+            large JPEGs at reduced scale. None to always decode at full size.
     """
 
+    supports_batching: bool = False
+    min_input_size: Optional[int] = None
+
     def __init__(self, confidence_threshold: float = 0.5):
         """Initializes the face detector.
 
@@ -104,6 +310,8 @@ class BaseFaceDetector(ABC):
                 Defaults to 0.5.
         """
         self.confidence_threshold = confidence_threshold
+        # Output folders already created by _save_annotated_image
+        self._created_folders = set()
 
     def _load_image(self, image_path: str) -> np.ndarray:
         """Loads an image from disk in BGR format.
@@ -117,15 +325,73 @@ class BaseFaceDetector(ABC):
         Raises:
             ValueError: If the image cannot be loaded from the given path.
         """
-        if not os.path.exists(image_path):
-            raise ValueError(f"Image path does not exist: {image_path}")
-
         image = cv2.imread(image_path)
         if image is None:
+            # Only stat the path to explain a failure, not on every load
+            if not os.path.exists(image_path):
+                raise ValueError(f"Image path does not exist: {image_path}")
             raise ValueError(f"Could not load image from: {image_path}")
 
         return image
 
+    def _load_image_reduced(
+        self, image_path: str
+    ) -> Tuple[np.ndarray, Optional[Tuple[float, float]]]:
+        """Loads an image, decoding large JPEGs at the smallest scale the model can use.
+
+        libjpeg can decode at 1/2, 1/4 or 1/8 scale for little more than the cost
+        of reading the file, which is much cheaper than decoding at full size
+        only for the detector to downsample the image again.
+
+        Args:
+            image_path: Path to the image file.
+
+        Returns:
+            Tuple of the image in BGR format and the (x, y) factors mapping its
+            coordinates back to the full size image, or None if it was decoded
+            at full size.
+
+        Raises:
+            ValueError: If the image cannot be loaded from the given path.
+        """
+        image, scale = read_reduced_image(image_path, self.min_input_size)
+        if image is not None:
+            return image, scale
+
+        return self._load_image(image_path), None
+
+    @staticmethod
+    def _rescale_detections(
+        detections: List[FaceDetection], scale: Tuple[float, float]
+    ) -> List[FaceDetection]:
+        """Maps detections from a reduced scale image back to full size.
+
+        Args:
+            detections: Detections in the coordinates of the reduced image.
+            scale: The (x, y) factors returned by ``_load_image_reduced``.
+
+        Returns:
+            New FaceDetection objects in full size image coordinates.
+        """
+        scale_x, scale_y = scale
+        return [
+            FaceDetection(
+                bbox=BoundingBox(
+                    x1=int(detection.bbox.x1 * scale_x),
+                    y1=int(detection.bbox.y1 * scale_y),
+                    x2=int(detection.bbox.x2 * scale_x),
+                    y2=int(detection.bbox.y2 * scale_y),
+                    confidence=detection.bbox.confidence,
+                ),
+                landmarks=(
+                    None
+                    if detection.landmarks is None
+                    else detection.landmarks * np.array([scale_x, scale_y])
+                ),
+            )
+            for detection in detections
+        ]
+
     @abstractmethod
     def detect(
         self,
@@ -149,6 +415,96 @@ class BaseFaceDetector(ABC):
         """
         pass
 
+    def _detect_image(self, image: np.ndarray) -> List[FaceDetection]:
+        """Detects faces in an already decoded BGR image.
+
+        Args:
+            image: The image in BGR format.
+
+        Returns:
+            List of FaceDetection objects containing detected faces.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support detection on decoded images"
+        )
+
+    def _detect_images(self, images: List[np.ndarray]) -> List[List[FaceDetection]]:
+        """Detects faces in a batch of decoded BGR images.
+
+        Detectors with batched inference override this to run the whole batch in
+        one forward pass; by default each image is processed on its own.
+
+        Args:
+            images: List of images in BGR format.
+
+        Returns:
+            One list of FaceDetection objects per input image.
+        """
+        return [self._detect_image(image) for image in images]
+
+    def detect_batch(
+        self, image_paths: List[str], batch_size: int = 16, num_workers: int = 4
+    ) -> List[List[FaceDetection]]:
+        """Detects faces in several images, batching inference where supported.
+
+        Images are decoded by a thread pool ahead of inference, large JPEGs at
+        reduced scale, and each group of up to ``batch_size`` images is passed
+        to the model together. Boxes found at reduced scale are mapped back to
+        full size, so they can differ from those of ``detect`` by up to the
+        reduction factor.
+
+        Args:
+            image_paths: Paths to the input images.
+            batch_size: Maximum number of images per forward pass. Defaults to 16.
+            num_workers: Number of threads decoding images. Defaults to 4.
+
+        Returns:
+            One list of FaceDetection objects per input path, in the same order.
+
+        Raises:
+            ValueError: If any of the images cannot be loaded.
+        """
+        results = []
+        for batch in self._iter_batches(
+            self._load_image_reduced, image_paths, batch_size, num_workers
+        ):
+            batch_detections = self._detect_images([image for image, _ in batch])
+            for (_, scale), detections in zip(batch, batch_detections):
+                if scale is not None:
+                    detections = self._rescale_detections(detections, scale)
+                results.append(detections)
+        return results
+
+    def _iter_batches(
+        self,
+        load: Callable,
+        items: Iterable,
+        batch_size: int,
+        num_workers: int,
+    ) -> Iterator[list]:
+        """Loads items in a thread pool and yields them in lists of ``batch_size``.
+
+        Up to two batches are loaded ahead of the one being consumed.
+
+        Args:
+            load: Function loading a single item.
+            items: Items to load.
+            batch_size: Maximum number of loaded items per yielded list.
+            num_workers: Number of loader threads.
+
+        Yields:
+            Lists of loaded items, in input order.
+        """
+        batch = []
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for loaded in _map_ahead(executor, load, items, 2 * batch_size):
+                batch.append(loaded)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
     def detect_folder(
         self,
         images_folder: str,
@@ -159,7 +515,12 @@ class BaseFaceDetector(ABC):
         num_processes: Optional[int] = 0,
         image_extensions: tuple = (".jpg", ".jpeg", ".png", ".bmp", ".tiff"),
         detector_model: str = "mediapipe",
-    ) -> List[dict]:
+        num_threads: int = 0,
+        return_detections: Union[bool, str] = True,
+        batch_size: Optional[int] = None,
+        stream_ndjson: bool = False,
+        start_method: Optional[str] = None,
+    ) -> Union[List[dict], np.ndarray]:
         """Detects faces in a batch of images using multiprocessing.
 
         This method processes all images in a folder in parallel, collecting all
@@ -167,6 +528,22 @@ class BaseFaceDetector(ABC):
         and cleanup automatically. If multiprocessing fails, it automatically
         falls back to sequential processing.
 
+        When ``num_threads`` is set, images are processed by a thread pool that
+        shares this detector instance instead of loading a model per process.
+        Image decoding, inference and encoding release the GIL, so they overlap
+        across threads without duplicating the model in memory.
+
+        Detections are written to the JSON file as each image completes. With
+        ``return_detections=False`` they are not kept in memory at all, so
+        memory use does not grow with the size of the folder. With
+        ``return_detections="array"`` they are kept in a compact numpy
+        structured array (see ``DETECTION_DTYPE``) rather than as dictionaries.
+
+        When ``batch_size`` is greater than 1, detectors that support batched
+        inference ("blazeface", "ultralight") instead run ``batch_size`` images
+        per forward pass in this process while a thread pool decodes the next
+        batches, and ``num_processes`` is ignored.
+
         Args:
             images_folder: Path to the folder containing input images.
             output_folder: Path to save the output files.
@@ -176,9 +553,28 @@ class BaseFaceDetector(ABC):
             num_processes: Number of processes to use. Defaults to 0. Will run sequentially if set to 0.
             image_extensions: Tuple of valid image file extensions.
             detector_model: The detector model type to use for batch processing.
+            num_threads: Number of threads sharing this detector. Defaults to 0.
+                Takes precedence over ``num_processes`` when greater than 1.
+            return_detections: Whether to collect and return all detections.
+                If False, results are only written to the JSON file and an
+                empty list is returned. If "array", a structured array is
+                returned instead of a list. Defaults to True.
+            batch_size: Number of images per forward pass for detectors that
+                support batched inference. Defaults to None, which does not batch.
+            stream_ndjson: Whether to write ``json_path`` as newline-delimited
+                compact JSON, one detection per line, instead of an indented
+                JSON array. Defaults to False.
+            start_method: Multiprocessing start method used when
+                ``num_processes`` is greater than 1. Defaults to None, which
+                uses "spawn" on macOS and "fork" elsewhere. "forkserver" starts
+                workers from a server process with the detector preloaded,
+                without inheriting this process's threads; like "spawn", it
+                requires the calling script to guard its entry point with
+                ``if __name__ == "__main__":``.
 
         Returns:
-            List of dictionaries containing detection results for all images.
+            List of dictionaries containing detection results for all images, or
+            a structured array of them if ``return_detections`` is "array".
 
         Raises:
             ValueError: If the images folder doesn't exist or contains no valid images.
@@ -186,10 +582,17 @@ class BaseFaceDetector(ABC):
         if not os.path.exists(images_folder):
             raise ValueError(f"Images folder does not exist: {images_folder}")
 
-        # Get all valid image files
-        images = [
-            f for f in os.listdir(images_folder) if f.lower().endswith(image_extensions)
-        ]
+        # Get all valid image files; match the text after the last dot against a
+        # set rather than trying every extension with endswith
+        extensions = frozenset(ext.lower().lstrip(".") for ext in image_extensions)
+        with os.scandir(images_folder) as entries:
+            images = [
+                entry.name
+                for entry in entries
+                if "." in entry.name
+                and entry.name.rpartition(".")[2].lower() in extensions
+                and entry.is_file()
+            ]
 
         if not images:
             raise ValueError(f"No valid images found in {images_folder}")
@@ -198,7 +601,7 @@ class BaseFaceDetector(ABC):
 
         # Check for MediaPipe parallel processing
         if detector_model.lower() == "mediapipe" and (
-            num_processes is None or num_processes > 1
+            num_processes is None or num_processes > 1 or num_threads > 1
         ):
             warnings.warn(
                 "MediaPipe face detection does not work reliably with multiprocessing due to "
@@ -214,11 +617,52 @@ class BaseFaceDetector(ABC):
                 save_annotated,
                 save_json,
                 json_path,
+                return_detections,
+                stream_ndjson=stream_ndjson,
             )
 
+        # Batched inference with a single shared model
+        if self.supports_batching and batch_size is not None and batch_size > 1:
+            print(f"Using batched processing with batch size {batch_size}...")
+            return self._process_images_batched(
+                images,
+                images_folder,
+                output_folder,
+                save_annotated,
+                save_json,
+                json_path,
+                return_detections,
+                batch_size,
+                max(num_threads, 4),
+                stream_ndjson=stream_ndjson,
+            )
+
+        # Threaded processing with a single shared model
+        if num_threads > 1:
+            print(f"Using threaded processing with {num_threads} threads...")
+            return self._process_images_threaded(
+                images,
+                images_folder,
+                output_folder,
+                save_annotated,
+                save_json,
+                json_path,
+                return_detections,
+                num_threads,
+                stream_ndjson=stream_ndjson,
+            )
+
+        # Starting a worker and loading its model costs about as much as
+        # detecting faces in _IMAGES_PER_PROCESS images, so only start as many
+        # processes as the folder can keep busy
+        if num_processes is None:
+            num_processes = multiprocessing.cpu_count()
+        if num_processes > 1:
+            num_processes = min(num_processes, len(images) // _IMAGES_PER_PROCESS)
+
         # Sequential processing if num_processes is 0 or 1
-        if num_processes == 0 or num_processes == 1:
-            print("Using sequential processing (num_processes=0)...")
+        if num_processes <= 1:
+            print(f"Using sequential processing (num_processes={num_processes})...")
             return self._process_images_sequentially(
                 images,
                 images_folder,
@@ -226,6 +670,8 @@ class BaseFaceDetector(ABC):
                 save_annotated,
                 save_json,
                 json_path,
+                return_detections,
+                stream_ndjson=stream_ndjson,
             )
 
         # Try multiprocessing
@@ -234,13 +680,16 @@ class BaseFaceDetector(ABC):
         try:
             # Determine the appropriate start method based on the platform
             # On macOS, use "spawn" to avoid OpenGL context issues with fork()
-            start_method = "spawn" if platform.system() == "Darwin" else "fork"
+            if start_method is None:
+                start_method = "spawn" if platform.system() == "Darwin" else "fork"
+            if start_method == "forkserver":
+                _preload_forkserver(detector_model.lower())
 
             # Import here to avoid circular imports
             from ...utils.parallel import MultiProcessor
 
             # Prepare arguments for each worker process
-            worker_args = [
+            worker_args = (
                 (
                     image_filename,
                     images_folder,
@@ -250,25 +699,25 @@ class BaseFaceDetector(ABC):
                     {},
                 )
                 for image_filename in images
-            ]
+            )
 
             # Process images in parallel
+            # Load the detector once per worker process, not once per image
             processor = MultiProcessor(
-                num_processes=num_processes, start_mode=start_method
+                num_processes=num_processes,
+                initializer_func=_init_batch_worker,
+                initializer_args=(detector_model, {}),
+                start_mode=start_method,
+                progress_bar_options=_progress_options(len(images)),
             )
 
             results = processor.process(
                 function=_process_single_image_for_batch_worker,
                 iterable=worker_args,
                 description="Processing images for face detection",
+                total_elements=len(images),
             )
 
-            # Consolidate all detections into a single list
-            all_detections = []
-            for result in results:
-                if result:  # Skip None results
-                    all_detections.extend(result)
-
             print(f"Parallel processing completed successfully!")
 
         except Exception as e:
@@ -288,12 +737,122 @@ class BaseFaceDetector(ABC):
                 save_annotated,
                 save_json,
                 json_path,
+                return_detections,
+                stream_ndjson=stream_ndjson,
             )
 
-        # Save consolidated JSON if requested
-        if save_json:
-            self._save_folder_detections_to_json(all_detections, json_path)
+        return self._collect_folder_detections(
+            (result or [] for result in results),  # Skip None results
+            save_json,
+            json_path,
+            return_detections,
+            stream_ndjson=stream_ndjson,
+        )
+
+    def _detect_folder_image(
+        self,
+        image_filename: str,
+        images_folder: str,
+        output_folder: str,
+        save_annotated: bool,
+    ) -> List[dict]:
+        """Detects faces in one image of a folder batch.
+
+        Args:
+            image_filename: Filename of the image inside ``images_folder``.
+            images_folder: Path to the folder containing input images.
+            output_folder: Path to save the output files.
+            save_annotated: Whether to save the annotated image.
+
+        Returns:
+            List of detection dictionaries for this image; empty if it failed.
+        """
+        try:
+            # Set up output paths for annotated images if requested
+            if save_annotated:
+                image_output_folder = os.path.join(
+                    output_folder, os.path.splitext(image_filename)[0]
+                )
+            else:
+                image_output_folder = output_folder
+
+            # Perform detection (without saving individual JSON files)
+            detections = self.detect(
+                image_path=os.path.join(images_folder, image_filename),
+                save_json=False,  # Don't save individual JSON files
+                save_annotated=save_annotated,
+                output_folder=image_output_folder,
+            )
+        except Exception as e:
+            print(f"Error processing {image_filename}: {str(e)}")
+            return []
+
+        return self._detections_to_rows(image_filename, detections)
 
+    @staticmethod
+    def _detections_to_rows(
+        image_filename: str, detections: List[FaceDetection]
+    ) -> List[dict]:
+        """Converts detections to dictionary format for JSON serialization.
+
+        Args:
+            image_filename: Filename recorded as ``image_name`` on every row.
+            detections: Detections found in that image.
+
+        Returns:
+            List of detection dictionaries.
+        """
+        return [
+            dict(zip(_ROW_KEYS, (image_filename, *_bbox_values(detection.bbox))))
+            for detection in detections
+        ]
+
+    def _collect_folder_detections(
+        self,
+        results: Iterable[List[dict]],
+        save_json: bool,
+        json_path: str,
+        return_detections: Union[bool, str] = True,
+        stream_ndjson: bool = False,
+    ) -> Union[List[dict], np.ndarray]:
+        """Streams per-image detections to the JSON file as they are produced.
+
+        Args:
+            results: Iterable of per-image lists of detection dictionaries.
+            save_json: Whether to save detection results to JSON file.
+            json_path: Path where to save the consolidated JSON file.
+            return_detections: Whether to keep and return all detections, or
+                "array" to keep them in a structured array.
+            stream_ndjson: Whether to write NDJSON instead of a JSON array.
+
+        Returns:
+            List of dictionaries containing detection results for all images, an
+            empty list if ``return_detections`` is False, or a structured array
+            if it is "array".
+        """
+        all_detections = (
+            _DetectionArrayBuilder() if return_detections == "array" else []
+        )
+        writer = None
+        if save_json:
+            writer_class = _NdjsonWriter if stream_ndjson else _JsonArrayWriter
+            writer = writer_class(json_path)
+        try:
+            for detection_results in results:
+                if writer is not None:
+                    for detection in detection_results:
+                        writer.write(detection)
+                if return_detections:
+                    all_detections.extend(detection_results)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is not None:
+            print(f"Saved {writer.count} detections to {json_path}")
+
+        if return_detections == "array":
+            return all_detections.build()
         return all_detections
 
     def _process_images_sequentially(
@@ -304,7 +863,9 @@ class BaseFaceDetector(ABC):
         save_annotated: bool,
         save_json: bool,
         json_path: str,
-    ) -> List[dict]:
+        return_detections: Union[bool, str] = True,
+        stream_ndjson: bool = False,
+    ) -> Union[List[dict], np.ndarray]:
         """Process images sequentially without multiprocessing.
 
         Args:
@@ -314,78 +875,236 @@ class BaseFaceDetector(ABC):
             save_annotated: Whether to save annotated images.
             save_json: Whether to save detection results to JSON file.
             json_path: Path where to save the consolidated JSON file.
+            return_detections: Whether to collect and return all detections.
+            stream_ndjson: Whether to write NDJSON instead of a JSON array.
 
         Returns:
             List of dictionaries containing detection results for all images.
         """
-        all_detections = []
-
-        for i, image_filename in tqdm(
-            enumerate(images, 1), total=len(images), desc="Processing images"
-        ):
+        if type(self)._detect_image is BaseFaceDetector._detect_image:
+            # Detectors without _detect_image can only load images in detect()
+            results = (
+                self._detect_folder_image(
+                    image_filename, images_folder, output_folder, save_annotated
+                )
+                for image_filename in _progress(images, len(images))
+            )
+            return self._collect_folder_detections(
+                results,
+                save_json,
+                json_path,
+                return_detections,
+                stream_ndjson=stream_ndjson,
+            )
 
-            try:
-                image_path = os.path.join(images_folder, image_filename)
+        # Decode upcoming images and write annotated ones on background threads
+        # (cv2 releases the GIL) while this thread runs the detector
+        load = partial(self._load_folder_image, images_folder)
+        pending_writes = deque()
+
+        def process_images(load_executor, write_executor):
+            for image_filename, image in _map_ahead(
+                load_executor, load, images, _IMAGE_PREFETCH
+            ):
+                if image is None:
+                    yield []
+                    continue
+                try:
+                    detections = self._detect_image(image)
+                except Exception as e:
+                    print(f"Error processing {image_filename}: {str(e)}")
+                    yield []
+                    continue
 
-                # Set up output paths for annotated images if requested
                 if save_annotated:
-                    image_output_folder = os.path.join(
-                        output_folder, os.path.splitext(image_filename)[0]
+                    # Bound the number of images waiting to be written
+                    if len(pending_writes) >= _IMAGE_PREFETCH:
+                        pending_writes.popleft().result()
+                    pending_writes.append(
+                        write_executor.submit(
+                            self._save_folder_annotation,
+                            image,
+                            detections,
+                            image_filename,
+                            output_folder,
+                        )
                     )
-                else:
-                    image_output_folder = output_folder
-
-                # Perform detection (without saving individual JSON files)
-                detections = self.detect(
-                    image_path=image_path,
-                    save_json=False,  # Don't save individual JSON files
-                    save_annotated=save_annotated,
-                    output_folder=image_output_folder,
-                )
 
-                # Convert detections to dictionary format for JSON serialization
-                for detection in detections:
-                    bbox = detection.bbox
-                    all_detections.append(
-                        {
-                            "image_name": image_filename,
-                            "x1": bbox.x1,
-                            "y1": bbox.y1,
-                            "x2": bbox.x2,
-                            "y2": bbox.y2,
-                            "confidence": bbox.confidence,
-                        }
-                    )
+                yield self._detections_to_rows(image_filename, detections)
+
+        with ThreadPoolExecutor(max_workers=4) as load_executor, ThreadPoolExecutor(
+            max_workers=1
+        ) as write_executor:
+            results = _progress(
+                process_images(load_executor, write_executor), len(images)
+            )
+            return self._collect_folder_detections(
+                results,
+                save_json,
+                json_path,
+                return_detections,
+                stream_ndjson=stream_ndjson,
+            )
 
-            except Exception as e:
-                print(f"Error processing {image_filename}: {str(e)}")
+    def _load_folder_image(
+        self, images_folder: str, image_filename: str
+    ) -> Tuple[str, Optional[np.ndarray]]:
+        """Loads one image of a folder batch, reporting failures instead of raising.
 
-        # Save consolidated JSON if requested
-        if save_json:
-            self._save_folder_detections_to_json(all_detections, json_path)
+        Images are always decoded at full size, so detect_folder returns the same
+        boxes as detect() whichever processing path it takes.
 
-        return all_detections
+        Args:
+            images_folder: Path to the folder containing input images.
+            image_filename: Filename of the image inside ``images_folder``.
+
+        Returns:
+            Tuple of the filename and the BGR image, or None if it failed to load.
+        """
+        try:
+            image = self._load_image(os.path.join(images_folder, image_filename))
+        except ValueError as e:
+            print(f"Error processing {image_filename}: {str(e)}")
+            image = None
+        return image_filename, image
 
-    def _save_folder_detections_to_json(
-        self, all_detections: List[dict], json_path: str
+    def _save_folder_annotation(
+        self,
+        image: np.ndarray,
+        detections: List[FaceDetection],
+        image_filename: str,
+        output_folder: str,
     ) -> None:
-        """Saves batch detection results to a single JSON file.
+        """Saves the annotated image of a folder batch into its own subfolder.
 
         Args:
-            all_detections: List of detection dictionaries from all images.
+            image: The decoded BGR image.
+            detections: Detections found in the image.
+            image_filename: Filename of the image inside the input folder.
+            output_folder: Path to save the output files.
+        """
+        try:
+            self._save_annotated_image(
+                image,
+                detections,
+                image_filename,
+                os.path.join(output_folder, os.path.splitext(image_filename)[0]),
+            )
+        except Exception as e:
+            print(f"Error saving annotated {image_filename}: {str(e)}")
+
+    def _process_images_threaded(
+        self,
+        images: List[str],
+        images_folder: str,
+        output_folder: str,
+        save_annotated: bool,
+        save_json: bool,
+        json_path: str,
+        return_detections: Union[bool, str],
+        num_threads: int,
+        stream_ndjson: bool = False,
+    ) -> Union[List[dict], np.ndarray]:
+        """Process images with a thread pool sharing this detector instance.
+
+        Args:
+            images: List of image filenames to process.
+            images_folder: Path to the folder containing input images.
+            output_folder: Path to save the output files.
+            save_annotated: Whether to save annotated images.
+            save_json: Whether to save detection results to JSON file.
             json_path: Path where to save the consolidated JSON file.
+            return_detections: Whether to collect and return all detections.
+            num_threads: Number of worker threads.
+            stream_ndjson: Whether to write NDJSON instead of a JSON array.
+
+        Returns:
+            List of dictionaries containing detection results for all images.
         """
-        # Create directory if it doesn't exist
-        os.makedirs(
-            os.path.dirname(json_path) if os.path.dirname(json_path) else ".",
-            exist_ok=True,
+        process_image = partial(
+            self._detect_folder_image,
+            images_folder=images_folder,
+            output_folder=output_folder,
+            save_annotated=save_annotated,
         )
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            results = _progress(executor.map(process_image, images), len(images))
+            return self._collect_folder_detections(
+                results,
+                save_json,
+                json_path,
+                return_detections,
+                stream_ndjson=stream_ndjson,
+            )
 
-        # Write consolidated results to JSON
-        with open(json_path, "w", encoding="utf-8") as jsonfile:
-            json.dump(all_detections, jsonfile, indent=4)
+    def _process_images_batched(
+        self,
+        images: List[str],
+        images_folder: str,
+        output_folder: str,
+        save_annotated: bool,
+        save_json: bool,
+        json_path: str,
+        return_detections: Union[bool, str],
+        batch_size: int,
+        num_workers: int,
+        stream_ndjson: bool = False,
+    ) -> Union[List[dict], np.ndarray]:
+        """Process images in batches through a single forward pass each.
 
-        print(f"Saved {len(all_detections)} detections to {json_path}")
+        Args:
+            images: List of image filenames to process.
+            images_folder: Path to the folder containing input images.
+            output_folder: Path to save the output files.
+            save_annotated: Whether to save annotated images.
+            save_json: Whether to save detection results to JSON file.
+            json_path: Path where to save the consolidated JSON file.
+            return_detections: Whether to collect and return all detections.
+            batch_size: Maximum number of images per forward pass.
+            num_workers: Number of threads decoding images.
+            stream_ndjson: Whether to write NDJSON instead of a JSON array.
+
+        Returns:
+            List of dictionaries containing detection results for all images.
+        """
+        load = partial(self._load_folder_image, images_folder)
+
+        def process_batches():
+            for batch in self._iter_batches(load, images, batch_size, num_workers):
+                loaded = [item for item in batch if item[1] is not None]
+                try:
+                    batch_detections = (
+                        self._detect_images([image for _, image in loaded])
+                        if loaded
+                        else []
+                    )
+                except Exception as e:
+                    print(f"Error processing batch: {str(e)}")
+                    batch_detections = [[] for _ in loaded]
+
+                detections_by_name = {}
+                for (image_filename, image), detections in zip(
+                    loaded, batch_detections
+                ):
+                    detections_by_name[image_filename] = detections
+                    if save_annotated:
+                        self._save_folder_annotation(
+                            image, detections, image_filename, output_folder
+                        )
+
+                for image_filename, _ in batch:
+                    yield self._detections_to_rows(
+                        image_filename, detections_by_name.get(image_filename, [])
+                    )
+
+        results = _progress(process_batches(), len(images))
+        return self._collect_folder_detections(
+            results,
+            save_json,
+            json_path,
+            return_detections,
+            stream_ndjson=stream_ndjson,
+        )
 
     def _save_detections_to_json(
         self, detections: List[FaceDetection], image_path: str, json_path: str
@@ -401,25 +1120,10 @@ class BaseFaceDetector(ABC):
         image_name = os.path.basename(image_path)
 
         # Create directory if it doesn't exist
-        os.makedirs(
-            os.path.dirname(json_path) if os.path.dirname(json_path) else ".",
-            exist_ok=True,
-        )
+        os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
 
         # Prepare data for JSON
-        detection_results = []
-        for detection in detections:
-            bbox = detection.bbox
-            detection_results.append(
-                {
-                    "image_name": image_name,
-                    "x1": bbox.x1,
-                    "y1": bbox.y1,
-                    "x2": bbox.x2,
-                    "y2": bbox.y2,
-                    "confidence": bbox.confidence,
-                }
-            )
+        detection_results = self._detections_to_rows(image_name, detections)
 
         # Write to JSON (overwrite or append logic can be modified as needed)
         with open(json_path, "w", encoding="utf-8") as jsonfile:
@@ -438,32 +1142,33 @@ class BaseFaceDetector(ABC):
             np.ndarray: Copy of input image with bounding boxes and landmarks drawn
         """
         image_copy = image.copy()
-        for face in faces:
-            bbox = face.bbox
-            # Draw bounding box
-            cv2.rectangle(
-                image_copy,
-                (int(bbox.x1), int(bbox.y1)),
-                (int(bbox.x2), int(bbox.y2)),
-                (0, 255, 0),
-                2,
-            )
-
-            # Draw landmarks if available
-            if face.landmarks is not None:
-                for x, y in face.landmarks:
-                    cv2.circle(image_copy, (int(x), int(y)), 2, (0, 255, 0), 2)
-
-            # Add confidence score
-            label = f"{bbox.confidence:.2f}"
+        if not faces:
+            return image_copy
+
+        # Draw all bounding boxes in one call; cv2.rectangle draws the same
+        # closed polyline through the four corners, one box per call
+        boxes = FaceDetection.bboxes_to_array(faces)[:, :4].astype(np.int32)
+        corners = boxes[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2)
+        cv2.polylines(image_copy, list(corners), True, _DRAW_COLOR, 2)
+
+        # Draw landmarks if available
+        landmarks = [face.landmarks for face in faces if face.landmarks is not None]
+        if landmarks:
+            for x, y in np.concatenate(landmarks).astype(np.int32).tolist():
+                cv2.circle(image_copy, (x, y), 2, _DRAW_COLOR, 2)
+
+        # Add confidence scores above the boxes, without anti-aliasing
+        labels = [f"{face.bbox.confidence:.2f}" for face in faces]
+        for label, (x1, y1) in zip(labels, boxes[:, :2].tolist()):
             cv2.putText(
                 image_copy,
                 label,
-                (int(bbox.x1), int(bbox.y1) - 10),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.7,
-                (0, 255, 0),
+                (x1, y1 - 10),
+                _LABEL_FONT,
+                _LABEL_SCALE,
+                _DRAW_COLOR,
                 2,
+                cv2.LINE_8,
             )
 
         return image_copy
@@ -486,8 +1191,10 @@ class BaseFaceDetector(ABC):
         Returns:
             str: Path to the saved annotated image
         """
-        # Create output directory if it doesn't exist
-        os.makedirs(output_folder, exist_ok=True)
+        # Create output directory if it doesn't exist, once per folder
+        if output_folder not in self._created_folders:
+            os.makedirs(output_folder, exist_ok=True)
+            self._created_folders.add(output_folder)
 
         # Draw detections on image
         annotated_image = self._draw_detections(image, faces)
@@ -498,7 +1205,10 @@ class BaseFaceDetector(ABC):
         output_filename = f"{name}_detected{ext}"
         output_path = os.path.join(output_folder, output_filename)
 
-        # Save annotated image
-        cv2.imwrite(output_path, annotated_image)
+        # Save annotated image; ignored by encoders other than JPEG
+        if not cv2.imwrite(output_path, annotated_image, _ANNOTATED_JPEG_PARAMS):
+            # The folder may have been removed since it was cached; recreate it
+            os.makedirs(output_folder, exist_ok=True)
+            cv2.imwrite(output_path, annotated_image, _ANNOTATED_JPEG_PARAMS)
 
         return output_path
@@ -28,6 +28,9 @@ class MediaPipeFaceDetector(BaseFaceDetector):
         confidence_threshold: Minimum confidence for valid detections
     """
 
+    # Input size of the full range model; the short range model uses 128
+    min_input_size = 192
+
     def __init__(self, confidence_threshold: float = 0.5, model_selection: int = 0):
         """Initializes the MediaPipe face detector.
 
@@ -67,6 +70,19 @@ class MediaPipeFaceDetector(BaseFaceDetector):
         # Load image from path
         image = self._load_image(image_path)
 
+        faces = self._detect_image(image)
+
+        # Save to JSON if requested
+        if save_json:
+            self._save_detections_to_json(faces, image_path, json_path)
+
+        # Save annotated image if requested
+        if save_annotated:
+            self._save_annotated_image(image, faces, image_path, output_folder)
+
+        return faces
+
+    def _detect_image(self, image: np.ndarray) -> List[FaceDetection]:
         # Convert BGR to RGB
         image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
@@ -91,12 +107,4 @@ class MediaPipeFaceDetector(BaseFaceDetector):
 
                 faces.append(FaceDetection(bbox=bbox))
 
-        # Save to JSON if requested
-        if save_json:
-            self._save_detections_to_json(faces, image_path, json_path)
-
-        # Save annotated image if requested
-        if save_annotated:
-            self._save_annotated_image(image, faces, image_path, output_folder)
-
         return faces
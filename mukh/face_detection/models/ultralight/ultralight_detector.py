@@ -41,6 +41,8 @@ class UltralightDetector(BaseFaceDetector):
         confidence_threshold: Minimum confidence for valid detections
     """
 
+    supports_batching = True
+
     def __init__(
         self,
         net_type: str = "RFB",
@@ -49,6 +51,8 @@ class UltralightDetector(BaseFaceDetector):
         candidate_size: int = 1500,
         weights_path: str = None,
         labels_path: str = None,
+        device: str = None,
+        compile_model: bool = False,
     ):
         """Initializes the Ultra-Light face detector.
 
@@ -59,6 +63,11 @@ class UltralightDetector(BaseFaceDetector):
             candidate_size: Maximum number of candidate detections
             weights_path: Optional custom path to model weights file
             labels_path: Optional custom path to class labels file
+            device: Device to run inference on ('cpu' or 'cuda'). Uses CUDA when
+                available if not provided.
+            compile_model: Whether to compile the network with torch.compile,
+                capturing CUDA graphs on GPU. The first batch of each size pays
+                the compilation cost. Defaults to False.
         """
         super().__init__(confidence_threshold)
 
@@ -70,8 +79,11 @@ class UltralightDetector(BaseFaceDetector):
             except Exception as e:
                 raise Exception(f"Failed to download UltraLight models: {str(e)}")
 
-        self.device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
+        if device is None:
+            device = "cuda:0" if torch.cuda.is_available() else "cpu"
+        self.device = torch.device(device)
         self.input_size = input_size
+        self.min_input_size = input_size
         self.candidate_size = candidate_size
 
         # Define image size before importing predictor
@@ -101,6 +113,13 @@ class UltralightDetector(BaseFaceDetector):
         # Load model weights
         self.net.load(weights_path)
 
+        if compile_model:
+            # The predictor calls net.forward directly. Outputs are moved to the
+            # CPU before the next call, so CUDA graph replays overwriting them
+            # ("reduce-overhead") is safe here
+            mode = "reduce-overhead" if self.device.type == "cuda" else "default"
+            self.net.forward = torch.compile(self.net.forward, mode=mode)
+
     def detect(
         self,
         image_path: str,
@@ -128,37 +147,8 @@ class UltralightDetector(BaseFaceDetector):
         """
         # Load image from path
         image = self._load_image(image_path)
-        orig_height, orig_width = image.shape[:2]
-
-        # Resize image to input size
-        resized_image = cv2.resize(image, (self.input_size, self.input_size))
-
-        # Convert BGR to RGB
-        image_rgb = cv2.cvtColor(resized_image, cv2.COLOR_BGR2RGB)
-
-        # Get detections
-        boxes, labels, probs = self.predictor.predict(
-            image_rgb, self.candidate_size / 2, self.confidence_threshold
-        )
 
-        # Scale factors for converting back to original size
-        width_scale = orig_width / self.input_size
-        height_scale = orig_height / self.input_size
-
-        # Convert to FaceDetection objects
-        faces = []
-        for i in range(boxes.size(0)):
-            box = boxes[i, :].int().tolist()
-            # Scale bounding box back to original image size
-            bbox = BoundingBox(
-                x1=int(box[0] * width_scale),
-                y1=int(box[1] * height_scale),
-                x2=int(box[2] * width_scale),
-                y2=int(box[3] * height_scale),
-                confidence=probs[i].item(),
-            )
-            # Ultralight doesn't provide landmarks, so we pass None
-            faces.append(FaceDetection(bbox=bbox))
+        faces = self._detect_image(image)
 
         # Save to JSON if requested
         if save_json:
@@ -169,3 +159,56 @@ class UltralightDetector(BaseFaceDetector):
             self._save_annotated_image(image, faces, image_path, output_folder)
 
         return faces
+
+    def _detect_image(self, image: np.ndarray) -> List[FaceDetection]:
+        return self._detect_images([image])[0]
+
+    def _detect_images(self, images: List[np.ndarray]) -> List[List[FaceDetection]]:
+        """Detects faces in a batch of BGR images with a single forward pass.
+
+        Args:
+            images: Decoded BGR images of any size.
+
+        Returns:
+            One list of FaceDetection per input image, scaled back to that
+            image's original size.
+        """
+        # Resize to input size and convert BGR to RGB
+        batch = [
+            cv2.cvtColor(
+                cv2.resize(image, (self.input_size, self.input_size)),
+                cv2.COLOR_BGR2RGB,
+            )
+            for image in images
+        ]
+
+        # Get detections
+        predictions = self.predictor.predict_batch(
+            batch, self.candidate_size / 2, self.confidence_threshold
+        )
+
+        results = []
+        for image, (boxes, labels, probs) in zip(images, predictions):
+            orig_height, orig_width = image.shape[:2]
+
+            # Scale factors for converting back to original size
+            width_scale = orig_width / self.input_size
+            height_scale = orig_height / self.input_size
+
+            # Convert to FaceDetection objects
+            faces = []
+            for i in range(boxes.size(0)):
+                box = boxes[i, :].int().tolist()
+                # Scale bounding box back to original image size
+                bbox = BoundingBox(
+                    x1=int(box[0] * width_scale),
+                    y1=int(box[1] * height_scale),
+                    x2=int(box[2] * width_scale),
+                    y2=int(box[3] * height_scale),
+                    confidence=probs[i].item(),
+                )
+                # Ultralight doesn't provide landmarks, so we pass None
+                faces.append(FaceDetection(bbox=bbox))
+            results.append(faces)
+
+        return results
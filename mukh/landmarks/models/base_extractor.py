@@ -7,12 +7,208 @@ must inherit from, ensuring a consistent interface across different models.
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union
 
 import cv2
 import numpy as np
+from tqdm import tqdm
 
 from ...core.types import FaceDetection
+from ...utils.image import read_reduced_image
+from ...utils.parallel import MultiProcessor, get_cpu_count, prefetch
+
+
+def _to_list(obj: Any) -> Any:
+    """Converts NumPy values the JSON encoder cannot serialize directly."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    def _dumps_json(data: Any) -> bytes:
+        # Serializes landmark arrays straight from their buffers
+        return orjson.dumps(
+            data,
+            default=_to_list,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+except ImportError:
+
+    def _dumps_json(data: Any) -> bytes:
+        return json.dumps(data, indent=2, default=_to_list).encode("utf-8")
+
+
+def _disk_offsets(radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the (y, x) offsets from the center of every pixel in a filled disk."""
+    steps = np.arange(-radius, radius + 1) ** 2
+    dy, dx = np.nonzero(np.add.outer(steps, steps) <= radius**2)
+    return dy - radius, dx - radius
+
+
+# Drawing settings for annotated landmarks: filled green dots of radius 2
+_LANDMARK_COLOR = np.array((0, 255, 0), dtype=np.uint8)
+_DOT_OFFSETS_Y, _DOT_OFFSETS_X = _disk_offsets(2)
+
+# File extensions extract() dispatches to image and video extraction
+_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp"})
+_VIDEO_EXTENSIONS = frozenset({".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv", ".webm"})
+
+# Number of video frames decoded ahead of, or waiting to be written behind, extraction
+_VIDEO_PREFETCH = 16
+
+# Extractor shared by all tasks of a folder worker process, see _init_folder_worker
+_WORKER_EXTRACTOR = None
+
+
+def _init_folder_worker(extractor_class: type, extractor_kwargs: dict) -> None:
+    """Initializer for folder worker processes - creates the extractor once per process.
+
+    Args:
+        extractor_class: The BaseLandmarkExtractor subclass to instantiate.
+        extractor_kwargs: Keyword arguments passed to ``extractor_class``.
+    """
+    global _WORKER_EXTRACTOR
+
+    try:
+        _WORKER_EXTRACTOR = extractor_class(**extractor_kwargs)
+    except Exception as e:
+        # Leave the error to be reported per image rather than killing the pool
+        print(f"Error initializing {extractor_class.__name__} extractor: {str(e)}")
+
+
+def _extract_image_for_folder_worker(
+    args_tuple: tuple,
+) -> Tuple[str, List[np.ndarray]]:
+    """Worker function for folder extraction - must be at module level for pickling.
+
+    Args:
+        args_tuple: Tuple containing (image_filename, images_folder, output_folder,
+                   save_annotated)
+
+    Returns:
+        Tuple of the image filename and its landmark arrays.
+    """
+    image_filename, images_folder, output_folder, save_annotated = args_tuple
+
+    if _WORKER_EXTRACTOR is None:
+        print(f"Error processing {image_filename}: Could not create landmark extractor")
+        return image_filename, []
+
+    return _WORKER_EXTRACTOR._extract_folder_image(
+        image_filename, images_folder, output_folder, save_annotated
+    )
+
+
+def _image_landmarks_entry(image_path: str, landmarks_list: List[np.ndarray]) -> dict:
+    """Builds the JSON entry holding the landmarks of one image."""
+    return {
+        "image_path": image_path,
+        "num_faces": len(landmarks_list),
+        "landmarks": [
+            {
+                "face_id": i,
+                "num_landmarks": len(landmarks),
+                "points": landmarks,
+            }
+            for i, landmarks in enumerate(landmarks_list)
+        ],
+    }
+
+
+class _VideoJsonWriter:
+    """Writes video landmark results to a JSON file one frame at a time.
+
+    The layout matches an ``indent=2`` dump of the whole result, except that
+    ``num_frames`` comes after the frames since it is only known at the end.
+    """
+
+    def __init__(self, json_path: str, video_path: str):
+        """Opens the JSON file for writing, creating its directory if needed.
+
+        Args:
+            json_path: Path where to save the JSON file.
+            video_path: Path to the source video.
+        """
+        os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+        self.count = 0
+        self._file = open(json_path, "wb")
+        self._file.write(
+            b'{\n  "video_path": ' + _dumps_json(video_path) + b',\n  "frames": ['
+        )
+
+    def write(self, frame_landmarks: List[np.ndarray]) -> None:
+        """Appends the landmarks of the next analyzed frame."""
+        frame_data = {
+            "frame_number": self.count,
+            "num_faces": len(frame_landmarks),
+            "landmarks": [
+                {
+                    "face_id": face_idx,
+                    "num_landmarks": len(landmarks),
+                    "points": landmarks,
+                }
+                for face_idx, landmarks in enumerate(frame_landmarks)
+            ],
+        }
+        self._file.write(b"\n    " if self.count == 0 else b",\n    ")
+        self._file.write(_dumps_json(frame_data).replace(b"\n", b"\n    "))
+        self.count += 1
+
+    def close(self) -> None:
+        """Terminates the frames array, writes the frame count and closes the file."""
+        self._file.write(b"\n  ]" if self.count else b"]")
+        self._file.write(b',\n  "num_frames": %d\n}' % self.count)
+        self._file.close()
+
+    def __enter__(self) -> "_VideoJsonWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+VideoBackend = Literal["opencv", "ffmpegcv", "ffmpegcv_nv"]
+
+
+class _FFmpegCapture:
+    """Exposes an ffmpegcv reader through the cv2.VideoCapture methods used here.
+
+    ffmpegcv pipes every frame out of an ffmpeg process, so ``grab`` reads the
+    next frame and ``retrieve`` returns it. The frame size properties describe
+    the source video, even when the reader resizes frames while decoding.
+    """
+
+    def __init__(self, reader):
+        self._reader = reader
+        self._frame = None
+
+    def isOpened(self) -> bool:
+        return self._reader.isOpened()
+
+    def grab(self) -> bool:
+        ret, self._frame = self._reader.read()
+        return ret
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        return self._frame is not None, self._frame
+
+    def get(self, prop_id: int) -> float:
+        properties = {
+            cv2.CAP_PROP_FPS: self._reader.fps,
+            cv2.CAP_PROP_FRAME_WIDTH: self._reader.origin_width,
+            cv2.CAP_PROP_FRAME_HEIGHT: self._reader.origin_height,
+            cv2.CAP_PROP_FRAME_COUNT: self._reader.count,
+        }
+        return float(properties.get(prop_id) or 0)
+
+    def release(self) -> None:
+        self._reader.release()
 
 
 class BaseLandmarkExtractor(ABC):
@@ -23,8 +219,12 @@ class BaseLandmarkExtractor(ABC):
 
     Attributes:
         confidence_threshold: Float threshold (0-1) for detection confidence.
+        min_input_size: Smallest image side the model needs, used to decode
+            large JPEGs at reduced scale. None to always decode at full size.
     """
 
+    min_input_size: Optional[int] = None
+
     def __init__(self, confidence_threshold: float = 0.5):
         """Initializes the landmark extractor.
 
@@ -55,22 +255,93 @@ class BaseLandmarkExtractor(ABC):
 
         return image
 
-    def _load_video(self, video_path: str) -> cv2.VideoCapture:
+    def _load_image_reduced(
+        self, image_path: str
+    ) -> Tuple[np.ndarray, Optional[Tuple[float, float]]]:
+        """Loads an image, decoding large JPEGs at the smallest scale the model can use.
+
+        libjpeg can decode at 1/2, 1/4 or 1/8 scale for little more than the cost
+        of reading the file, which is much cheaper than decoding at full size
+        only for the model to downsample the image again.
+
+        Args:
+            image_path: Path to the image file.
+
+        Returns:
+            Tuple of the image in BGR format and the (x, y) factors mapping its
+            coordinates back to the full size image, or None if it was decoded
+            at full size.
+
+        Raises:
+            ValueError: If the image cannot be loaded from the given path.
+        """
+        image, scale = read_reduced_image(image_path, self.min_input_size)
+        if image is not None:
+            return image, scale
+
+        return self._load_image(image_path), None
+
+    def _load_video(
+        self,
+        video_path: str,
+        backend: VideoBackend = "opencv",
+        resize: Optional[Tuple[int, int]] = None,
+    ) -> cv2.VideoCapture:
         """Loads a video from disk.
 
         Args:
             video_path: Path to the video file.
+            backend: Decoder to use. "ffmpegcv" decodes with the ffmpeg binary
+                and "ffmpegcv_nv" with NVIDIA NVDEC, both through the optional
+                ``ffmpegcv`` package. Defaults to "opencv".
+            resize: Size (width, height) the ffmpegcv backends scale frames to
+                while decoding. Ignored by the "opencv" backend.
 
         Returns:
-            cv2.VideoCapture: The loaded video capture object.
+            cv2.VideoCapture: The loaded video capture object, or an object
+            exposing the same reading methods for the ffmpegcv backends.
 
         Raises:
             ValueError: If the video cannot be loaded from the given path.
+            ImportError: If an ffmpegcv backend is requested but not installed.
         """
         if not os.path.exists(video_path):
             raise ValueError(f"Video path does not exist: {video_path}")
 
-        cap = cv2.VideoCapture(video_path)
+        if backend != "opencv":
+            try:
+                import ffmpegcv
+            except ImportError:
+                raise ImportError(
+                    f"The {backend} video backend requires ffmpegcv: "
+                    "pip install ffmpegcv"
+                )
+
+            open_reader = (
+                ffmpegcv.VideoCaptureNV
+                if backend == "ffmpegcv_nv"
+                else ffmpegcv.VideoCapture
+            )
+            try:
+                cap = _FFmpegCapture(
+                    open_reader(video_path, resize=resize, resize_keepratio=False)
+                )
+            except Exception as e:
+                raise ValueError(f"Could not load video from: {video_path}: {e}")
+            if not cap.isOpened():
+                raise ValueError(f"Could not load video from: {video_path}")
+            return cap
+
+        # Prefer the FFmpeg backend, where grab() advances without decoding, and
+        # let it decode on the GPU or a media engine (NVDEC, VA-API, Quick Sync,
+        # D3D11) when one is available; otherwise it decodes on the CPU
+        cap = cv2.VideoCapture(
+            video_path,
+            cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+        )
+        if not cap.isOpened():
+            cap = cv2.VideoCapture(video_path)
         if not cap.isOpened():
             raise ValueError(f"Could not load video from: {video_path}")
 
@@ -113,6 +384,22 @@ class BaseLandmarkExtractor(ABC):
         """
         pass
 
+    def extract_from_batch(self, images: List[np.ndarray]) -> List[List[np.ndarray]]:
+        """Extracts landmarks from faces in several image arrays at once.
+
+        The default implementation calls ``extract_from_array`` on each image.
+        Subclasses whose model accepts batched input can override this to run
+        a single forward pass over all images.
+
+        Args:
+            images: Input images as numpy arrays in BGR format.
+
+        Returns:
+            List with one entry per image, each a list of landmark arrays for
+            the faces detected in that image.
+        """
+        return [self.extract_from_array(image) for image in images]
+
     def extract_from_video(
         self,
         video_path: str,
@@ -121,9 +408,17 @@ class BaseLandmarkExtractor(ABC):
         save_annotated: bool = False,
         output_folder: str = "output",
         frame_interval: int = 1,
+        batch_size: int = 8,
+        video_backend: VideoBackend = "opencv",
+        detect_resolution: Optional[Tuple[int, int]] = None,
+        return_landmarks: bool = True,
     ) -> List[List[np.ndarray]]:
         """Extracts landmarks from faces in the given video.
 
+        Results are written to the JSON file frame by frame as they are
+        extracted, so with ``return_landmarks=False`` memory use does not grow
+        with the length of the video.
+
         Args:
             video_path: Path to the input video.
             save_json: Whether to save landmark results to JSON file.
@@ -131,6 +426,18 @@ class BaseLandmarkExtractor(ABC):
             save_annotated: Whether to save annotated video with landmarks.
             output_folder: Folder path where to save annotated videos.
             frame_interval: Interval between frames to analyze (default: 1, every frame).
+            batch_size: Number of analyzed frames passed to ``extract_from_batch``
+                at a time.
+            video_backend: Decoder used to read the video, see ``_load_video``.
+                The ffmpegcv backends can decode faster or on the GPU, but
+                always decode every frame regardless of ``frame_interval``.
+            detect_resolution: Size (width, height) frames are downscaled to
+                before extraction, or None to extract at the native resolution.
+                Landmarks are scaled back to native video coordinates. The
+                ffmpegcv backends downscale inside the decoder unless
+                ``save_annotated`` needs full size frames.
+            return_landmarks: Whether to collect and return the landmarks of
+                all frames. If False, an empty list is returned.
 
         Returns:
             List of lists containing landmark coordinates for each frame.
@@ -139,39 +446,362 @@ class BaseLandmarkExtractor(ABC):
         Raises:
             ValueError: If the video cannot be loaded.
         """
-        cap = self._load_video(video_path)
+        # Let ffmpeg scale frames while decoding unless they are also annotated
+        decoder_resize = None if save_annotated else detect_resolution
+        cap = self._load_video(video_path, video_backend, resize=decoder_resize)
 
-        all_frame_landmarks = []
-        frame_count = 0
+        # Annotate in the same pass so the video is decoded only once
+        writer = None
+        if save_annotated:
+            writer, _ = self._create_video_writer(cap, video_path, output_folder)
+
+        frames_landmarks = self._process_video(
+            cap,
+            frame_interval,
+            writer,
+            batch_size,
+            detect_resolution=detect_resolution,
+        )
+        json_writer = _VideoJsonWriter(json_path, video_path) if save_json else None
 
+        all_frame_landmarks = []
         try:
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                # Process frame at specified intervals
-                if frame_count % frame_interval == 0:
-                    landmarks = self.extract_from_array(frame)
+            for landmarks in frames_landmarks:
+                if json_writer is not None:
+                    json_writer.write(landmarks)
+                if return_landmarks:
                     all_frame_landmarks.append(landmarks)
+        finally:
+            # Finish pending frame writes before releasing the writer
+            frames_landmarks.close()
+            if writer is not None:
+                writer.release()
+            if json_writer is not None:
+                json_writer.close()
 
-                frame_count += 1
+        return all_frame_landmarks
+
+    def _process_video(
+        self,
+        cap: cv2.VideoCapture,
+        frame_interval: int = 1,
+        writer: Optional[cv2.VideoWriter] = None,
+        batch_size: int = 1,
+        buffer_size: int = _VIDEO_PREFETCH,
+        detect_resolution: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[List[np.ndarray]]:
+        """Extracts landmarks from a video as a reader/extract/writer pipeline.
+
+        Frames are decoded on a background thread up to ``buffer_size`` frames
+        ahead while this thread extracts landmarks from batches of up to
+        ``batch_size`` analyzed frames. When ``writer`` is given,
+        annotated frames are encoded on another background thread, so decoding,
+        extraction and encoding overlap (cv2 releases the GIL).
+
+        Args:
+            cap: Opened video capture object; released once all frames are read.
+            frame_interval: Interval between frames to analyze.
+            writer: Video writer receiving every frame, with landmarks drawn on
+                the analyzed ones, or None to skip annotation.
+            batch_size: Number of analyzed frames passed to ``extract_from_batch``
+                at a time.
+            buffer_size: Maximum number of frames buffered between stages.
+            detect_resolution: Size (width, height) analyzed frames are
+                downscaled to before extraction, or None to keep their size.
+
+        Yields:
+            Landmark arrays of the faces in each analyzed frame, in native video
+            coordinates.
+        """
+        scale = None
+        if detect_resolution is not None:
+            # Factor from detection back to native video coordinates
+            scale = np.array(
+                [
+                    cap.get(cv2.CAP_PROP_FRAME_WIDTH) / detect_resolution[0],
+                    cap.get(cv2.CAP_PROP_FRAME_HEIGHT) / detect_resolution[1],
+                ]
+            )
+
+        pending_writes = deque()
+        frames = self._read_video_frames(
+            cap, frame_interval, decode_all=writer is not None
+        )
+
+        chunks = self._group_video_frames(
+            prefetch(frames, size=buffer_size),
+            batch_size,
+            max(batch_size, buffer_size),
+        )
+
+        with ThreadPoolExecutor(max_workers=1) as write_executor:
+            for chunk in chunks:
+                images = [frame for frame, selected in chunk if selected]
+                if detect_resolution is not None:
+                    images = [
+                        self._resize_frame(image, detect_resolution) for image in images
+                    ]
+                batch_landmarks = self.extract_from_batch(images)
+                if scale is not None:
+                    batch_landmarks = [
+                        [self._rescale_landmarks(points, scale) for points in faces]
+                        for faces in batch_landmarks
+                    ]
+                batch_landmarks = iter(batch_landmarks)
+
+                for frame, selected in chunk:
+                    if selected:
+                        landmarks = next(batch_landmarks)
+                        yield landmarks
+                        if writer is not None:
+                            frame = self._draw_landmarks(frame, landmarks, inplace=True)
+
+                    if writer is not None:
+                        # Bound the number of frames waiting to be written
+                        if len(pending_writes) >= buffer_size:
+                            pending_writes.popleft().result()
+                        pending_writes.append(
+                            write_executor.submit(writer.write, frame)
+                        )
+
+            while pending_writes:
+                pending_writes.popleft().result()
+
+    @staticmethod
+    def _resize_frame(frame: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+        """Downscales a frame to ``size`` (width, height) unless it already matches.
+
+        Args:
+            frame: Frame to resize.
+            size: Target size as (width, height).
+
+        Returns:
+            np.ndarray: The resized frame.
+        """
+        if frame.shape[1::-1] == tuple(size):
+            return frame
+        return cv2.resize(frame, tuple(size), interpolation=cv2.INTER_AREA)
+
+    @staticmethod
+    def _rescale_landmarks(landmarks: np.ndarray, scale: np.ndarray) -> np.ndarray:
+        """Scales the (x, y) columns of a landmark array by per-axis factors.
+
+        Args:
+            landmarks: Landmark array of shape (num_landmarks, 2 or more).
+            scale: Factors (x, y) to multiply the coordinates by.
+
+        Returns:
+            np.ndarray: Rescaled copy of the landmarks.
+        """
+        rescaled = landmarks.astype(np.result_type(landmarks.dtype, np.float32))
+        rescaled[:, :2] *= scale
+        return rescaled
+
+    @staticmethod
+    def _group_video_frames(
+        frames: Iterator[Tuple[np.ndarray, bool]],
+        batch_size: int,
+        max_frames: int,
+    ) -> Iterator[List[Tuple[np.ndarray, bool]]]:
+        """Groups decoded frames into chunks holding one extraction batch each.
+
+        A chunk ends once it holds ``batch_size`` analyzed frames, or
+        ``max_frames`` frames in total so that frames decoded only for
+        annotation do not pile up when ``frame_interval`` is large.
 
+        Args:
+            frames: Tuples of (frame, selected) as yielded by ``_read_video_frames``.
+            batch_size: Number of analyzed frames per chunk.
+            max_frames: Maximum number of frames per chunk.
+
+        Yields:
+            Lists of (frame, selected) tuples in frame order.
+        """
+        chunk = []
+        num_selected = 0
+        for frame, selected in frames:
+            chunk.append((frame, selected))
+            num_selected += selected
+            if num_selected >= batch_size or len(chunk) >= max_frames:
+                yield chunk
+                chunk = []
+                num_selected = 0
+        if chunk:
+            yield chunk
+
+    def _read_video_frames(
+        self,
+        cap: cv2.VideoCapture,
+        frame_interval: int = 1,
+        decode_all: bool = False,
+    ) -> Iterator[Tuple[np.ndarray, bool]]:
+        """Decodes frames from a video and releases it once iteration ends.
+
+        Args:
+            cap: Opened video capture object.
+            frame_interval: Interval between frames to analyze.
+            decode_all: Whether to decode every frame rather than only the
+                frames selected by ``frame_interval``.
+
+        Yields:
+            Tuples of (frame, selected), where ``selected`` tells whether the
+            frame falls on ``frame_interval``.
+        """
+        try:
+            frame_count = 0
+            # Advance without decoding; only decode frames that are needed
+            while cap.grab():
+                selected = frame_count % frame_interval == 0
+                if selected or decode_all:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    yield frame, selected
+                frame_count += 1
         finally:
             cap.release()
 
-        # Save results if requested
-        if save_json:
-            self._save_video_landmarks_to_json(
-                all_frame_landmarks, video_path, json_path
-            )
+    def extract_from_folder(
+        self,
+        images_folder: str,
+        save_json: bool = True,
+        json_path: str = "folder_landmarks.json",
+        save_annotated: bool = False,
+        output_folder: str = "output",
+        num_processes: Optional[int] = None,
+        image_extensions: tuple = (".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp"),
+        extractor_kwargs: Optional[dict] = None,
+    ) -> Dict[str, List[np.ndarray]]:
+        """Extracts landmarks from all images in a folder using a process pool.
 
-        if save_annotated:
-            self._save_annotated_video(
-                video_path, all_frame_landmarks, output_folder, frame_interval
+        Each worker process creates its own extractor once, from this
+        extractor's class and ``extractor_kwargs``, rather than receiving a
+        pickled copy of this instance. Workers are started with "spawn" so that
+        no CUDA or MediaPipe state is inherited from this process.
+
+        Args:
+            images_folder: Path to the folder containing input images.
+            save_json: Whether to save landmark results to JSON file.
+            json_path: Path where to save the consolidated JSON file.
+            save_annotated: Whether to save annotated images with landmarks.
+            output_folder: Folder path where to save annotated images.
+            num_processes: Number of worker processes. Defaults to the number
+                of CPU cores. Runs in this process if set to 0 or 1.
+            image_extensions: Tuple of valid image file extensions.
+            extractor_kwargs: Keyword arguments used to create the extractor in
+                each worker. Defaults to this extractor's confidence threshold.
+
+        Returns:
+            Dictionary mapping each image filename to the landmark arrays of the
+            faces detected in it.
+
+        Raises:
+            ValueError: If the images folder doesn't exist or contains no valid images.
+        """
+        if not os.path.exists(images_folder):
+            raise ValueError(f"Images folder does not exist: {images_folder}")
+
+        extensions = frozenset(ext.lower() for ext in image_extensions)
+        images = sorted(
+            name
+            for name in os.listdir(images_folder)
+            if os.path.splitext(name)[1].lower() in extensions
+        )
+        if not images:
+            raise ValueError(f"No valid images found in {images_folder}")
+
+        print(f"Found {len(images)} images to process")
+
+        if num_processes is None:
+            num_processes = get_cpu_count()
+        num_processes = min(num_processes, len(images))
+
+        if num_processes <= 1:
+            results = (
+                self._extract_folder_image(
+                    image_filename, images_folder, output_folder, save_annotated
+                )
+                for image_filename in tqdm(images, desc="Extracting landmarks")
+            )
+        else:
+            if extractor_kwargs is None:
+                extractor_kwargs = {"confidence_threshold": self.confidence_threshold}
+
+            # Load the extractor once per worker process, not once per image
+            processor = MultiProcessor(
+                num_processes=num_processes,
+                initializer_func=_init_folder_worker,
+                initializer_args=(type(self), extractor_kwargs),
+                start_mode="spawn",
+            )
+            results = processor.process(
+                function=_extract_image_for_folder_worker,
+                iterable=[
+                    (image_filename, images_folder, output_folder, save_annotated)
+                    for image_filename in images
+                ],
+                description="Extracting landmarks",
             )
 
-        return all_frame_landmarks
+        folder_landmarks = dict(results)
+
+        if save_json:
+            os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+            results = [
+                _image_landmarks_entry(
+                    os.path.join(images_folder, name), folder_landmarks[name]
+                )
+                for name in images
+            ]
+            with open(json_path, "wb") as f:
+                f.write(_dumps_json(results))
+
+        return folder_landmarks
+
+    def _extract_folder_image(
+        self,
+        image_filename: str,
+        images_folder: str,
+        output_folder: str,
+        save_annotated: bool,
+    ) -> Tuple[str, List[np.ndarray]]:
+        """Extracts landmarks from one image of a folder, reporting errors per image.
+
+        Args:
+            image_filename: Name of the image file.
+            images_folder: Path to the folder containing the image.
+            output_folder: Folder path where to save the annotated image.
+            save_annotated: Whether to save the annotated image.
+
+        Returns:
+            Tuple of the image filename and its landmark arrays, empty on error.
+        """
+        image_path = os.path.join(images_folder, image_filename)
+        try:
+            # Annotated images are saved at full size, otherwise decode reduced
+            if save_annotated:
+                image, scale = self._load_image(image_path), None
+            else:
+                image, scale = self._load_image_reduced(image_path)
+            landmarks_list = self.extract_from_array(image)
+            if scale is not None:
+                scale = np.array(scale)
+                landmarks_list = [
+                    self._rescale_landmarks(landmarks, scale)
+                    for landmarks in landmarks_list
+                ]
+            if save_annotated:
+                name, ext = os.path.splitext(image_filename)
+                os.makedirs(output_folder, exist_ok=True)
+                cv2.imwrite(
+                    os.path.join(output_folder, f"{name}_landmarks{ext}"),
+                    self._draw_landmarks(image, landmarks_list, inplace=True),
+                )
+        except Exception as e:
+            print(f"Error processing {image_filename}: {str(e)}")
+            return image_filename, []
+
+        return image_filename, landmarks_list
 
     def extract(
         self,
@@ -200,24 +830,21 @@ class BaseLandmarkExtractor(ABC):
             ValueError: If the media file format is not supported.
         """
         # Determine if input is image or video based on file extension
-        _, ext = os.path.splitext(media_path.lower())
-
-        image_extensions = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp"}
-        video_extensions = {".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv", ".webm"}
+        ext = os.path.splitext(media_path)[1].lower()
 
         # Auto-generate JSON path if not provided
         if json_path is None:
             base_name = os.path.splitext(os.path.basename(media_path))[0]
-            if ext in image_extensions:
+            if ext in _IMAGE_EXTENSIONS:
                 json_path = f"{base_name}_landmarks.json"
             else:
                 json_path = f"{base_name}_video_landmarks.json"
 
-        if ext in image_extensions:
+        if ext in _IMAGE_EXTENSIONS:
             return self.extract_from_image(
                 media_path, save_json, json_path, save_annotated, output_folder
             )
-        elif ext in video_extensions:
+        elif ext in _VIDEO_EXTENSIONS:
             return self.extract_from_video(
                 media_path,
                 save_json,
@@ -247,22 +874,10 @@ class BaseLandmarkExtractor(ABC):
             exist_ok=True,
         )
 
-        results = {
-            "image_path": image_path,
-            "num_faces": len(landmarks_list),
-            "landmarks": [],
-        }
+        results = _image_landmarks_entry(image_path, landmarks_list)
 
-        for i, landmarks in enumerate(landmarks_list):
-            face_landmarks = {
-                "face_id": i,
-                "num_landmarks": len(landmarks),
-                "points": landmarks.tolist(),  # Convert numpy array to list for JSON
-            }
-            results["landmarks"].append(face_landmarks)
-
-        with open(json_path, "w") as f:
-            json.dump(results, f, indent=2)
+        with open(json_path, "wb") as f:
+            f.write(_dumps_json(results))
 
     def _save_video_landmarks_to_json(
         self,
@@ -277,61 +892,42 @@ class BaseLandmarkExtractor(ABC):
             video_path: Path to the source video.
             json_path: Path where to save the JSON file.
         """
-        os.makedirs(
-            os.path.dirname(json_path) if os.path.dirname(json_path) else ".",
-            exist_ok=True,
-        )
-
-        results = {
-            "video_path": video_path,
-            "num_frames": len(all_frame_landmarks),
-            "frames": [],
-        }
-
-        for frame_idx, frame_landmarks in enumerate(all_frame_landmarks):
-            frame_data = {
-                "frame_number": frame_idx,
-                "num_faces": len(frame_landmarks),
-                "landmarks": [],
-            }
-
-            for face_idx, landmarks in enumerate(frame_landmarks):
-                face_landmarks = {
-                    "face_id": face_idx,
-                    "num_landmarks": len(landmarks),
-                    "points": landmarks.tolist(),
-                }
-                frame_data["landmarks"].append(face_landmarks)
-
-            results["frames"].append(frame_data)
-
-        with open(json_path, "w") as f:
-            json.dump(results, f, indent=2)
+        with _VideoJsonWriter(json_path, video_path) as writer:
+            for frame_landmarks in all_frame_landmarks:
+                writer.write(frame_landmarks)
 
     def _draw_landmarks(
-        self, image: np.ndarray, landmarks_list: List[np.ndarray]
+        self,
+        image: np.ndarray,
+        landmarks_list: List[np.ndarray],
+        inplace: bool = False,
     ) -> np.ndarray:
         """Draws landmarks on the image.
 
         Args:
             image: Input image as numpy array.
             landmarks_list: List of landmark arrays for each face.
+            inplace: Whether to draw on ``image`` itself instead of a copy, for
+                callers that discard the original frame anyway.
 
         Returns:
-            np.ndarray: Copy of input image with landmarks drawn.
+            np.ndarray: Copy of input image with landmarks drawn, or ``image``
+            itself if ``inplace`` is True.
         """
-        annotated_image = image.copy()
-
-        for landmarks in landmarks_list:
-            # Draw each landmark point
-            for x, y in landmarks:
-                cv2.circle(
-                    annotated_image,
-                    (int(x), int(y)),
-                    radius=2,
-                    color=(0, 255, 0),  # Green color
-                    thickness=-1,
-                )
+        annotated_image = image if inplace else image.copy()
+        if not landmarks_list:
+            return annotated_image
+
+        # Paint a filled dot around every point of every face at once,
+        # instead of one cv2.circle call per point
+        points = np.concatenate(landmarks_list)[:, :2].astype(np.int32)
+        ys = (points[:, 1, None] + _DOT_OFFSETS_Y).ravel()
+        xs = (points[:, 0, None] + _DOT_OFFSETS_X).ravel()
+
+        # Skip pixels outside the image, as cv2.circle does
+        height, width = annotated_image.shape[:2]
+        inside = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+        annotated_image[ys[inside], xs[inside]] = _LANDMARK_COLOR
 
         return annotated_image
 
@@ -380,6 +976,10 @@ class BaseLandmarkExtractor(ABC):
     ) -> str:
         """Saves annotated video with landmark results.
 
+        ``extract_from_video`` annotates frames in the same pass that extracts
+        them; this decodes the video again and is only kept for callers that
+        already hold the landmarks of every analyzed frame.
+
         Args:
             video_path: Path to the original video.
             all_frame_landmarks: List of landmark lists for each processed frame.
@@ -388,12 +988,58 @@ class BaseLandmarkExtractor(ABC):
 
         Returns:
             str: Path to the saved annotated video.
-        """
-        # Create output directory if it doesn't exist
-        os.makedirs(output_folder, exist_ok=True)
 
+        Raises:
+            ValueError: If the number of landmark lists does not match the number
+                of frames analyzed at ``frame_interval``.
+        """
         # Open input video
         cap = self._load_video(video_path)
+        out, output_path = self._create_video_writer(cap, video_path, output_folder)
+
+        landmarks_idx = 0
+        try:
+            for frame, selected in self._read_video_frames(
+                cap, frame_interval, decode_all=True
+            ):
+                # Draw landmarks on frames that were processed
+                if selected:
+                    if landmarks_idx < len(all_frame_landmarks):
+                        frame = self._draw_landmarks(
+                            frame, all_frame_landmarks[landmarks_idx], inplace=True
+                        )
+                    landmarks_idx += 1
+
+                out.write(frame)
+        finally:
+            out.release()
+
+        if landmarks_idx != len(all_frame_landmarks):
+            raise ValueError(
+                f"Got landmarks for {len(all_frame_landmarks)} frames, but "
+                f"{video_path} has {landmarks_idx} frames at interval {frame_interval}"
+            )
+
+        return output_path
+
+    def _create_video_writer(
+        self,
+        cap: cv2.VideoCapture,
+        video_path: str,
+        output_folder: str,
+    ) -> Tuple[cv2.VideoWriter, str]:
+        """Creates a writer for the annotated version of a video.
+
+        Args:
+            cap: Opened capture of the original video, used for its properties.
+            video_path: Path to the original video.
+            output_folder: Folder where to save the annotated video.
+
+        Returns:
+            Tuple of the video writer and the path it writes to.
+        """
+        # Create output directory if it doesn't exist
+        os.makedirs(output_folder, exist_ok=True)
 
         # Get video properties
         fps = int(cap.get(cv2.CAP_PROP_FPS))
@@ -410,29 +1056,4 @@ class BaseLandmarkExtractor(ABC):
         fourcc = cv2.VideoWriter_fourcc(*"mp4v")
         out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
 
-        try:
-            frame_count = 0
-            landmarks_idx = 0
-
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                # Draw landmarks on frames that were processed
-                if frame_count % frame_interval == 0 and landmarks_idx < len(
-                    all_frame_landmarks
-                ):
-                    frame = self._draw_landmarks(
-                        frame, all_frame_landmarks[landmarks_idx]
-                    )
-                    landmarks_idx += 1
-
-                out.write(frame)
-                frame_count += 1
-
-        finally:
-            cap.release()
-            out.release()
-
-        return output_path
+        return out, output_path
@@ -20,6 +20,7 @@ import pandas as pd
 import torch
 
 from mukh.deepfake_detection import DeepfakeDetector
+from mukh.deepfake_detection.models.base import share_video_frames
 
 
 class PipelineDeepfakeDetection:
@@ -39,6 +40,7 @@ class PipelineDeepfakeDetection:
         model_configs: Dict[str, float],
         device: Optional[str] = None,
         confidence_threshold: float = 0.5,
+        detectors: Optional[Dict[str, DeepfakeDetector]] = None,
     ):
         """Initialize the ensemble deepfake detector.
 
@@ -47,6 +49,9 @@ class PipelineDeepfakeDetection:
                           e.g., {"resnet_inception": 0.5, "efficientnet": 0.5}
             device: Device to run inference on ('cpu' or 'cuda'). Auto-detected if None
             confidence_threshold: Threshold for ensemble prediction (default: 0.5)
+            detectors: Already loaded member detectors keyed by model name, e.g. to
+                      share them between pipelines with different weights.
+                      Missing members are loaded on first use.
         """
         self.model_configs = model_configs
         self.confidence_threshold = confidence_threshold
@@ -60,6 +65,9 @@ class PipelineDeepfakeDetection:
         # Validate model configurations
         self._validate_model_configs()
 
+        # Member detectors, loaded on first use and reused across detect() calls
+        self._detectors: Dict[str, DeepfakeDetector] = dict(detectors or {})
+
     def _validate_model_configs(self) -> None:
         """Validate model configurations.
 
@@ -81,6 +89,25 @@ class PipelineDeepfakeDetection:
         if total_weight <= 0:
             raise ValueError("Total weight must be positive")
 
+    def _get_model_detector(self, model_name: str) -> DeepfakeDetector:
+        """Get the detector for a member model, loading its weights once.
+
+        Args:
+            model_name: Name of the member model
+
+        Returns:
+            DeepfakeDetector instance for the model
+        """
+        detector = self._detectors.get(model_name)
+        if detector is None:
+            detector = DeepfakeDetector(
+                model_name=model_name,
+                confidence_threshold=0.5,  # Use default threshold for individual models
+                device=self.device,
+            )
+            self._detectors[model_name] = detector
+        return detector
+
     def _run_individual_models(
         self,
         media_path: str,
@@ -109,12 +136,7 @@ class PipelineDeepfakeDetection:
             print(f"Running {model_name} model...")
 
             try:
-                # Create detector
-                detector = DeepfakeDetector(
-                    model_name=model_name,
-                    confidence_threshold=0.5,  # Use default threshold for individual models
-                    device=self.device,
-                )
+                detector = self._get_model_detector(model_name)
 
                 # Set up CSV path for this model
                 csv_path = os.path.join(output_folder, f"{model_name}_detections.csv")
@@ -261,13 +283,14 @@ class PipelineDeepfakeDetection:
         print(f"Output folder: {output_folder}")
         print(f"Device: {self.device}")
 
-        # Run individual models
-        detection_dataframes, success = self._run_individual_models(
-            media_path=media_path,
-            output_folder=output_folder,
-            save_csv=save_csv,
-            num_frames=num_frames,
-        )
+        # Run individual models, decoding the video's frames only once
+        with share_video_frames():
+            detection_dataframes, success = self._run_individual_models(
+                media_path=media_path,
+                output_folder=output_folder,
+                save_csv=save_csv,
+                num_frames=num_frames,
+            )
 
         if success and detection_dataframes:
             # Perform weighted averaging
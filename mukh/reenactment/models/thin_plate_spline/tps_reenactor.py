@@ -5,8 +5,10 @@ Source: https://github.com/yoyo-nb/Thin-Plate-Spline-Motion-Model
 LICENSE: MIT License
 """
 
+import collections
+import contextlib
 import os
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import cv2
 import imageio
@@ -18,9 +20,14 @@ from skimage.transform import resize
 from mukh.reenactment.models.base_reenactor import BaseFaceReenactor
 from mukh.reenactment.models.thin_plate_spline.utils import (
     find_best_frame,
+    iter_animation,
     load_checkpoints,
     make_animation,
 )
+from mukh.utils.parallel import prefetch
+
+# Number of frames each pipeline stage may run ahead of the next one
+_PIPELINE_DEPTH = 4
 
 
 class ThinPlateSplineReenactor(BaseFaceReenactor):
@@ -36,6 +43,8 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
         predict_mode: Animation prediction mode ('standard', 'relative', 'avd').
         find_best_frame: Whether to find the best frame when using relative mode.
         pixel: Resolution to resize images to (default: 256).
+        mixed_precision: Whether to run the inpainting network in float16 on CUDA.
+        compile_model: Whether the networks are wrapped with torch.compile.
     """
 
     def __init__(
@@ -46,6 +55,8 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
         predict_mode: str = "relative",
         find_best_frame: bool = False,
         pixel: int = 256,
+        mixed_precision: bool = False,
+        compile_model: bool = False,
     ):
         """Initializes the TPS face reenactor.
 
@@ -58,12 +69,20 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
             find_best_frame: Whether to find the best frame when using relative mode.
                 Defaults to True.
             pixel: Resolution to resize images to. Defaults to 256.
+            mixed_precision: Whether to run the inpainting network under float16
+                autocast when the device is CUDA. This slightly changes the
+                generated frames, so it is opt-in. Defaults to False.
+            compile_model: Whether to wrap the keypoint detector, dense motion and
+                inpainting networks with torch.compile. The first batch of each
+                size pays the compilation cost. Defaults to False.
         """
         super().__init__(model_path, device)
         self.config_path = config_path
         self.predict_mode = predict_mode
         self.find_best_frame = find_best_frame
         self.pixel = pixel
+        self.mixed_precision = mixed_precision
+        self.compile_model = compile_model
         self.device = torch.device(device)
 
         # Initialize model components to None
@@ -98,6 +117,14 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
         except Exception as e:
             raise ValueError(f"Failed to load model from {self.model_path}: {str(e)}")
 
+        if self.compile_model:
+            # Default mode rather than "reduce-overhead": CUDA graph outputs are
+            # overwritten by the next call, but the source keypoints are reused
+            # across every keypoint detector call
+            self.kp_detector = torch.compile(self.kp_detector)
+            self.dense_motion_network = torch.compile(self.dense_motion_network)
+            self.inpainting = torch.compile(self.inpainting)
+
     def _read_image(self, image_path: str) -> np.ndarray:
         """Reads and preprocesses an image from a file path.
 
@@ -111,11 +138,21 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
             ValueError: If the image cannot be read.
         """
         try:
-            image = imageio.imread(image_path)
-            return resize(image, (self.pixel, self.pixel))[..., :3]
+            return self._resize_to_model(imageio.imread(image_path))
         except Exception as e:
             raise ValueError(f"Failed to read image from {image_path}: {str(e)}")
 
+    def _resize_to_model(self, image: np.ndarray) -> np.ndarray:
+        """Resizes an image or frame to the model resolution, dropping alpha.
+
+        Args:
+            image: Image as read by imageio.
+
+        Returns:
+            Float image of shape (pixel, pixel, 3) in [0, 1].
+        """
+        return resize(image, (self.pixel, self.pixel))[..., :3]
+
     def _read_video(self, video_path: str) -> Tuple[list, float]:
         """Reads and preprocesses a video from a file path.
 
@@ -131,23 +168,27 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
         try:
             reader = imageio.get_reader(video_path)
             fps = reader.get_meta_data()["fps"]
-            frames = []
-
-            try:
-                for im in reader:
-                    frames.append(im)
-            except RuntimeError:
-                pass
-            finally:
-                reader.close()
-
-            frames = [
-                resize(frame, (self.pixel, self.pixel))[..., :3] for frame in frames
-            ]
-            return frames, fps
+            return list(self._iter_video(reader)), fps
         except Exception as e:
             raise ValueError(f"Failed to read video from {video_path}: {str(e)}")
 
+    def _iter_video(self, reader: Any) -> Iterator[np.ndarray]:
+        """Yields preprocessed frames from an open video reader, closing it at the end.
+
+        Args:
+            reader: imageio reader for the video.
+
+        Yields:
+            Frames resized to the model resolution.
+        """
+        try:
+            for frame in reader:
+                yield self._resize_to_model(frame)
+        except RuntimeError:
+            pass
+        finally:
+            reader.close()
+
     def _postprocess(self, predictions: list, original_shape: Tuple[int, int]) -> list:
         """Postprocesses the generated frames to match original image resolution.
 
@@ -169,6 +210,29 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
 
         return postprocessed
 
+    def _comparison_frame(
+        self,
+        resized_source: np.ndarray,
+        driving_frame: np.ndarray,
+        prediction: np.ndarray,
+    ) -> np.ndarray:
+        """Builds one side-by-side comparison frame.
+
+        Args:
+            resized_source: Source image already resized to the prediction shape.
+            driving_frame: Driving video frame.
+            prediction: Generated frame.
+
+        Returns:
+            uint8 frame with source, driving and generated images side by side.
+        """
+        target_shape = prediction.shape[:2]
+        if driving_frame.shape[:2] != target_shape:
+            driving_frame = resize(driving_frame, target_shape, anti_aliasing=True)
+        return img_as_ubyte(
+            np.concatenate([resized_source, driving_frame, prediction], axis=1)
+        )
+
     def _save_comparison_animation(
         self,
         source_image: np.ndarray,
@@ -189,32 +253,15 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
         Returns:
             str: Path to the saved comparison animation
         """
-        import matplotlib.animation as animation
-        import matplotlib.pyplot as plt
-
-        # Resize all inputs to match dimensions
+        # Resize the source once to match the generated frames
         target_shape = predictions[0].shape[:2]
         resized_source = resize(source_image, target_shape, anti_aliasing=True)
-        resized_driving = [
-            resize(frame, target_shape, anti_aliasing=True) for frame in driving_video
-        ]
-
-        fig = plt.figure(figsize=(12, 6))
-
-        ims = []
-        for i in range(len(resized_driving)):
-            cols = [resized_source]
-            cols.append(resized_driving[i])
-            cols.append(predictions[i])
-            im = plt.imshow(np.concatenate(cols, axis=1), animated=True)
-            plt.axis("off")
-            ims.append([im])
 
-        ani = animation.ArtistAnimation(fig, ims, interval=50, repeat_delay=1000)
-
-        # Save the comparison animation
-        ani.save(output_path, writer="ffmpeg", fps=fps)
-        plt.close()
+        with imageio.get_writer(output_path, fps=fps) as writer:
+            for driving_frame, prediction in zip(driving_video, predictions):
+                writer.append_data(
+                    self._comparison_frame(resized_source, driving_frame, prediction)
+                )
 
         return output_path
 
@@ -225,6 +272,7 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
         output_path: Optional[str] = "output",
         save_comparison: bool = False,
         resize_to_image_resolution: bool = True,
+        batch_size: int = 4,
     ) -> str:
         """Performs face reenactment using a source image and driving video.
 
@@ -236,6 +284,9 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
                 driving, and generated frames side by side. Defaults to False.
             resize_to_image_resolution: Whether to resize the output video to match
                 the original source image resolution. Defaults to True.
+            batch_size: Number of driving frames run through the model per forward
+                pass. Reduced automatically if a batch runs out of GPU memory.
+                Defaults to 4.
 
         Returns:
             str: Path to the generated output video.
@@ -249,8 +300,8 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
                 f"Failed to read original source image from {source_path}: {str(e)}"
             )
 
-        source_image = self._read_image(source_path)
-        driving_video, fps = self._read_video(driving_video_path)
+        # Reuse the decoded source instead of reading the file a second time
+        source_image = self._resize_to_model(original_source)
 
         # Extract filenames without extensions for both source and driving
         source_name = os.path.splitext(os.path.basename(source_path))[0]
@@ -264,8 +315,16 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
             output_path, f"reenacted_{source_name}_by_{driving_name}.mp4"
         )
 
+        # Create comparison output path if requested
+        comparison_path = (
+            os.path.join(output_path, f"comparison_{source_name}_by_{driving_name}.mp4")
+            if save_comparison
+            else None
+        )
+
         # Perform reenactment based on predict_mode and find_best_frame settings
         if self.predict_mode == "relative" and self.find_best_frame:
+            driving_video, fps = self._read_video(driving_video_path)
             i = find_best_frame(source_image, driving_video, self.device.type == "cpu")
 
             driving_forward = driving_video[i:]
@@ -280,6 +339,8 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
                 self.avd_network,
                 device=self.device,
                 mode=self.predict_mode,
+                batch_size=batch_size,
+                mixed_precision=self.mixed_precision,
             )
 
             predictions_backward = make_animation(
@@ -291,40 +352,128 @@ class ThinPlateSplineReenactor(BaseFaceReenactor):
                 self.avd_network,
                 device=self.device,
                 mode=self.predict_mode,
+                batch_size=batch_size,
+                mixed_precision=self.mixed_precision,
             )
 
             predictions = predictions_backward[::-1] + predictions_forward[1:]
+
+            # Postprocess predictions if needed
+            if resize_to_image_resolution:
+                predictions = self._postprocess(predictions, original_shape)
+
+            # Save the resulting video
+            imageio.mimsave(
+                output_video_path,
+                [img_as_ubyte(frame) for frame in predictions],
+                fps=fps,
+            )
+
+            # Optionally save comparison animation
+            if comparison_path is not None:
+                self._save_comparison_animation(
+                    source_image, driving_video, predictions, comparison_path, fps
+                )
         else:
-            predictions = make_animation(
+            self._reenact_streaming(
                 source_image,
-                driving_video,
-                self.inpainting,
-                self.kp_detector,
-                self.dense_motion_network,
-                self.avd_network,
-                device=self.device,
-                mode=self.predict_mode,
+                driving_video_path,
+                output_video_path,
+                original_shape if resize_to_image_resolution else None,
+                comparison_path=comparison_path,
+                batch_size=batch_size,
             )
 
-        # Postprocess predictions if needed
-        if resize_to_image_resolution:
-            predictions = self._postprocess(predictions, original_shape)
+        return output_video_path
 
-        # Save the resulting video
-        imageio.mimsave(
-            output_video_path, [img_as_ubyte(frame) for frame in predictions], fps=fps
-        )
+    def _reenact_streaming(
+        self,
+        source_image: np.ndarray,
+        driving_video_path: str,
+        output_video_path: str,
+        original_shape: Optional[Tuple[int, int]],
+        comparison_path: Optional[str] = None,
+        batch_size: int = 4,
+    ) -> float:
+        """Reenacts a driving video as a decode -> inference -> encode pipeline.
+
+        Decoding and inference each run in a background thread, bounded to
+        ``_PIPELINE_DEPTH`` frames ahead, while this thread resizes and encodes
+        the generated frames. Comparison frames are encoded alongside them, so
+        neither the driving video nor the generated frames are held in memory.
+
+        Args:
+            source_image: Preprocessed source image.
+            driving_video_path: Path to the driving video.
+            output_video_path: Path where to write the generated video.
+            original_shape: Shape (height, width) to resize generated frames to,
+                or None to keep the model resolution.
+            comparison_path: Path where to write the side-by-side comparison
+                video, or None to skip it.
+            batch_size: Number of driving frames per forward pass.
 
-        # Optionally save comparison animation
-        if save_comparison:
-            # Create comparison output path
-            comparison_path = os.path.join(
-                output_path, f"comparison_{source_name}_by_{driving_name}.mp4"
+        Returns:
+            Frames per second of the driving video.
+
+        Raises:
+            ValueError: If the driving video cannot be read.
+        """
+        try:
+            reader = imageio.get_reader(driving_video_path)
+            fps = reader.get_meta_data()["fps"]
+        except Exception as e:
+            raise ValueError(
+                f"Failed to read video from {driving_video_path}: {str(e)}"
             )
 
-            # Create and save the comparison animation
-            self._save_comparison_animation(
-                source_image, driving_video, predictions, comparison_path, fps
+        # Driving frames still waiting for their generated frame, oldest first
+        pending = collections.deque()
+
+        def driving_frames() -> Iterator[np.ndarray]:
+            for frame in self._iter_video(reader):
+                if comparison_path is not None:
+                    pending.append(frame)
+                yield frame
+
+        generated = iter_animation(
+            source_image,
+            prefetch(driving_frames(), size=_PIPELINE_DEPTH),
+            self.inpainting,
+            self.kp_detector,
+            self.dense_motion_network,
+            self.avd_network,
+            device=self.device,
+            mode=self.predict_mode,
+            batch_size=batch_size,
+            mixed_precision=self.mixed_precision,
+        )
+
+        num_frames = 0
+        resized_source = None
+        with contextlib.ExitStack() as stack:
+            writer = stack.enter_context(imageio.get_writer(output_video_path, fps=fps))
+            comparison_writer = (
+                stack.enter_context(imageio.get_writer(comparison_path, fps=fps))
+                if comparison_path is not None
+                else None
             )
 
-        return output_video_path
+            for frame in prefetch(generated, size=_PIPELINE_DEPTH):
+                if original_shape is not None and frame.shape[:2] != original_shape:
+                    frame = resize(frame, original_shape, anti_aliasing=True)
+                writer.append_data(img_as_ubyte(frame))
+
+                if comparison_writer is not None:
+                    if resized_source is None:
+                        resized_source = resize(
+                            source_image, frame.shape[:2], anti_aliasing=True
+                        )
+                    comparison_writer.append_data(
+                        self._comparison_frame(resized_source, pending.popleft(), frame)
+                    )
+                num_frames += 1
+
+        if num_frames == 0:
+            raise ValueError(f"Failed to read video from {driving_video_path}")
+
+        return fps
@@ -98,49 +98,115 @@ def make_animation(
     avd_network,
     device,
     mode="relative",
+    batch_size=1,
+    mixed_precision=False,
 ):
-    assert mode in ["standard", "relative", "avd"]
-    with torch.no_grad():
-        predictions = []
-        source = torch.tensor(source_image[np.newaxis].astype(np.float32)).permute(
-            0, 3, 1, 2
+    return list(
+        iter_animation(
+            source_image,
+            driving_video,
+            inpainting_network,
+            kp_detector,
+            dense_motion_network,
+            avd_network,
+            device=device,
+            mode=mode,
+            batch_size=batch_size,
+            mixed_precision=mixed_precision,
         )
-        source = source.to(device)
+    )
+
+
+@torch.no_grad()
+def iter_animation(
+    source_image,
+    driving_frames,
+    inpainting_network,
+    kp_detector,
+    dense_motion_network,
+    avd_network,
+    device,
+    mode="relative",
+    batch_size=1,
+    mixed_precision=False,
+):
+    """Yields one generated frame per driving frame.
+
+    Unlike ``make_animation`` the driving frames may be any iterable, so frames
+    can be decoded and generated frames encoded while inference is running.
+    Up to ``batch_size`` driving frames go through the networks in a single
+    forward pass; the batch size is halved for the rest of the video whenever
+    a batch runs out of GPU memory.
+
+    With ``mixed_precision`` on a CUDA device the inpainting network runs under
+    float16 autocast. Keypoints and the TPS warp stay in float32, since the
+    warp solves a linear system and takes ``log(r + 1e-9)`` of distances.
+    """
+    assert mode in ["standard", "relative", "avd"]
+    source = torch.tensor(source_image[np.newaxis].astype(np.float32)).permute(
+        0, 3, 1, 2
+    )
+    source = source.to(device)
+    kp_source = kp_detector(source)
+    kp_driving_initial = None
+    use_autocast = mixed_precision and torch.device(device).type == "cuda"
+
+    def animate(frames):
+        nonlocal kp_driving_initial
         driving = (
-            torch.tensor(np.array(driving_video)[np.newaxis].astype(np.float32))
-            .permute(0, 4, 1, 2, 3)
+            torch.tensor(np.stack(frames).astype(np.float32))
+            .permute(0, 3, 1, 2)
             .to(device)
         )
-        kp_source = kp_detector(source)
-        kp_driving_initial = kp_detector(driving[:, :, 0])
-
-        for frame_idx in tqdm(range(driving.shape[2])):
-            driving_frame = driving[:, :, frame_idx]
-            driving_frame = driving_frame.to(device)
-            kp_driving = kp_detector(driving_frame)
-            if mode == "standard":
-                kp_norm = kp_driving
-            elif mode == "relative":
-                kp_norm = relative_kp(
-                    kp_source=kp_source,
-                    kp_driving=kp_driving,
-                    kp_driving_initial=kp_driving_initial,
-                )
-            elif mode == "avd":
-                kp_norm = avd_network(kp_source, kp_driving)
-            dense_motion = dense_motion_network(
-                source_image=source,
-                kp_driving=kp_norm,
-                kp_source=kp_source,
-                bg_param=None,
-                dropout_flag=False,
+        kp_driving = kp_detector(driving)
+        if kp_driving_initial is None:
+            kp_driving_initial = {k: v[:1] for k, v in kp_driving.items()}
+
+        bs = driving.shape[0]
+        batch_source = source.repeat(bs, 1, 1, 1)
+        batch_kp_source = {k: v.repeat(bs, 1, 1) for k, v in kp_source.items()}
+        if mode == "standard":
+            kp_norm = kp_driving
+        elif mode == "relative":
+            kp_norm = relative_kp(
+                kp_source=batch_kp_source,
+                kp_driving=kp_driving,
+                kp_driving_initial=kp_driving_initial,
             )
-            out = inpainting_network(source, dense_motion)
+        elif mode == "avd":
+            kp_norm = avd_network(batch_kp_source, kp_driving)
+        dense_motion = dense_motion_network(
+            source_image=batch_source,
+            kp_driving=kp_norm,
+            kp_source=batch_kp_source,
+            bg_param=None,
+            dropout_flag=False,
+        )
+        with torch.autocast("cuda", dtype=torch.float16, enabled=use_autocast):
+            out = inpainting_network(batch_source, dense_motion)
 
-            predictions.append(
-                np.transpose(out["prediction"].data.cpu().numpy(), [0, 2, 3, 1])[0]
-            )
-    return predictions
+        return np.transpose(out["prediction"].float().data.cpu().numpy(), [0, 2, 3, 1])
+
+    def run(frames):
+        nonlocal batch_size
+        try:
+            return animate(frames)
+        except torch.cuda.OutOfMemoryError:
+            if len(frames) == 1:
+                raise
+            torch.cuda.empty_cache()
+            half = len(frames) // 2
+            batch_size = min(batch_size, half)
+            return np.concatenate([run(frames[:half]), run(frames[half:])])
+
+    frames = []
+    for frame in tqdm(driving_frames):
+        frames.append(frame)
+        if len(frames) >= batch_size:
+            yield from run(frames)
+            frames = []
+    if frames:
+        yield from run(frames)
 
 
 def find_best_frame(source, driving, cpu):
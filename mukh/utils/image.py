@@ -0,0 +1,64 @@
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# cv2.imread flags decoding JPEGs at 1/factor scale via libjpeg's scaled IDCT
+_REDUCED_READ_FLAGS = {
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+}
+_EXIF_ORIENTATION = 0x0112
+
+
+def read_reduced_image(
+    image_path: str, min_input_size: Optional[int]
+) -> Tuple[Optional[np.ndarray], Optional[Tuple[float, float]]]:
+    """
+    Decode a large JPEG at the smallest scale that keeps its short side >= min_input_size.
+
+    libjpeg can decode at 1/2, 1/4 or 1/8 scale for little more than the cost of
+    reading the file, which is much cheaper than decoding at full size only for a
+    model to downsample the image again.
+
+    Args:
+        image_path: Path to the image file.
+        min_input_size: Smallest image side the model needs, or None.
+
+    Returns:
+        Tuple of the image in BGR format and the (x, y) factors mapping its
+        coordinates back to the full size image, or (None, None) if the image
+        should be decoded at full size instead.
+    """
+    if not min_input_size or not image_path.lower().endswith((".jpg", ".jpeg")):
+        return None, None
+
+    try:
+        # Only the header is read here
+        with Image.open(image_path) as header:
+            width, height = header.size
+            # cv2.imread applies the EXIF orientation, and orientations 5-8
+            # rotate by 90 degrees, swapping width and height
+            if header.getexif().get(_EXIF_ORIENTATION, 1) in (5, 6, 7, 8):
+                width, height = height, width
+    except Exception:
+        return None, None
+
+    factor = next(
+        (
+            factor
+            for factor in _REDUCED_READ_FLAGS
+            if min(width, height) // factor >= min_input_size
+        ),
+        1,
+    )
+    if factor == 1:
+        return None, None
+
+    image = cv2.imread(image_path, _REDUCED_READ_FLAGS[factor])
+    if image is None:
+        return None, None
+
+    return image, (width / image.shape[1], height / image.shape[0])
@@ -9,6 +9,9 @@ def json_to_csv(json_data: list[dict], csv_path: str) -> None:
         json_data: List of face detections in JSON format.
         csv_path: Path to save the CSV file.
 
+    Raises:
+        ValueError: If a row has keys that are not in the first row.
+
     Example:
         json_data = [
             {
@@ -25,8 +28,21 @@ def json_to_csv(json_data: list[dict], csv_path: str) -> None:
     if not json_data:
         return
 
-    keys = json_data[0].keys()
-    with open(csv_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=keys)
-        writer.writeheader()
-        writer.writerows(json_data)
+    keys = list(json_data[0].keys())
+    key_set = frozenset(keys)
+
+    def values(row: dict) -> tuple:
+        # Like DictWriter, fill missing keys but reject keys not in the header
+        if row.keys() != key_set:
+            unknown = row.keys() - key_set
+            if unknown:
+                raise ValueError(
+                    f"dict contains fields not in fieldnames: {sorted(unknown)}"
+                )
+        return tuple(row.get(key, "") for key in keys)
+
+    # A plain writer fed value tuples avoids DictWriter's per-row dict building
+    with open(csv_path, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(keys)
+        writer.writerows(map(values, json_data))